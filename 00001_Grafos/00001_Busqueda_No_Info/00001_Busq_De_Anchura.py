@@ -2,13 +2,40 @@
 # similar a una lista pero optimizada para añadir y eliminar elementos eficientemente de ambos extremos.
 # Es ideal para implementar colas (FIFO - First In, First Out).
 from collections import deque  # Estructura eficiente para manejar la cola
+# Importa numpy para la versión por niveles, que expande toda una frontera a la vez con operaciones vectorizadas.
+import numpy as np  # Operaciones vectorizadas sobre la frontera completa
+# Importa time para medir la duración de cada fase en las estadísticas.
+import time  # Reloj monotónico (perf_counter)
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import agotar, cargar_modulo, registrar  # Búsqueda por pasos, archivos numerados, estadísticas
 
 # Define la función principal que implementa el algoritmo de Búsqueda en Anchura.
 # Recibe tres argumentos:
 # - grafo: Un diccionario que representa el grafo (clave: nodo, valor: lista de vecinos).
 # - inicio: El nodo desde el cual comenzar la búsqueda.
 # - objetivo: El nodo que se desea encontrar.
-def busqueda_anchura(grafo, inicio, objetivo):
+# - estadisticas: Diccionario opcional donde se guardan, al terminar, los contadores de la búsqueda (expandidos,
+#                 generados, duplicados descartados, inserciones en la frontera, pico de la frontera) y el tiempo
+#                 de cada fase (ver registrar en busqueda_comun.py).
+def busqueda_anchura(grafo, inicio, objetivo, estadisticas=None):
+    return agotar(busqueda_anchura_pasos(grafo, inicio, objetivo, estadisticas, informar=False))
+
+# Define la búsqueda en anchura por pasos (generador; ver 00012_Busqueda_Por_Pasos.py). Es la implementación de
+# busqueda_anchura. Aquí 'mejor_f' es la profundidad del último nodo expandido.
+def busqueda_anchura_pasos(grafo, inicio, objetivo, estadisticas=None, informar=True):
+    # Contadores para 'estadisticas' (se vuelcan solo al terminar). Sin 'estadisticas' no se toman tiempos ni se
+    # cuenta nada más que las expansiones; con él, los generados se suman una vez por expansión (no por vecino) y
+    # las inserciones salen al final del tamaño de 'visitados'.
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    expandidos = generados = 0
+    pico_frontera = 1
+
     # Inicializa la cola con el nodo de inicio. La cola almacena los nodos a visitar.
     # Usamos deque para operaciones eficientes de 'popleft'.
     cola = deque([inicio])  # Cola FIFO con el nodo inicial
@@ -18,6 +45,10 @@ def busqueda_anchura(grafo, inicio, objetivo):
     # El nodo inicial se marca como visitado y su padre es None (no llegamos a él desde otro nodo en la búsqueda).
     visitados = {inicio: None}  # Almacena nodos visitados y sus padres
 
+    # Profundidad del nodo que se expande (solo para el progreso). La cola tiene todos los nodos de un nivel antes
+    # que los del siguiente, así que basta contar cuántos quedan por expandir del nivel actual.
+    profundidad, quedan = 0, 1
+
     # Inicia el bucle principal del algoritmo. Continúa mientras haya nodos en la cola por visitar.
     while cola:
         # Saca el primer nodo de la cola. Esta es la característica FIFO de la búsqueda en anchura.
@@ -25,6 +56,7 @@ def busqueda_anchura(grafo, inicio, objetivo):
 
         # Comprueba si el nodo actual es el objetivo que estamos buscando.
         if actual == objetivo:  # Si encontramos el objetivo, reconstruimos el camino
+            t_objetivo = time.perf_counter() if contar else None  # Fin de la fase de búsqueda
             # Si el nodo actual es el objetivo, hemos encontrado el camino más corto desde el inicio (en número de aristas).
             # Inicializamos una lista vacía para almacenar el camino.
             camino = []
@@ -36,23 +68,278 @@ def busqueda_anchura(grafo, inicio, objetivo):
                 # Se mueve al nodo padre del nodo actual usando el diccionario 'visitados'.
                 actual = visitados[actual]
             # Retorna el camino invertido (para que vaya de inicio a objetivo) usando slicing [::-1].
-            return camino[::-1]  # Se invierte para ir de inicio a objetivo
+            camino = camino[::-1]  # Se invierte para ir de inicio a objetivo
+            inserciones = len(visitados) - 1  # Cada inserción en la cola es un nodo nuevo en 'visitados'
+            registrar(estadisticas, t0, t_objetivo, expandidos=expandidos, generados=generados,
+                      duplicados=generados - inserciones, inserciones=inserciones, pico_frontera=pico_frontera)
+            return camino
 
         # Si el nodo actual no es el objetivo, exploramos sus vecinos.
         # Itera sobre cada vecino del nodo 'actual' según la definición del 'grafo'.
-        for vecino in grafo[actual]:  # Exploramos vecinos no visitados
-            # Comprueba si el vecino actual ya ha sido visitado.
+        expandidos += 1
+        vecinos = grafo[actual]
+        for vecino in vecinos:  # Exploramos vecinos no visitados
+            # Comprueba si el vecino actual ya ha sido visitado (si lo fue, se descarta).
             if vecino not in visitados:
                 # Si el vecino no ha sido visitado:
                 # Lo añade al final de la cola para ser visitado posteriormente.
                 cola.append(vecino)
                 # Lo marca como visitado y registra que llegamos a él desde el nodo 'actual'.
                 visitados[vecino] = actual
+        if contar:
+            generados += len(vecinos)
+            if len(cola) > pico_frontera:
+                pico_frontera = len(cola)
+        if informar:
+            yield {'expandidos': expandidos, 'frontera': len(cola), 'mejor_f': profundidad}
+            quedan -= 1
+            if quedan == 0:  # Se expandió el último nodo del nivel: la cola tiene exactamente el siguiente
+                profundidad, quedan = profundidad + 1, len(cola)
 
     # Si el bucle 'while cola:' termina y no se ha encontrado el objetivo (nunca se ejecutó el 'return camino[::-1]'),
     # significa que el objetivo no es alcanzable desde el nodo de inicio.
+    inserciones = len(visitados) - 1
+    registrar(estadisticas, t0, None, expandidos=expandidos, generados=generados, duplicados=generados - inserciones,
+              inserciones=inserciones, pico_frontera=pico_frontera)
     return None  # Si no se encuentra el objetivo
 
+# Las versiones por niveles y por lotes trabajan sobre un GrafoCSR (ver 00008_Grafo_CSR.py): sus arreglos indptr e
+# indices y su correspondencia etiqueta <-> id. Un GrafoCSR se usa tal cual; un diccionario {nodo: [vecinos]} se
+# convierte en el momento con GrafoCSR.desde_diccionario (conviene convertirlo una sola vez y reutilizarlo).
+def _grafo_csr(grafo):
+    if hasattr(grafo, 'indptr'):
+        return grafo
+    return cargar_modulo('00001_Busqueda_No_Info/00008_Grafo_CSR.py').GrafoCSR.desde_diccionario(grafo)
+
+# Define la Búsqueda en Anchura por niveles (level-synchronous BFS).
+# En lugar de sacar un nodo a la vez de la cola, expande TODO el nivel actual (la frontera) de una sola vez con numpy:
+# 1. Recoge los vecinos de todos los nodos de la frontera con un único "gather" sobre los arreglos CSR.
+# 2. Descarta los ya visitados con una máscara booleana de visitados (un byte por nodo).
+# 3. Se queda con la primera aparición de cada vecino nuevo, que es exactamente el padre que le asignaría la cola FIFO,
+#    y ordena la nueva frontera en ese mismo orden. Por eso los caminos coinciden con los de busqueda_anchura.
+# Recibe:
+# - grafo: Un diccionario {nodo: [vecinos]} o un GrafoCSR.
+# - inicio: El nodo desde el cual comenzar la búsqueda.
+# - objetivo: Nodo opcional. Si se indica, la búsqueda se detiene al terminar el nivel donde aparece.
+#             Si es None, se recorre todo lo alcanzable (útil para trabajos de alcanzabilidad sobre el grafo completo).
+# Retorna (distancias, padres, etiquetas):
+# - distancias[i]: número de aristas desde el inicio hasta el nodo con id i (-1 si no se alcanzó).
+# - padres[i]: id del padre del nodo i en el árbol BFS (-1 para el inicio y los nodos no alcanzados).
+# - etiquetas[i]: etiqueta original del nodo con id i (range(n) si el GrafoCSR usa los ids como etiquetas).
+def bfs_por_niveles(grafo, inicio, objetivo=None):
+    csr = _grafo_csr(grafo)
+    # Ids de los objetivos: ninguno si no hay objetivo (recorrido completo).
+    objetivos = [csr.indice(objetivo)] if objetivo in csr else []
+    distancias, padres = _expandir_niveles(csr.indptr, csr.indices, csr.indice(inicio), objetivos)
+    return distancias, padres, range(len(csr)) if csr.etiquetas is None else csr.etiquetas
+
+# Núcleo vectorizado de bfs_por_niveles. Trabaja solo con ids: 's' es el inicio y 'objetivos' una lista de ids.
+# Se detiene cuando todos los objetivos han sido alcanzados (o recorre todo si la lista está vacía).
+def _expandir_niveles(indptr, indices, s, objetivos):
+    n = len(indptr) - 1
+    objetivos = np.asarray(objetivos, dtype=np.int64)
+    # Arreglos de resultado y máscara de visitados.
+    distancias = np.full(n, -1, dtype=np.int64)
+    padres = np.full(n, -1, dtype=np.int64)
+    visitados = np.zeros(n, dtype=bool)
+    visitados[s] = True
+    distancias[s] = 0
+
+    # La frontera es un arreglo con los ids del nivel actual, en el orden en que los tendría la cola FIFO.
+    frontera = np.array([s], dtype=np.int64)
+    nivel = 0
+    # Continúa mientras haya frontera y queden objetivos (si los hay) por alcanzar.
+    while frontera.size and not (objetivos.size and visitados[objetivos].all()):
+        # --- Gather CSR: vecinos de toda la frontera ---
+        inicios = indptr[frontera]
+        grados = indptr[frontera + 1] - inicios
+        total = int(grados.sum())
+        if total == 0:
+            break
+        # Para cada arista, su posición en 'indices' = inicio del bloque de su nodo + desplazamiento dentro del bloque.
+        desplazamientos = np.arange(total) - np.repeat(np.cumsum(grados) - grados, grados)
+        vecinos = indices[np.repeat(inicios, grados) + desplazamientos]
+        # Nodo de la frontera desde el que sale cada arista (el posible padre).
+        origenes = np.repeat(frontera, grados)
+
+        # --- Filtro con la máscara de visitados ---
+        nuevos = ~visitados[vecinos]
+        vecinos, origenes = vecinos[nuevos], origenes[nuevos]
+
+        # --- Primera aparición de cada vecino nuevo ---
+        # np.unique devuelve el índice de la primera aparición; ordenarlos reproduce el orden de la cola FIFO.
+        _, primeras = np.unique(vecinos, return_index=True)
+        primeras.sort()
+        frontera = vecinos[primeras]
+
+        # Marca la nueva frontera y registra padres y distancias de todo el nivel a la vez.
+        nivel += 1
+        visitados[frontera] = True
+        padres[frontera] = origenes[primeras]
+        distancias[frontera] = nivel
+
+    return distancias, padres
+
+# Versión de busqueda_anchura que usa bfs_por_niveles. Retorna el mismo camino (lista de nodos) o None.
+def busqueda_anchura_por_niveles(grafo, inicio, objetivo):
+    csr = _grafo_csr(grafo)
+    # Si el objetivo no existe en el grafo, no hay camino.
+    if objetivo not in csr:
+        return None
+    t = csr.indice(objetivo)
+    distancias, padres = _expandir_niveles(csr.indptr, csr.indices, csr.indice(inicio), [t])
+    # Si el objetivo no fue alcanzado, no hay camino.
+    if distancias[t] < 0:
+        return None
+    # El camino (lista de etiquetas) sale de seguir los padres desde 't' hasta el inicio.
+    return csr._camino(padres, t)
+
+# --- Consultas por lotes ---
+# Responde muchas consultas (inicio, objetivo) sobre el mismo grafo compartiendo el trabajo.
+# Las consultas se agrupan por nodo de inicio: una sola búsqueda por niveles desde cada inicio responde
+# todos los objetivos de ese inicio, y se detiene en cuanto el último de ellos ha sido alcanzado.
+# Así el costo crece con el número de inicios distintos, no con el número de consultas.
+# Recibe:
+# - grafo: Un diccionario {nodo: [vecinos]} o un GrafoCSR (se convierte una sola vez para todo el lote).
+# - consultas: Lista de tuplas (inicio, objetivo).
+# Retorna una lista con el resultado de cada consulta en el mismo orden: el mismo camino que daría
+# busqueda_anchura (o busqueda_grafo con estrategia 'bfs'), o None si no hay camino.
+def busqueda_anchura_lotes(grafo, consultas):
+    csr = _grafo_csr(grafo)
+    resultados = [None] * len(consultas)
+
+    # Agrupa las posiciones de las consultas por nodo de inicio: {inicio: [posición, ...]}.
+    por_inicio = {}
+    for posicion, (inicio, objetivo) in enumerate(consultas):
+        if inicio in csr and objetivo in csr:
+            por_inicio.setdefault(inicio, []).append(posicion)
+
+    # Una búsqueda por cada inicio distinto, con todos sus objetivos a la vez.
+    for inicio, posiciones in por_inicio.items():
+        objetivos = [csr.indice(consultas[p][1]) for p in posiciones]
+        distancias, padres = _expandir_niveles(csr.indptr, csr.indices, csr.indice(inicio), objetivos)
+        for p, t in zip(posiciones, objetivos):
+            if distancias[t] >= 0:
+                resultados[p] = csr._camino(padres, t)
+    return resultados
+
+# Número de fuentes que se procesan juntas: una por cada bit de una palabra de 64 bits.
+BITS_POR_PALABRA = 64
+
+# --- BFS multifuente paralela por bits ---
+# Calcula la distancia (número de aristas) de muchas consultas a la vez cuando lo que importa es la distancia
+# y no el camino. Cada nodo guarda una palabra de 64 bits: el bit j indica que la fuente j ya alcanzó ese nodo.
+# Un solo recorrido por niveles avanza las 64 fuentes a la vez: la frontera de cada nodo se propaga a sus vecinos
+# con un OR de bits, y los bits que ya estaban vistos se descartan con un AND.
+# Recibe:
+# - grafo: Un diccionario {nodo: [vecinos]} o un GrafoCSR.
+# - consultas: Lista de tuplas (inicio, objetivo).
+# Retorna una lista con la distancia de cada consulta (-1 si el objetivo no es alcanzable).
+def distancias_lotes_bits(grafo, consultas):
+    csr = _grafo_csr(grafo)
+    indptr, indices = csr.indptr, csr.indices
+    n = len(csr)
+    distancias = np.full(len(consultas), -1, dtype=np.int64)
+
+    # Consultas válidas como arreglos de ids.
+    validas = [p for p, (inicio, objetivo) in enumerate(consultas) if inicio in csr and objetivo in csr]
+    q_pos = np.array(validas, dtype=np.int64)
+    q_ini = np.array([csr.indice(consultas[p][0]) for p in validas], dtype=np.int64)
+    q_obj = np.array([csr.indice(consultas[p][1]) for p in validas], dtype=np.int64)
+
+    # Las fuentes distintas se reparten en grupos de 64, uno por palabra.
+    fuentes = np.unique(q_ini)
+    for desde in range(0, len(fuentes), BITS_POR_PALABRA):
+        grupo = fuentes[desde:desde + BITS_POR_PALABRA]
+        # Consultas de este grupo y el bit de su fuente (posición de la fuente dentro del grupo).
+        en_grupo = np.isin(q_ini, grupo)
+        pos, obj = q_pos[en_grupo], q_obj[en_grupo]
+        bit = np.left_shift(np.uint64(1), np.searchsorted(grupo, q_ini[en_grupo]).astype(np.uint64))
+
+        # 'vistos' acumula qué fuentes alcanzaron cada nodo; 'frontera' solo las del último nivel.
+        vistos = np.zeros(n, dtype=np.uint64)
+        bits_fuente = np.left_shift(np.uint64(1), np.arange(len(grupo), dtype=np.uint64))
+        np.bitwise_or.at(vistos, grupo, bits_fuente)
+        frontera = vistos.copy()
+
+        # Las consultas con inicio == objetivo tienen distancia 0.
+        distancias[pos[(vistos[obj] & bit) != 0]] = 0
+        pendientes = distancias[pos] < 0
+        nivel = 0
+        while pendientes.any():
+            activos = np.flatnonzero(frontera)
+            if activos.size == 0:
+                break
+            # Gather CSR de los vecinos de todos los nodos activos (igual que en _expandir_niveles).
+            inicios = indptr[activos]
+            grados = indptr[activos + 1] - inicios
+            total = int(grados.sum())
+            if total == 0:
+                break
+            desplazamientos = np.arange(total) - np.repeat(np.cumsum(grados) - grados, grados)
+            vecinos = indices[np.repeat(inicios, grados) + desplazamientos]
+            # Cada arista lleva al vecino todos los bits de frontera de su origen.
+            siguiente = np.zeros(n, dtype=np.uint64)
+            np.bitwise_or.at(siguiente, vecinos, np.repeat(frontera[activos], grados))
+            # Solo quedan los bits que el vecino no había visto antes.
+            siguiente &= ~vistos
+            vistos |= siguiente
+            frontera = siguiente
+            nivel += 1
+
+            # Las consultas pendientes cuyo objetivo recibió el bit de su fuente se resuelven en este nivel.
+            alcanzadas = pendientes & ((siguiente[obj] & bit) != 0)
+            distancias[pos[alcanzadas]] = nivel
+            pendientes &= ~alcanzadas
+
+    return distancias.tolist()
+
+# Define la búsqueda en anchura sobre un problema implícito (protocolo de 00009_Problema_Implicito.py).
+# Igual que busqueda_anchura, pero los vecinos salen de problema.sucesores(estado) (los costos se ignoran), la meta
+# se reconoce con problema.es_objetivo y la tabla de visitados se indexa por problema.clave(estado).
+# La tabla guarda clave -> (clave del padre, estado), así que la memoria crece con los estados generados.
+# Retorna la lista de estados desde el inicial hasta una meta, o None si se agotan los estados alcanzables.
+# 'estadisticas' recibe los mismos contadores que en busqueda_anchura. Solo si se pide, los sucesores de cada
+# estado se guardan en una lista para contarlos.
+def busqueda_anchura_problema(problema, estadisticas=None):
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    expandidos = generados = 0
+    pico_frontera = 1
+    inicial = problema.estado_inicial
+    clave_inicial = problema.clave(inicial)
+    cola = deque([(clave_inicial, inicial)])
+    visitados = {clave_inicial: (None, inicial)}
+    while cola:
+        clave, actual = cola.popleft()
+        if problema.es_objetivo(actual):
+            t_objetivo = time.perf_counter() if contar else None
+            camino = []
+            while clave is not None:
+                clave, estado = visitados[clave]
+                camino.append(estado)
+            inserciones = len(visitados) - 1
+            registrar(estadisticas, t0, t_objetivo, expandidos=expandidos, generados=generados,
+                      duplicados=generados - inserciones, inserciones=inserciones, pico_frontera=pico_frontera)
+            return camino[::-1]
+        sucesores = problema.sucesores(actual)
+        if contar:
+            sucesores = list(sucesores)
+        for vecino, _ in sucesores:
+            clave_vecino = problema.clave(vecino)
+            if clave_vecino not in visitados:
+                cola.append((clave_vecino, vecino))
+                visitados[clave_vecino] = (clave, vecino)
+        if contar:
+            expandidos += 1
+            generados += len(sucesores)
+            if len(cola) > pico_frontera:
+                pico_frontera = len(cola)
+    inserciones = len(visitados) - 1
+    registrar(estadisticas, t0, None, expandidos=expandidos, generados=generados, duplicados=generados - inserciones,
+              inserciones=inserciones, pico_frontera=pico_frontera)
+    return None
+
 # Este bloque de código solo se ejecuta cuando el script se corre directamente (no cuando es importado como módulo).
 # Es una práctica común para incluir ejemplos de uso o pruebas.
 if __name__ == "__main__":
@@ -82,4 +369,25 @@ if __name__ == "__main__":
         print("Camino encontrado:", " -> ".join(camino))
     else:
         # Si 'camino' es None (no se encontró el objetivo), imprime un mensaje indicándolo.
-        print("Camino no encontrado")
\ No newline at end of file
+        print("Camino no encontrado")
+
+    # Estadísticas de la búsqueda: contadores y tiempos en un diccionario de números, exportable a JSON.
+    import json
+    estadisticas = {}
+    busqueda_anchura(grafo, inicio, objetivo, estadisticas=estadisticas)
+    print("Estadísticas:", json.dumps(estadisticas))
+
+    # Versión por niveles: el mismo camino, más las distancias de todos los nodos alcanzables.
+    print("Camino por niveles:", busqueda_anchura_por_niveles(grafo, inicio, objetivo))
+    distancias, padres, etiquetas = bfs_por_niveles(grafo, inicio)
+    print("Distancias desde A:", {etiquetas[i]: int(d) for i, d in enumerate(distancias)})
+
+    # Consultas por lotes: dos inicios distintos, así que solo se hacen dos búsquedas.
+    consultas = [('A', 'F'), ('A', 'D'), ('D', 'C'), ('A', 'A')]
+    print("Caminos por lotes:", busqueda_anchura_lotes(grafo, consultas))
+    print("Distancias por bits:", distancias_lotes_bits(grafo, consultas))
+
+    # Jarras de 4 y 3 litros para medir exactamente 2 (Jarras de 00009_Problema_Implicito.py). Los estados se generan
+    # a medida que la búsqueda los pide; la anchura da la secuencia con menos acciones.
+    implicito = cargar_modulo('00001_Busqueda_No_Info/00009_Problema_Implicito.py')
+    print("Jarras (anchura):", busqueda_anchura_problema(implicito.Jarras(4, 3, 2)))
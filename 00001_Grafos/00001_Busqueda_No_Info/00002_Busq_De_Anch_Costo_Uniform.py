@@ -1,4 +1,132 @@
 import heapq  # Importa la librería 'heapq', que proporciona una implementación del algoritmo de cola de prioridad (heap).
+from collections import OrderedDict  # Diccionario que recuerda el orden de uso, para la caché LRU de árboles
+# Importa time para medir la duración de cada fase en las estadísticas.
+import time  # Reloj monotónico (perf_counter)
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import agotar, cargar_modulo, registrar  # Búsqueda por pasos, archivos numerados, estadísticas
+
+# --- Fronteras intercambiables para la Búsqueda de Costo Uniforme ---
+# Todas ofrecen la misma interfaz:
+# - insertar(prioridad, nodo): añade el nodo (o mejora su prioridad si ya estaba).
+# - extraer(): saca y retorna la tupla (prioridad, nodo) con menor prioridad.
+# - len(frontera): número de entradas guardadas.
+
+# Frontera basada en heapq (la de siempre). No puede mejorar la prioridad de un nodo ya insertado,
+# así que deja entradas obsoletas en el heap; la búsqueda las descarta al extraerlas.
+# Acepta costos de cualquier tipo (enteros o flotantes).
+class ColaHeap:
+    def __init__(self):
+        self.heap = []  # Lista usada como min-heap de tuplas (prioridad, nodo)
+
+    def insertar(self, prioridad, nodo):
+        heapq.heappush(self.heap, (prioridad, nodo))
+
+    def extraer(self):
+        return heapq.heappop(self.heap)
+
+    def __len__(self):
+        return len(self.heap)
+
+# Cola de cubetas de Dial. Sirve cuando los costos de las aristas son enteros pequeños entre 0 y 'max_costo'.
+# Como la búsqueda extrae prioridades que nunca decrecen y cada nueva prioridad es como mucho
+# (prioridad actual + max_costo), bastan max_costo + 1 cubetas usadas de forma circular.
+# Insertar y extraer cuestan O(1) amortizado. Si un nodo mejora su prioridad se mueve de cubeta en lugar
+# de duplicarse, así que la frontera nunca guarda más de una entrada por nodo.
+# Una prioridad fuera de [actual, actual + max_costo] caería en la cubeta de otra prioridad y daría un resultado
+# erróneo sin avisar, así que insertar lanza ValueError en ese caso (arista más cara que max_costo o costo negativo)
+# y también con prioridades no enteras.
+class ColaDial:
+    def __init__(self, max_costo):
+        self.max_costo = max_costo
+        self.cubetas = [{} for _ in range(max_costo + 1)]  # Cada cubeta: diccionario {nodo: None} (orden FIFO)
+        self.prioridades = {}  # Prioridad actual de cada nodo en la frontera
+        self.actual = 0  # Prioridad de la cubeta que se está vaciando
+
+    def insertar(self, prioridad, nodo):
+        if not isinstance(prioridad, int):
+            raise ValueError(f"ColaDial necesita prioridades enteras: {prioridad!r}")
+        if not self.actual <= prioridad <= self.actual + self.max_costo:
+            raise ValueError(f"Prioridad {prioridad} fuera del rango de las cubetas "
+                             f"[{self.actual}, {self.actual + self.max_costo}]: ¿una arista cuesta más que max_costo?")
+        # Si el nodo ya estaba en la frontera, se quita de su cubeta anterior.
+        if nodo in self.prioridades:
+            del self.cubetas[self.prioridades[nodo] % len(self.cubetas)][nodo]
+        self.prioridades[nodo] = prioridad
+        self.cubetas[prioridad % len(self.cubetas)][nodo] = None
+
+    def extraer(self):
+        if not self.prioridades:
+            raise IndexError("extraer de una frontera vacía")
+        # Avanza circularmente hasta la primera cubeta con nodos.
+        while not self.cubetas[self.actual % len(self.cubetas)]:
+            self.actual += 1
+        cubeta = self.cubetas[self.actual % len(self.cubetas)]
+        # Saca el nodo más antiguo de la cubeta.
+        nodo = next(iter(cubeta))
+        del cubeta[nodo]
+        return self.prioridades.pop(nodo), nodo
+
+    def __len__(self):
+        return len(self.prioridades)
+
+# Montículo radix (radix heap) para prioridades enteras monótonas (nunca se inserta algo menor que lo último extraído).
+# La cubeta i guarda las prioridades cuya diferencia en bits con la última extraída empieza en el bit i
+# (es decir, bit_length(prioridad XOR ultima) == i). Al vaciarse la cubeta 0 se toma la primera cubeta no vacía,
+# se fija su mínimo como nueva 'ultima' y sus nodos se reparten en cubetas más bajas.
+# Cada nodo solo puede bajar de cubeta, así que el costo amortizado es O(log C) por operación y no depende
+# del número de nodos. Igual que ColaDial, guarda una sola entrada por nodo.
+# Una prioridad menor que 'ultima' (costo negativo) o no entera rompería el reparto en cubetas sin avisar, así que
+# insertar lanza ValueError en esos casos, igual que ColaDial.
+class MonticuloRadix:
+    def __init__(self):
+        self.cubetas = [{}]  # Cada cubeta: diccionario {nodo: prioridad}
+        self.cubeta_de = {}  # Cubeta en la que está cada nodo
+        self.ultima = 0  # Última prioridad extraída
+
+    # Índice de la cubeta que corresponde a una prioridad.
+    def _cubeta(self, prioridad):
+        i = (prioridad ^ self.ultima).bit_length()
+        # Crea las cubetas que falten (una por cada bit de las prioridades vistas).
+        while len(self.cubetas) <= i:
+            self.cubetas.append({})
+        return i
+
+    def insertar(self, prioridad, nodo):
+        if not isinstance(prioridad, int):
+            raise ValueError(f"MonticuloRadix necesita prioridades enteras: {prioridad!r}")
+        if prioridad < self.ultima:
+            raise ValueError(f"Prioridad {prioridad} menor que la última extraída ({self.ultima}): ¿un costo negativo?")
+        if nodo in self.cubeta_de:
+            del self.cubetas[self.cubeta_de[nodo]][nodo]
+        i = self._cubeta(prioridad)
+        self.cubetas[i][nodo] = prioridad
+        self.cubeta_de[nodo] = i
+
+    def extraer(self):
+        if not self.cubeta_de:
+            raise IndexError("extraer de una frontera vacía")
+        if not self.cubetas[0]:
+            # Primera cubeta no vacía: su mínimo pasa a ser 'ultima' y sus nodos se redistribuyen.
+            i = next(i for i, cubeta in enumerate(self.cubetas) if cubeta)
+            cubeta, self.cubetas[i] = self.cubetas[i], {}
+            self.ultima = min(cubeta.values())
+            for nodo, prioridad in cubeta.items():
+                j = self._cubeta(prioridad)
+                self.cubetas[j][nodo] = prioridad
+                self.cubeta_de[nodo] = j
+        # Todos los nodos de la cubeta 0 tienen prioridad igual a 'ultima'.
+        nodo = next(iter(self.cubetas[0]))
+        del self.cubetas[0][nodo]
+        del self.cubeta_de[nodo]
+        return self.ultima, nodo
+
+    def __len__(self):
+        return len(self.cubeta_de)
 
 # Define la función principal que implementa el algoritmo de Búsqueda de Costo Uniforme.
 # Recibe tres argumentos:
@@ -6,14 +134,30 @@ import heapq  # Importa la librería 'heapq', que proporciona una implementació
 #          Los valores son listas de tuplas (vecino, costo_del_paso).
 # - inicio: El nodo desde el cual comenzar la búsqueda.
 # - objetivo: El nodo que se desea encontrar.
-def busqueda_costo_uniforme(grafo, inicio, objetivo):
+# - frontera: Cola de prioridad a usar (ColaHeap, ColaDial o MonticuloRadix). Por defecto ColaHeap.
+#             ColaDial y MonticuloRadix requieren costos enteros no negativos.
+# - estadisticas: Diccionario opcional donde se guardan, al terminar, los contadores de la búsqueda (expandidos,
+#                 generados, duplicados descartados, entradas obsoletas saltadas, inserciones en la frontera, pico de la frontera) y el tiempo
+#                 de cada fase (ver registrar en busqueda_comun.py).
+def busqueda_costo_uniforme(grafo, inicio, objetivo, frontera=None, estadisticas=None):
+    return agotar(busqueda_costo_uniforme_pasos(grafo, inicio, objetivo, frontera, estadisticas, informar=False))
+
+# Define la búsqueda de costo uniforme por pasos (generador; ver 00012_Busqueda_Por_Pasos.py). Es la implementación
+# de busqueda_costo_uniforme. Aquí 'mejor_f' es el costo acumulado del último nodo expandido (nunca decrece).
+def busqueda_costo_uniforme_pasos(grafo, inicio, objetivo, frontera=None, estadisticas=None, informar=True):
+    # Contadores para 'estadisticas' (se vuelcan solo al terminar). Sin 'estadisticas' no se toman tiempos; con él,
+    # los generados se suman una vez por expansión y los duplicados salen de restarles las inserciones.
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    expandidos = generados = obsoletos = inserciones = 0
+    pico_frontera = 1
+
     # Inicializa la cola de prioridad. En UCS, esta cola almacena tuplas (costo_acumulado, nodo).
-    # heapq siempre mantiene el elemento con el menor costo (el primer elemento de la tupla) en la parte superior.
-    cola = []  # Cola de prioridad: (costo acumulado, nodo)
+    # La frontera siempre entrega primero el elemento con el menor costo acumulado.
+    cola = ColaHeap() if frontera is None else frontera  # Cola de prioridad: (costo acumulado, nodo)
 
     # Añade el nodo inicial a la cola de prioridad. El costo acumulado al inicio es 0.
-    # heapq.heappush(cola, item) inserta un item en el heap (la lista 'cola').
-    heapq.heappush(cola, (0, inicio))
+    cola.insertar(0, inicio)
 
     # Inicializa un diccionario para rastrear los nodos visitados y la información relevante para reconstruir el camino y comparar costos.
     # La clave es el nodo visitado. El valor es una tupla (predecesor, costo_acumulado_para_llegar_a_este_nodo).
@@ -23,17 +167,24 @@ def busqueda_costo_uniforme(grafo, inicio, objetivo):
     # Inicia el bucle principal del algoritmo. Continúa mientras haya nodos en la cola de prioridad.
     while cola:
         # Extrae el nodo con el menor costo acumulado de la cola de prioridad.
-        # heapq.heappop(cola) extrae y devuelve el elemento más pequeño del heap (en este caso, la tupla con el menor primer elemento).
-        costo, actual = heapq.heappop(cola)  # Extrae nodo con menor costo
+        # cola.extraer() devuelve la tupla (costo, nodo) con el menor costo acumulado.
+        costo, actual = cola.extraer()  # Extrae nodo con menor costo
+
+        # Descarte perezoso de entradas obsoletas: si ya se encontró un camino más barato a este nodo,
+        # esta entrada quedó vieja en la frontera (ColaHeap no puede actualizarla) y se ignora sin expandirla.
+        if costo > visitados[actual][1]:
+            obsoletos += 1
+            continue
 
         # Comprueba si el nodo actual extraído es el objetivo que estamos buscando.
         if actual == objetivo:
+            t_objetivo = time.perf_counter() if contar else None  # Fin de la fase de búsqueda
             # Si el nodo actual es el objetivo, hemos encontrado el camino de menor costo.
             # Inicializamos una lista vacía para almacenar el camino.
             camino = []
             # Iniciamos un bucle para reconstruir el camino hacia atrás desde el objetivo hasta el inicio
             # usando el diccionario 'visitados'.
-            while actual: # El bucle continúa mientras 'actual' no sea None (llegamos al nodo inicial).
+            while actual is not None: # El bucle continúa mientras 'actual' no sea None (llegamos al nodo inicial).
                 # Añade el nodo actual al principio del camino (o al final temporalmente).
                 camino.append(actual)
                 # Se mueve al nodo padre (predecesor) del nodo actual, que está almacenado como el primer elemento
@@ -41,11 +192,16 @@ def busqueda_costo_uniforme(grafo, inicio, objetivo):
                 actual = visitados[actual][0]
             # Retorna una tupla que contiene el costo total del camino (que es el 'costo' al extraer el objetivo)
             # y el camino invertido (para que vaya de inicio a objetivo) usando slicing [::-1].
+            registrar(estadisticas, t0, t_objetivo, expandidos=expandidos, generados=generados,
+                      duplicados=generados - inserciones, obsoletos=obsoletos, inserciones=inserciones,
+                      pico_frontera=pico_frontera)
             return (costo, camino[::-1])  # Retorna el costo total y el camino de inicio a objetivo
 
         # Si el nodo actual no es el objetivo, exploramos sus vecinos para encontrar nuevos caminos.
         # Itera sobre cada vecino del nodo 'actual' y el costo del paso para llegar a ese vecino, según la definición del 'grafo'.
-        for vecino, paso in grafo[actual]:
+        expandidos += 1
+        vecinos = grafo[actual]
+        for vecino, paso in vecinos:
             # Calcula el nuevo costo acumulado para llegar al vecino a través del nodo actual.
             nuevo_costo = costo + paso
 
@@ -59,13 +215,166 @@ def busqueda_costo_uniforme(grafo, inicio, objetivo):
                 # y el 'nuevo_costo' como su costo acumulado.
                 visitados[vecino] = (actual, nuevo_costo)
                 # Añade el vecino a la cola de prioridad con su 'nuevo_costo' acumulado.
-                # heapq se encargará de mantener la cola ordenada por este costo.
-                heapq.heappush(cola, (nuevo_costo, vecino))
+                # La frontera se encargará de mantener la cola ordenada por este costo.
+                cola.insertar(nuevo_costo, vecino)
+                inserciones += 1
+            # Si no, ya se conocía un camino igual o más barato y el vecino se descarta (un duplicado).
+        if contar:
+            generados += len(vecinos)
+            if len(cola) > pico_frontera:
+                pico_frontera = len(cola)
+        if informar:
+            yield {'expandidos': expandidos, 'frontera': len(cola), 'mejor_f': costo}
 
     # Si el bucle 'while cola:' termina y no se ha encontrado el objetivo (nunca se ejecutó el 'return'),
     # significa que el objetivo no es alcanzable desde el nodo de inicio.
+    registrar(estadisticas, t0, None, expandidos=expandidos, generados=generados, duplicados=generados - inserciones,
+              obsoletos=obsoletos, inserciones=inserciones, pico_frontera=pico_frontera)
     return None  # No se encontró camino
 
+# --- Árbol de caminos mínimos reanudable ---
+# Guarda el estado completo de una búsqueda de costo uniforme desde un inicio: costos, padres, nodos ya
+# cerrados (extraídos) y la frontera. Si una consulta se detuvo al encontrar su objetivo, una consulta posterior
+# a un objetivo más lejano continúa desde la misma frontera en lugar de empezar de nuevo.
+class ArbolCaminos:
+    def __init__(self, grafo, inicio, frontera=None):
+        self.grafo = grafo
+        self.inicio = inicio
+        self.visitados = {inicio: (None, 0)}  # nodo -> (predecesor, costo acumulado), como en busqueda_costo_uniforme
+        self.cerrados = set()  # Nodos cuyo costo ya es definitivo
+        self.cola = ColaHeap() if frontera is None else frontera
+        self.cola.insertar(0, inicio)
+
+    # Continúa la búsqueda hasta cerrar 'objetivo' o agotar la frontera.
+    def extender_hasta(self, objetivo):
+        while objetivo not in self.cerrados and self.cola:
+            costo, actual = self.cola.extraer()
+            # Descarta entradas obsoletas o de nodos ya cerrados.
+            if actual in self.cerrados or costo > self.visitados[actual][1]:
+                continue
+            self.cerrados.add(actual)
+            for vecino, paso in self.grafo[actual]:
+                nuevo_costo = costo + paso
+                if vecino not in self.visitados or nuevo_costo < self.visitados[vecino][1]:
+                    self.visitados[vecino] = (actual, nuevo_costo)
+                    self.cola.insertar(nuevo_costo, vecino)
+
+    # Retorna (costo, camino) hasta 'objetivo', extendiendo la búsqueda si hace falta, o None si no es alcanzable.
+    def camino(self, objetivo):
+        self.extender_hasta(objetivo)
+        if objetivo not in self.cerrados:
+            return None
+        # Reconstruye el camino directamente desde los padres guardados.
+        camino, actual = [], objetivo
+        while actual is not None:
+            camino.append(actual)
+            actual = self.visitados[actual][0]
+        return (self.visitados[objetivo][1], camino[::-1])
+
+    # Número de entradas guardadas (nodos con costo más entradas de la frontera). Es la medida de memoria de la caché.
+    def tamano(self):
+        return len(self.visitados) + len(self.cola)
+
+# --- Caché de árboles de caminos mínimos ---
+# Guarda un ArbolCaminos por cada (versión del grafo, inicio). Cuando se supera 'max_arboles' árboles o
+# 'max_entradas' entradas en total, se descartan los árboles usados hace más tiempo (LRU).
+# La versión del grafo la elige quien llama: al modificar el grafo basta con cambiar la versión para que
+# no se reutilicen árboles calculados sobre el grafo anterior.
+class CacheArboles:
+    def __init__(self, max_arboles=32, max_entradas=1_000_000):
+        self.max_arboles = max_arboles
+        self.max_entradas = max_entradas
+        self.arboles = OrderedDict()  # (versión, inicio) -> ArbolCaminos, del menos al más reciente
+        self.tamanos = {}  # (versión, inicio) -> tamaño del árbol en la última consulta
+        self.entradas = 0  # Suma de los tamaños de todos los árboles
+        self.aciertos = 0  # Consultas que reutilizaron un árbol existente
+        self.fallos = 0  # Consultas que tuvieron que crear un árbol nuevo
+
+    # Retorna (costo, camino) de 'inicio' a 'objetivo' usando (o creando) el árbol correspondiente.
+    def consultar(self, grafo, inicio, objetivo, version=0):
+        clave = (version, inicio)
+        if clave in self.arboles:
+            self.aciertos += 1
+            self.arboles.move_to_end(clave)  # Marca el árbol como el más reciente
+        else:
+            self.fallos += 1
+            self.arboles[clave] = ArbolCaminos(grafo, inicio)
+            self.tamanos[clave] = 0
+        arbol = self.arboles[clave]
+        resultado = arbol.camino(objetivo)
+        # Actualiza el tamaño de este árbol (pudo crecer al extenderse) y aplica los límites.
+        self.entradas += arbol.tamano() - self.tamanos[clave]
+        self.tamanos[clave] = arbol.tamano()
+        self._recortar(clave)
+        return resultado
+
+    # Descarta árboles LRU hasta cumplir los límites. Nunca descarta el árbol recién usado.
+    def _recortar(self, protegido):
+        while len(self.arboles) > 1 and (len(self.arboles) > self.max_arboles or self.entradas > self.max_entradas):
+            clave = next(iter(self.arboles))
+            if clave == protegido:
+                break
+            del self.arboles[clave]
+            self.entradas -= self.tamanos.pop(clave)
+
+# Búsqueda de costo uniforme con caché. Retorna lo mismo que busqueda_costo_uniforme: (costo, camino) o None.
+# - cache: Una instancia de CacheArboles compartida entre consultas.
+# - version: Identificador de la versión del grafo.
+def busqueda_costo_uniforme_cache(grafo, inicio, objetivo, cache, version=0):
+    return cache.consultar(grafo, inicio, objetivo, version)
+
+# Define la búsqueda de costo uniforme sobre un problema implícito (protocolo de 00009_Problema_Implicito.py).
+# Igual que busqueda_costo_uniforme, pero los vecinos y costos salen de problema.sucesores(estado), la meta se
+# reconoce con problema.es_objetivo y tanto la frontera como la tabla de visitados trabajan con claves.
+# La tabla guarda clave -> (clave del padre, costo acumulado, estado).
+# Retorna (costo, camino de estados) o None.
+# 'estadisticas' recibe los mismos contadores que en busqueda_costo_uniforme, contados como en
+# busqueda_anchura_problema (00001_Busq_De_Anchura.py).
+def busqueda_costo_uniforme_problema(problema, frontera=None, estadisticas=None):
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    expandidos = generados = obsoletos = inserciones = 0
+    pico_frontera = 1
+    cola = ColaHeap() if frontera is None else frontera
+    inicial = problema.estado_inicial
+    clave_inicial = problema.clave(inicial)
+    cola.insertar(0, clave_inicial)
+    visitados = {clave_inicial: (None, 0, inicial)}
+    while cola:
+        costo, clave = cola.extraer()
+        _, mejor, actual = visitados[clave]
+        if costo > mejor:
+            obsoletos += 1
+            continue
+        if problema.es_objetivo(actual):
+            t_objetivo = time.perf_counter() if contar else None
+            camino = []
+            while clave is not None:
+                clave, _, estado = visitados[clave]
+                camino.append(estado)
+            registrar(estadisticas, t0, t_objetivo, expandidos=expandidos, generados=generados,
+                      duplicados=generados - inserciones, obsoletos=obsoletos, inserciones=inserciones,
+                      pico_frontera=pico_frontera)
+            return (costo, camino[::-1])
+        sucesores = problema.sucesores(actual)
+        if contar:
+            sucesores = list(sucesores)
+        for vecino, paso in sucesores:
+            nuevo_costo = costo + paso
+            clave_vecino = problema.clave(vecino)
+            if clave_vecino not in visitados or nuevo_costo < visitados[clave_vecino][1]:
+                visitados[clave_vecino] = (clave, nuevo_costo, vecino)
+                cola.insertar(nuevo_costo, clave_vecino)
+                inserciones += 1
+        if contar:
+            expandidos += 1
+            generados += len(sucesores)
+            if len(cola) > pico_frontera:
+                pico_frontera = len(cola)
+    registrar(estadisticas, t0, None, expandidos=expandidos, generados=generados, duplicados=generados - inserciones,
+              obsoletos=obsoletos, inserciones=inserciones, pico_frontera=pico_frontera)
+    return None
+
 # Este bloque de código solo se ejecuta cuando el script se corre directamente (no cuando es importado como módulo).
 # Es una práctica común para incluir ejemplos de uso o pruebas.
 if __name__ == "__main__":
@@ -94,4 +403,19 @@ if __name__ == "__main__":
         print(f"Camino encontrado (costo total: {costo}):", " -> ".join(camino))
     else:
         # Si 'resultado' es None (no se encontró el camino), imprime un mensaje indicándolo.
-        print(f"No se encontró camino desde {inicio} hasta {objetivo}")
\ No newline at end of file
+        print(f"No se encontró camino desde {inicio} hasta {objetivo}")
+
+    # Los costos del ejemplo son enteros pequeños (máximo 5), así que también sirven la cola de Dial y el montículo radix.
+    print("Con cola de Dial:", busqueda_costo_uniforme(grafo, inicio, objetivo, ColaDial(5)))
+    print("Con montículo radix:", busqueda_costo_uniforme(grafo, inicio, objetivo, MonticuloRadix()))
+
+    # Con caché: la segunda consulta desde 'A' reutiliza el árbol y solo extiende su frontera hasta 'D'.
+    cache = CacheArboles(max_arboles=4)
+    print("Con caché:", busqueda_costo_uniforme_cache(grafo, 'A', 'F', cache))
+    print("Con caché:", busqueda_costo_uniforme_cache(grafo, 'A', 'D', cache))
+    print(f"Aciertos: {cache.aciertos}, fallos: {cache.fallos}, entradas guardadas: {cache.entradas}")
+
+    # Jarras de 4 y 3 litros para medir exactamente 2 (Jarras de 00009_Problema_Implicito.py). Cada acción cuesta
+    # los litros que mueve, así que UCS minimiza el agua movida y no el número de acciones.
+    implicito = cargar_modulo('00001_Busqueda_No_Info/00009_Problema_Implicito.py')
+    print("Jarras (costo en litros):", busqueda_costo_uniforme_problema(implicito.Jarras(4, 3, 2)))
@@ -1,9 +1,30 @@
+# Importa time para medir la duración de cada fase en las estadísticas.
+import time  # Reloj monotónico (perf_counter)
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import agotar, cargar_modulo, registrar, sin_probar  # Búsqueda por pasos, archivos, estadísticas
+
 # Define la función para realizar una Búsqueda en Profundidad de forma iterativa.
 # Recibe tres argumentos:
 # - grafo: Un diccionario que representa el grafo (clave: nodo, valor: lista de vecinos).
 # - inicio: El nodo desde el cual comenzar la búsqueda.
 # - objetivo: El nodo que se desea encontrar.
-def busqueda_profundidad(grafo, inicio, objetivo):
+# - estadisticas: Diccionario opcional donde se guardan, al terminar, los contadores de la búsqueda (expandidos,
+#                 generados, duplicados descartados, inserciones en la frontera, pico de la frontera) y el tiempo
+#                 de cada fase (ver registrar en busqueda_comun.py).
+def busqueda_profundidad(grafo, inicio, objetivo, estadisticas=None):
+    # Contadores para 'estadisticas' (se vuelcan solo al terminar). Sin 'estadisticas' no se toman tiempos; con él,
+    # los generados se suman una vez por expansión. Cada entrada de la pila se saca una vez (se expande, se descarta
+    # por repetida o es el objetivo), así que las inserciones salen de las extracciones y de lo que queda en la pila.
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    expandidos = generados = repetidos = 0
+    pico_frontera = 1
+
     # Inicializa una pila (usando una lista de Python, donde pop() elimina el último elemento, imitando una pila).
     # Cada elemento en la pila es una tupla: (nodo_actual, lista_del_camino_hasta_este_nodo).
     # Empezamos con el nodo inicial y un camino que solo contiene el nodo inicial.
@@ -23,6 +44,12 @@ def busqueda_profundidad(grafo, inicio, objetivo):
         if actual == objetivo:
             # Si es el objetivo, hemos encontrado un camino (no necesariamente el más corto, a diferencia de BFS).
             # Retorna la lista del camino que lleva desde el inicio hasta este nodo.
+            # (El camino viaja en la pila, así que no hay fase de reconstrucción.)
+            if contar:
+                inserciones = expandidos + repetidos + len(pila)  # Extracciones (con esta) + pila - entrada inicial
+                registrar(estadisticas, t0, time.perf_counter(), expandidos=expandidos, generados=generados,
+                          duplicados=generados - inserciones + repetidos, inserciones=inserciones,
+                          pico_frontera=pico_frontera)
             return camino
 
         # Comprueba si el nodo actual no ha sido visitado aún.
@@ -31,22 +58,34 @@ def busqueda_profundidad(grafo, inicio, objetivo):
             # Si el nodo no ha sido visitado:
             # Lo añade al conjunto de visitados para no procesarlo de nuevo.
             visitados.add(actual)
+            expandidos += 1
 
             # Explora los vecinos del nodo actual.
             # Iteramos sobre los vecinos en orden inverso. Esto se hace para que, al agregarlos a la pila,
             # el primer vecino en el orden original del grafo[actual] sea el *último* en entrar a la pila y,
             # por lo tanto, el *primero* en ser sacado y explorado en la siguiente iteración del bucle.
             # Esto asegura que la exploración siga el orden definido en el grafo para los vecinos.
-            for vecino in reversed(grafo[actual]):
+            vecinos = grafo[actual]
+            for vecino in reversed(vecinos):
                 # Para cada vecino, comprueba si no ha sido visitado.
                 if vecino not in visitados:
                     # Si el vecino no ha sido visitado:
                     # Añade una nueva tupla (vecino, camino_extendido) a la pila.
                     # El camino_extendido es la lista del camino actual más el vecino.
                     pila.append((vecino, camino + [vecino]))
+                # Si ya fue visitado, se descarta (un duplicado).
+            if contar:
+                generados += len(vecinos)
+                if len(pila) > pico_frontera:
+                    pico_frontera = len(pila)
+        else:
+            repetidos += 1  # Entrada de la pila cuyo nodo ya se expandió por otra rama (también un duplicado)
 
     # Si el bucle 'while pila:' termina y no se ha encontrado el objetivo (nunca se ejecutó el 'return camino'),
     # significa que el objetivo no es alcanzable desde el nodo de inicio en este grafo.
+    inserciones = expandidos + repetidos - 1
+    registrar(estadisticas, t0, None, expandidos=expandidos, generados=generados,
+              duplicados=generados - inserciones + repetidos, inserciones=inserciones, pico_frontera=pico_frontera)
     return None  # Si no se encuentra camino
 
 # Define la función para realizar una Búsqueda en Profundidad de forma recursiva.
@@ -93,6 +132,98 @@ def busqueda_profundidad_recursiva(grafo, inicio, objetivo, visitados=None, cami
     # Retorna None para indicar que no se encontró el camino desde este punto.
     return None
 
+# Define una versión de busqueda_profundidad_recursiva sin recursión, para grafos muy profundos.
+# La versión recursiva hace una llamada por nivel (choca con el límite de recursión de Python, ~1000 niveles)
+# y copia 'camino + [inicio]' en cada llamada (memoria O(profundidad²)).
+# Aquí cada llamada recursiva se sustituye por una entrada en una pila explícita: el nodo y un iterador sobre
+# sus vecinos que recuerda por cuál vamos. El iterador reanuda el recorrido donde lo dejó, así que el orden de
+# visita es exactamente el de la versión recursiva y devuelve el mismo camino.
+# La pila de nodos ES el camino desde el inicio hasta el nodo actual (cada nodo apunta implícitamente a su padre,
+# el elemento anterior), así que el camino solo se copia una vez, al encontrar el objetivo.
+# Cada nodo visitado cuesta una entrada en 'visitados' y, mientras está en la rama actual, un iterador.
+# 'estadisticas' recibe los mismos contadores que en busqueda_profundidad; aquí los generados son los vecinos
+# realmente probados y el pico de la frontera es la longitud máxima de la rama.
+def busqueda_profundidad_pila(grafo, inicio, objetivo, estadisticas=None):
+    return agotar(busqueda_profundidad_pasos(grafo, inicio, objetivo, estadisticas, informar=False))
+
+# Define la búsqueda en profundidad por pasos (generador; ver 00012_Busqueda_Por_Pasos.py). Es la implementación de
+# busqueda_profundidad_pila. Aquí la frontera es la rama actual y 'mejor_f' es su profundidad.
+def busqueda_profundidad_pasos(grafo, inicio, objetivo, estadisticas=None, informar=True):
+    # Contadores para 'estadisticas', solo si se pidieron: los generados se suman al crear el iterador de cada nodo
+    # (ver sin_probar en busqueda_comun.py) y cada nodo nuevo en 'visitados' es una inserción. 'expandidos' no
+    # cuenta el inicio (es el progreso por pasos); en las estadísticas sí se cuenta.
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    # Marca el inicio como visitado y comprueba el caso trivial.
+    visitados = {inicio}
+    if inicio == objetivo:
+        registrar(estadisticas, t0, None, expandidos=0, generados=0, duplicados=0, inserciones=0, pico_frontera=1)
+        return [inicio]
+    # nodos: rama actual desde el inicio. iteradores: siguiente vecino por revisar de cada nodo de la rama.
+    nodos = [inicio]
+    iteradores = [iter(grafo[inicio])]
+    expandidos = 0
+    generados = len(grafo[inicio]) if contar else 0
+    pico_frontera = 1
+    while iteradores:
+        # Continúa con los vecinos pendientes del nodo más profundo de la rama.
+        for vecino in iteradores[-1]:
+            if vecino not in visitados:
+                visitados.add(vecino)
+                if vecino == objetivo:
+                    camino = nodos + [vecino]
+                    if contar:
+                        generados -= sin_probar(grafo, camino)
+                        registrar(estadisticas, t0, time.perf_counter(), expandidos=expandidos + 1,
+                                  generados=generados, duplicados=generados - (len(visitados) - 1),
+                                  inserciones=len(visitados) - 1, pico_frontera=pico_frontera)
+                    return camino
+                # Equivale a la llamada recursiva: baja un nivel.
+                nodos.append(vecino)
+                iteradores.append(iter(grafo[vecino]))
+                expandidos += 1
+                if contar:
+                    generados += len(grafo[vecino])
+                    if len(nodos) > pico_frontera:
+                        pico_frontera = len(nodos)
+                if informar:
+                    yield {'expandidos': expandidos, 'frontera': len(nodos), 'mejor_f': len(nodos) - 1}
+                break
+        else:
+            # Sin vecinos pendientes: equivale a retornar de la llamada recursiva.
+            nodos.pop()
+            iteradores.pop()
+    registrar(estadisticas, t0, None, expandidos=expandidos + 1, generados=generados,
+              duplicados=generados - (len(visitados) - 1), inserciones=len(visitados) - 1, pico_frontera=pico_frontera)
+    return None
+
+# Define la búsqueda en profundidad sobre un problema implícito (protocolo de 00009_Problema_Implicito.py).
+# Igual que busqueda_profundidad_pila: la pila de estados es la rama actual y cada estado tiene un generador
+# de sucesores que se consume de forma perezosa. Los visitados se guardan por problema.clave(estado).
+# Ojo: en un espacio de estados infinito la búsqueda en profundidad puede no terminar.
+# Retorna la lista de estados desde el inicial hasta una meta, o None.
+def busqueda_profundidad_problema(problema):
+    inicial = problema.estado_inicial
+    visitados = {problema.clave(inicial)}
+    if problema.es_objetivo(inicial):
+        return [inicial]
+    estados = [inicial]
+    iteradores = [problema.sucesores(inicial)]
+    while iteradores:
+        for vecino, _ in iteradores[-1]:
+            clave = problema.clave(vecino)
+            if clave not in visitados:
+                visitados.add(clave)
+                if problema.es_objetivo(vecino):
+                    return estados + [vecino]
+                estados.append(vecino)
+                iteradores.append(problema.sucesores(vecino))
+                break
+        else:
+            estados.pop()
+            iteradores.pop()
+    return None
+
 # Este bloque de código solo se ejecuta cuando el script se corre directamente.
 # Contiene el ejemplo de cómo usar ambas funciones.
 if __name__ == "__main__":
@@ -124,4 +255,19 @@ if __name__ == "__main__":
     # El resultado (el camino o None) se guarda en la variable 'camino_rec'.
     camino_rec = busqueda_profundidad_recursiva(grafo, inicio, objetivo)
     # Imprime el resultado de la versión recursiva, similar a la iterativa.
-    print(" -> ".join(camino_rec) if camino_rec else "No se encontró camino")
\ No newline at end of file
+    print(" -> ".join(camino_rec) if camino_rec else "No se encontró camino")
+
+    # Muestra un encabezado para la versión con pila explícita.
+    print("\nVersión con pila explícita:")
+    camino_pila = busqueda_profundidad_pila(grafo, inicio, objetivo)
+    print(" -> ".join(camino_pila) if camino_pila else "No se encontró camino")
+
+    # Una cadena de 100000 nodos: la versión recursiva superaría el límite de recursión de Python.
+    cadena = {i: [i + 1] for i in range(100000)}
+    cadena[100000] = []
+    print("Longitud del camino en la cadena:", len(busqueda_profundidad_pila(cadena, 0, 100000)))
+
+    # Jarras de 4 y 3 litros para medir exactamente 2 (Jarras de 00009_Problema_Implicito.py). En profundidad se
+    # encuentra una solución, no necesariamente la de menos acciones.
+    implicito = cargar_modulo('00001_Busqueda_No_Info/00009_Problema_Implicito.py')
+    print("Jarras (profundidad):", busqueda_profundidad_problema(implicito.Jarras(4, 3, 2)))
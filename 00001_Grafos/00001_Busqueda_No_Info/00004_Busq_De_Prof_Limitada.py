@@ -1,10 +1,31 @@
+# Importa time para medir la duración de cada fase en las estadísticas.
+import time  # Reloj monotónico (perf_counter)
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import agotar, cargar_modulo, registrar, sin_probar  # Búsqueda por pasos, archivos, estadísticas
+
 # Define la función para realizar una Búsqueda en Profundidad Limitada de forma iterativa.
 # Recibe cuatro argumentos:
 # - grafo: Un diccionario que representa el grafo (clave: nodo, valor: lista de vecinos).
 # - inicio: El nodo desde el cual comenzar la búsqueda.
 # - objetivo: El nodo que se desea encontrar.
 # - limite: La profundidad máxima a la que se explorará el grafo.
-def busqueda_profundidad_limitada(grafo, inicio, objetivo, limite):
+# - estadisticas: Diccionario opcional donde se guardan, al terminar, los contadores de la búsqueda (expandidos,
+#                 generados, duplicados descartados, inserciones en la frontera, pico de la frontera, nodos
+#                 en el límite que no se expandieron) y el tiempo de cada fase (ver registrar en busqueda_comun.py).
+def busqueda_profundidad_limitada(grafo, inicio, objetivo, limite, estadisticas=None):
+    # Contadores para 'estadisticas' (se vuelcan solo al terminar). Sin 'estadisticas' no se toman tiempos; con él,
+    # los generados se suman una vez por expansión y las inserciones se deducen como en busqueda_profundidad
+    # (00003_Busq_De_Profundidad.py), contando también las entradas cortadas por el límite.
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    expandidos = generados = repetidos = cortados = 0
+    pico_frontera = 1
+
     # Inicializa una pila (usando una lista). Cada elemento es una tupla:
     # (nodo_actual, lista_del_camino_hasta_este_nodo, profundidad_actual_del_nodo).
     # Empezamos con el nodo inicial, un camino que solo lo contiene, y una profundidad de 0.
@@ -22,6 +43,11 @@ def busqueda_profundidad_limitada(grafo, inicio, objetivo, limite):
         # Comprueba si el nodo actual es el objetivo.
         if actual == objetivo:
             # Si es el objetivo, retorna el camino encontrado. Hemos llegado al objetivo.
+            if contar:
+                inserciones = expandidos + repetidos + cortados + len(pila)  # Extracciones + pila - entrada inicial
+                registrar(estadisticas, t0, time.perf_counter(), expandidos=expandidos, generados=generados,
+                          duplicados=generados - inserciones + repetidos, inserciones=inserciones,
+                          pico_frontera=pico_frontera, cortados=cortados)
             return camino
 
         # Comprueba si el nodo actual no ha sido visitado Y si la profundidad actual es menor que el límite permitido.
@@ -29,11 +55,13 @@ def busqueda_profundidad_limitada(grafo, inicio, objetivo, limite):
         if actual not in visitados and profundidad < limite:
             # Si cumplimos las condiciones, marcamos el nodo actual como visitado.
             visitados.add(actual)
+            expandidos += 1
 
             # Explora los vecinos del nodo actual.
             # Itera sobre los vecinos en orden inverso para que el orden de exploración sea consistente con DFS.
             # (El primer vecino en el orden original del grafo es el último en la lista invertida, por lo tanto, el primero en ser añadido a la pila y explorado).
-            for vecino in reversed(grafo[actual]):
+            vecinos = grafo[actual]
+            for vecino in reversed(vecinos):
                 # Para cada vecino, si no ha sido visitado:
                 # Nota: Este 'if vecino not in visitados' es opcional en DLS si el grafo no tiene ciclos o si los ciclos
                 # no son más profundos que el límite. Pero ayuda a evitar trabajo redundante si hay ciclos superficiales.
@@ -41,9 +69,22 @@ def busqueda_profundidad_limitada(grafo, inicio, objetivo, limite):
                      # Añade una nueva tupla (vecino, camino_extendido, profundidad_aumentada) a la pila.
                     # El camino se extiende con el vecino, y la profundidad se incrementa en 1.
                     pila.append((vecino, camino + [vecino], profundidad + 1))
+                # Si ya fue visitado, se descarta (un duplicado).
+            if contar:
+                generados += len(vecinos)
+                if len(pila) > pico_frontera:
+                    pico_frontera = len(pila)
+        elif actual in visitados:
+            repetidos += 1  # Entrada de la pila cuyo nodo ya se expandió por otra rama (también un duplicado)
+        else:
+            cortados += 1  # Nodo en el límite de profundidad: no se expande
 
     # Si el bucle 'while pila:' termina y no se ha encontrado el objetivo (nunca se ejecutó el 'return camino'),
     # significa que el objetivo no existe dentro del límite de profundidad especificado.
+    inserciones = expandidos + repetidos + cortados - 1
+    registrar(estadisticas, t0, None, expandidos=expandidos, generados=generados,
+              duplicados=generados - inserciones + repetidos, inserciones=inserciones, pico_frontera=pico_frontera,
+              cortados=cortados)
     return None  # No se encontró el objetivo en el límite dado
 
 # Define la función para realizar una Búsqueda en Profundidad Limitada de forma recursiva.
@@ -94,6 +135,103 @@ def dls_recursiva(grafo, nodo, objetivo, limite, visitados=None, camino=None):
     # desde este nodo dentro del límite restante, retorna None.
     return None  # Si ningún camino fue válido desde este nodo dentro del límite
 
+# Define una versión de dls_recursiva sin recursión (pila explícita), para límites muy grandes.
+# Sigue exactamente el mismo orden que dls_recursiva y devuelve el mismo camino:
+# - Un nodo se marca como visitado al "entrar" en él, aunque esté en el límite y no se expanda.
+# - El conjunto de visitados se comparte entre ramas, igual que en la versión recursiva.
+# La pila 'nodos' es la rama actual (el camino desde el inicio), y 'iteradores' guarda por qué vecino va cada nodo.
+# El límite restante de un nodo es 'limite' menos su profundidad, que es su posición en la pila.
+# 'estadisticas' recibe los mismos contadores que en busqueda_profundidad_limitada, contados como en
+# busqueda_profundidad_pila (00003_Busq_De_Profundidad.py).
+def dls_pila(grafo, nodo, objetivo, limite, estadisticas=None):
+    return agotar(dls_pasos(grafo, nodo, objetivo, limite, estadisticas, informar=False))
+
+# Define la búsqueda en profundidad limitada por pasos (generador; ver 00012_Busqueda_Por_Pasos.py). Es la
+# implementación de dls_pila. Aquí la frontera es la rama actual y 'mejor_f' es su profundidad.
+def dls_pasos(grafo, nodo, objetivo, limite, estadisticas=None, informar=True):
+    # Contadores para 'estadisticas', solo si se pidieron (como en busqueda_profundidad_pasos). Los nodos cortados
+    # son los visitados que no se expandieron ni son el objetivo.
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    visitados = {nodo}
+    if nodo == objetivo or limite <= 0:
+        registrar(estadisticas, t0, None, expandidos=0, generados=0, duplicados=0, inserciones=0, pico_frontera=1,
+                  cortados=0)
+        return [nodo] if nodo == objetivo else None
+    nodos = [nodo]
+    iteradores = [iter(grafo[nodo])]
+    expandidos = 0
+    generados = len(grafo[nodo]) if contar else 0
+    pico_frontera = 1
+    while iteradores:
+        for vecino in iteradores[-1]:
+            if vecino not in visitados:
+                visitados.add(vecino)
+                if vecino == objetivo:
+                    camino = nodos + [vecino]
+                    if contar:
+                        generados -= sin_probar(grafo, camino)
+                        inserciones = len(visitados) - 1
+                        registrar(estadisticas, t0, time.perf_counter(), expandidos=expandidos + 1,
+                                  generados=generados, duplicados=generados - inserciones, inserciones=inserciones,
+                                  pico_frontera=pico_frontera, cortados=inserciones - expandidos - 1)
+                    return camino
+                # Solo se baja un nivel si al vecino todavía le queda límite (profundidad del vecino = len(nodos)).
+                if len(nodos) < limite:
+                    nodos.append(vecino)
+                    iteradores.append(iter(grafo[vecino]))
+                    expandidos += 1
+                    if contar:
+                        generados += len(grafo[vecino])
+                        if len(nodos) > pico_frontera:
+                            pico_frontera = len(nodos)
+                    if informar:
+                        yield {'expandidos': expandidos, 'frontera': len(nodos), 'mejor_f': len(nodos) - 1}
+                    break
+        else:
+            nodos.pop()
+            iteradores.pop()
+    inserciones = len(visitados) - 1
+    registrar(estadisticas, t0, None, expandidos=expandidos + 1, generados=generados,
+              duplicados=generados - inserciones, inserciones=inserciones, pico_frontera=pico_frontera,
+              cortados=inserciones - expandidos)
+    return None
+
+# Define la búsqueda en profundidad limitada sobre un problema implícito (protocolo de 00009_Problema_Implicito.py).
+# A diferencia de dls_pila, no comparte un conjunto de visitados entre ramas: solo evita repetir claves de la rama
+# actual. Así la memoria es proporcional al límite (no a los estados generados), que es lo que interesa en espacios
+# de estados enormes, y además no se pierde ningún camino dentro del límite por haber visitado antes un estado
+# desde una rama más profunda.
+# Retorna la lista de estados desde el inicial hasta una meta a 'limite' pasos como máximo, o None.
+def dls_problema(problema, limite):
+    inicial = problema.estado_inicial
+    if problema.es_objetivo(inicial):
+        return [inicial]
+    if limite <= 0:
+        return None
+    estados = [inicial]
+    en_rama = {problema.clave(inicial)}
+    claves = [problema.clave(inicial)]
+    iteradores = [problema.sucesores(inicial)]
+    while iteradores:
+        for vecino, _ in iteradores[-1]:
+            clave = problema.clave(vecino)
+            if clave in en_rama:
+                continue
+            if problema.es_objetivo(vecino):
+                return estados + [vecino]
+            if len(estados) < limite:
+                estados.append(vecino)
+                claves.append(clave)
+                en_rama.add(clave)
+                iteradores.append(problema.sucesores(vecino))
+                break
+        else:
+            estados.pop()
+            en_rama.discard(claves.pop())
+            iteradores.pop()
+    return None
+
 # Este bloque de código se ejecuta solo cuando el script se corre directamente.
 # Contiene el ejemplo de cómo usar ambas funciones de DLS.
 if __name__ == "__main__":
@@ -126,4 +264,16 @@ if __name__ == "__main__":
     # El resultado se guarda en 'camino_rec'.
     camino_rec = dls_recursiva(grafo, inicio, objetivo, limite)
     # Imprime el resultado de la versión recursiva, similar a la iterativa.
-    print(" -> ".join(camino_rec) if camino_rec else f"No se encontró camino con límite {limite}")
\ No newline at end of file
+    print(" -> ".join(camino_rec) if camino_rec else f"No se encontró camino con límite {limite}")
+
+    # Muestra un encabezado para la versión con pila explícita.
+    print("\nVersión con pila explícita:")
+    camino_pila = dls_pila(grafo, inicio, objetivo, limite)
+    print(" -> ".join(camino_pila) if camino_pila else f"No se encontró camino con límite {limite}")
+
+    # Jarras de 4 y 3 litros para medir exactamente 2 (Jarras de 00009_Problema_Implicito.py): con 6 acciones como
+    # máximo hay solución; con 3 no.
+    implicito = cargar_modulo('00001_Busqueda_No_Info/00009_Problema_Implicito.py')
+    jarras = implicito.Jarras(4, 3, 2)
+    print("Jarras (límite 6):", dls_problema(jarras, 6))
+    print("Jarras (límite 3):", dls_problema(jarras, 3))
@@ -1,3 +1,15 @@
+import multiprocessing as mp  # Contexto de procesos (fork) y evento compartido para cancelar
+from concurrent.futures import ProcessPoolExecutor, as_completed  # Pool de procesos para la IDDFS paralela
+# Importa time para medir la duración de cada fase en las estadísticas.
+import time  # Reloj monotónico (perf_counter)
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import agotar, cargar_modulo, registrar, sin_probar  # Búsqueda por pasos, archivos, estadísticas
+
 # Define la función principal para la Búsqueda en Profundidad Iterativa (IDDFS).
 # IDDFS combina BFS y DFS: realiza búsquedas en profundidad incrementando gradualmente un límite de profundidad.
 # Garantiza encontrar el camino más corto en grafos no ponderados (como BFS) y usa menos memoria que BFS en muchos casos.
@@ -5,7 +17,19 @@
 # - grafo: Diccionario representando el grafo.
 # - inicio: Nodo de inicio.
 # - objetivo: Nodo a encontrar.
-def busqueda_profundidad_iterativa(grafo, inicio, objetivo):
+# - estadisticas: Diccionario opcional donde se guardan, al terminar, los nodos expandidos y generados (sumando
+#                 todas las iteraciones), el número de iteraciones (límites probados), la profundidad máxima de la
+#                 recursión (el "pico de la frontera" de una DFS) y el tiempo de cada fase (ver registrar en
+#                 busqueda_comun.py).
+def busqueda_profundidad_iterativa(grafo, inicio, objetivo, estadisticas=None):
+    # Contadores para 'estadisticas' (se vuelcan solo al terminar); la DLS anidada los actualiza con 'nonlocal'.
+    # Sin 'estadisticas' no se cuenta nada; con él, los generados se suman una vez por expansión (todos los vecinos) y
+    # solo en la rama del objetivo se restan los vecinos que ya no llegaron a probarse.
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    expandidos = generados = 0
+    pico_frontera = 1
+
     # Define una función anidada 'dls' (Depth-Limited Search) que realiza la búsqueda en profundidad hasta un límite dado.
     # Esta función recursiva es la que se llama repetidamente con límites crecientes.
     # Recibe:
@@ -13,6 +37,7 @@ def busqueda_profundidad_iterativa(grafo, inicio, objetivo):
     # - objetivo: El nodo a encontrar (el mismo que el de la función exterior).
     # - limite: La profundidad máxima restante para explorar desde este 'nodo'.
     def dls(nodo, objetivo, limite):
+        nonlocal expandidos, generados, pico_frontera
         # Caso base 1: Si el nodo actual es el objetivo, hemos encontrado el camino.
         if nodo == objetivo:
             # Retorna una lista que contiene solo el nodo actual. Esto inicia la reconstrucción del camino.
@@ -22,13 +47,21 @@ def busqueda_profundidad_iterativa(grafo, inicio, objetivo):
             # Retorna None para indicar que el objetivo no se encontró en esta rama dentro del límite.
             return None
         # Si no es el objetivo y el límite no se ha alcanzado, explora los vecinos.
-        for vecino in grafo[nodo]:
+        vecinos = grafo[nodo]
+        if contar:
+            expandidos += 1
+            generados += len(vecinos)
+            if profundidad - limite + 1 > pico_frontera:
+                pico_frontera = profundidad - limite + 1  # Profundidad de la recursión (nodos en la rama actual)
+        for vecino in vecinos:
             # Realiza una llamada recursiva para explorar el 'vecino', decrementando el límite en 1.
             resultado = dls(vecino, objetivo, limite - 1)
             # Después de la llamada recursiva, comprueba si esa rama encontró el objetivo.
             if resultado:
                 # Si la llamada recursiva retornó un camino (no None), significa que el objetivo está en esa rama.
                 # Reconstruye el camino añadiendo el nodo actual al principio del camino retornado por la llamada recursiva.
+                if contar:
+                    generados -= len(vecinos) - 1 - vecinos.index(vecino)  # Vecinos que quedaron sin probar
                 return [nodo] + resultado
         # Si el bucle termina y ninguna llamada recursiva encontró el objetivo en esta rama, retorna None.
         return None
@@ -45,6 +78,9 @@ def busqueda_profundidad_iterativa(grafo, inicio, objetivo):
         # Comprueba si la llamada DLS actual encontró el objetivo (si 'resultado' no es None).
         if resultado:
             # Si se encontró el objetivo, retorna el camino encontrado.
+            # (El camino se construye al volver de la recursión, así que no hay fase de reconstrucción aparte.)
+            registrar(estadisticas, t0, time.perf_counter(), expandidos=expandidos, generados=generados,
+                      iteraciones=profundidad + 1, pico_frontera=pico_frontera)
             return resultado
 
         # Nota Importante: Esta versión básica no maneja explicitamente la inalcanzabilidad del objetivo.
@@ -57,6 +93,271 @@ def busqueda_profundidad_iterativa(grafo, inicio, objetivo):
         # Si el objetivo no se encontró en la DLS actual, incrementa el límite de profundidad para la siguiente iteración.
         profundidad += 1  # Aumenta el límite para intentar más profundo
 
+# Define una versión de busqueda_profundidad_iterativa cuya DLS interna usa una pila explícita en lugar de recursión.
+# La DLS recursiva hace una llamada por nivel y construye '[nodo] + resultado' al volver; con límites grandes
+# supera el límite de recursión de Python. Aquí la pila 'nodos' es la rama actual y 'iteradores' recuerda por qué
+# vecino va cada nodo, así que el orden de exploración (y el camino devuelto) es el mismo que el de la versión recursiva.
+# Diferencias:
+# - No se baja a un nodo que ya está en la rama actual (un ciclo). Con el límite mínimo ningún camino al objetivo
+#   repite nodos (habría otro más corto), así que el camino encontrado no cambia.
+# - Si en una iteración ninguna rama quedó cortada por el límite, profundizar más no puede encontrar nada nuevo:
+#   el objetivo es inalcanzable y se retorna None (la versión original iteraría para siempre).
+# 'estadisticas' recibe los mismos contadores que en busqueda_profundidad_iterativa; aquí los generados se cuentan
+# como en busqueda_profundidad_pila (00003_Busq_De_Profundidad.py).
+def busqueda_profundidad_iterativa_pila(grafo, inicio, objetivo, estadisticas=None):
+    return agotar(busqueda_profundidad_iterativa_pasos(grafo, inicio, objetivo, estadisticas, informar=False))
+
+# Define la IDDFS por pasos (generador; ver 00012_Busqueda_Por_Pasos.py). Es la implementación de
+# busqueda_profundidad_iterativa_pila. Aquí la frontera es la rama actual y 'mejor_f' es el límite de la iteración
+# en curso; 'expandidos' acumula las expansiones de todas las iteraciones.
+def busqueda_profundidad_iterativa_pasos(grafo, inicio, objetivo, estadisticas=None, informar=True):
+    # Contadores para 'estadisticas', solo si se pidieron (como en busqueda_profundidad_pasos). 'expandidos' no
+    # cuenta el inicio de cada iteración (es el progreso por pasos); en las estadísticas sí se cuenta.
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    if inicio == objetivo:
+        registrar(estadisticas, t0, None, expandidos=0, generados=0, iteraciones=0, pico_frontera=1)
+        return [inicio]
+    profundidad = 1
+    expandidos = generados = 0
+    pico_frontera = 1
+    while True:
+        cortado = False  # ¿Alguna rama quedó sin explorar por culpa del límite?
+        nodos = [inicio]
+        en_rama = {inicio}  # Los mismos nodos que 'nodos', para comprobar ciclos en O(1)
+        iteradores = [iter(grafo[inicio])]
+        if contar:
+            generados += len(grafo[inicio])
+        while iteradores:
+            for vecino in iteradores[-1]:
+                if vecino == objetivo:
+                    camino = nodos + [vecino]
+                    if contar:
+                        generados -= sin_probar(grafo, camino)
+                        registrar(estadisticas, t0, time.perf_counter(), expandidos=expandidos + profundidad,
+                                  generados=generados, iteraciones=profundidad, pico_frontera=pico_frontera)
+                    return camino
+                if vecino in en_rama:
+                    continue
+                # La profundidad del vecino es len(nodos); se expande solo si no alcanza el límite.
+                if len(nodos) < profundidad:
+                    nodos.append(vecino)
+                    en_rama.add(vecino)
+                    iteradores.append(iter(grafo[vecino]))
+                    expandidos += 1
+                    if contar:
+                        generados += len(grafo[vecino])
+                        if len(nodos) > pico_frontera:
+                            pico_frontera = len(nodos)
+                    if informar:
+                        yield {'expandidos': expandidos, 'frontera': len(nodos), 'mejor_f': profundidad}
+                    break
+                if grafo[vecino]:
+                    cortado = True
+            else:
+                en_rama.discard(nodos.pop())
+                iteradores.pop()
+        if not cortado:
+            registrar(estadisticas, t0, None, expandidos=expandidos + profundidad, generados=generados,
+                      iteraciones=profundidad, pico_frontera=pico_frontera)
+            return None
+        profundidad += 1
+
+# Define una IDDFS con tabla de transposición, pensada para grafos con muchos ciclos.
+# La IDDFS básica vuelve a expandir en cada iteración todos los nodos menos profundos por todos los caminos posibles.
+# Aquí una tabla de transposición guarda, para cada nodo, la menor profundidad a la que se ha alcanzado y en qué
+# iteración. Al llegar a un nodo:
+# - Si ya se alcanzó antes a MENOR profundidad (en cualquier iteración), esta rama se poda: desde la aparición más
+#   superficial se explorará lo mismo con más límite restante.
+# - Si ya se alcanzó a la MISMA profundidad en esta iteración, también se poda (sería repetir el mismo trabajo).
+# La tabla está acotada por 'max_tabla' entradas; cuando se llena, los nodos nuevos simplemente no se guardan
+# (se poda menos, pero el resultado sigue siendo correcto). Tampoco se baja nunca a un nodo de la rama actual.
+# Terminación garantizada: la búsqueda se detiene si una iteración no descubre ningún nodo nuevo (mientras la tabla
+# no se haya llenado) o si ninguna rama quedó cortada por el límite. En ambos casos el objetivo es inalcanzable.
+# Recibe:
+# - grafo, inicio, objetivo: Igual que busqueda_profundidad_iterativa.
+# - max_tabla: Número máximo de entradas de la tabla de transposición.
+# - registro: Lista opcional donde se añade, por cada iteración, un diccionario con el límite, los nodos expandidos,
+#             los nodos nuevos descubiertos y las ramas podadas por la tabla.
+# Retorna un camino de longitud mínima (en número de aristas) o None.
+def iddfs_con_tabla(grafo, inicio, objetivo, max_tabla=1_000_000, registro=None):
+    if inicio == objetivo:
+        return [inicio]
+    # Tabla de transposición: nodo -> (menor profundidad alcanzada, iteración en que se alcanzó a esa profundidad).
+    tabla = {}
+    desbordada = False  # ¿Se dejó de guardar algún nodo por falta de espacio?
+    profundidad = 1  # Límite de la iteración actual (también identifica la iteración)
+    while True:
+        expandidos, nuevos, podados = 0, 0, 0
+        cortado = False
+        tabla[inicio] = (0, profundidad)
+        nodos = [inicio]
+        en_rama = {inicio}  # Los mismos nodos que 'nodos', para descartar ciclos aunque la tabla esté llena
+        iteradores = [iter(grafo[inicio])]
+        camino = None
+        while iteradores and camino is None:
+            for vecino in iteradores[-1]:
+                if vecino == objetivo:
+                    camino = nodos + [vecino]
+                    break
+                if vecino in en_rama:
+                    continue
+                nivel = len(nodos)  # Profundidad a la que se alcanza el vecino por esta rama
+                entrada = tabla.get(vecino)
+                if entrada is None:
+                    nuevos += 1
+                    if len(tabla) < max_tabla:
+                        tabla[vecino] = (nivel, profundidad)
+                    else:
+                        desbordada = True
+                else:
+                    mejor, iteracion = entrada
+                    if mejor < nivel or (mejor == nivel and iteracion == profundidad):
+                        podados += 1
+                        continue
+                    tabla[vecino] = (nivel, profundidad)
+                # Baja un nivel si el vecino no está en el límite; si lo está y tiene vecinos, la rama queda cortada.
+                if nivel < profundidad:
+                    expandidos += 1
+                    nodos.append(vecino)
+                    en_rama.add(vecino)
+                    iteradores.append(iter(grafo[vecino]))
+                    break
+                if grafo[vecino]:
+                    cortado = True
+            else:
+                en_rama.discard(nodos.pop())
+                iteradores.pop()
+
+        if registro is not None:
+            registro.append({'limite': profundidad, 'expandidos': expandidos, 'nuevos': nuevos, 'podados': podados})
+        if camino is not None:
+            return camino
+        if not cortado or (nuevos == 0 and not desbordada):
+            return None
+        profundidad += 1
+
+# --- IDDFS paralela ---
+# Cada iteración de IDDFS recorre un árbol cuyos subárboles son independientes entre sí: la rama que pasa por un
+# prefijo de 'd' nodos no comparte trabajo con la que pasa por otro prefijo. La versión paralela corta el árbol a
+# profundidad 'd', genera todos los prefijos (caminos simples desde 'inicio' de 'd' aristas) y reparte cada subárbol
+# como una tarea independiente en un ProcessPoolExecutor.
+
+# Estado global de cada proceso trabajador, fijado una sola vez por el inicializador del pool.
+# Con el método 'fork' (Linux) el grafo no se serializa: los hijos heredan la memoria del padre (copia al escribir)
+# y solo lo leen. Con 'spawn' se serializa una vez por trabajador, no una vez por tarea.
+_GRAFO = None
+_CANCELAR = None
+
+# Cada cuántos nodos expandidos comprueba un trabajador si otro ya encontró el objetivo.
+PASOS_ENTRE_COMPROBACIONES = 1024
+
+# Inicializador del pool: guarda el grafo y el evento de cancelación compartido en el proceso trabajador.
+def _iniciar_trabajador(grafo, cancelar):
+    global _GRAFO, _CANCELAR
+    _GRAFO = grafo
+    _CANCELAR = cancelar
+
+# DLS con pila explícita que continúa una rama ya empezada ('prefijo', lista de nodos desde 'inicio').
+# Explora los caminos simples que extienden el prefijo hasta 'limite' aristas en total.
+# Si se pasa 'cancelar' (un Event), lo consulta cada PASOS_ENTRE_COMPROBACIONES expansiones y abandona si está activo.
+# Retorna (camino, cortado): el camino al objetivo o None, y si alguna rama quedó cortada por el límite.
+def _dls_desde_prefijo(grafo, prefijo, objetivo, limite, cancelar=None):
+    nodos = list(prefijo)
+    en_rama = set(nodos)
+    iteradores = [iter(grafo[nodos[-1]])]
+    cortado = False
+    pasos = 0
+    while iteradores:
+        for vecino in iteradores[-1]:
+            if vecino == objetivo:
+                return nodos + [vecino], cortado
+            if vecino in en_rama:
+                continue
+            if len(nodos) < limite:
+                nodos.append(vecino)
+                en_rama.add(vecino)
+                iteradores.append(iter(grafo[vecino]))
+                pasos += 1
+                if cancelar is not None and pasos % PASOS_ENTRE_COMPROBACIONES == 0 and cancelar.is_set():
+                    return None, True
+                break
+            if grafo[vecino]:
+                cortado = True
+        else:
+            en_rama.discard(nodos.pop())
+            iteradores.pop()
+    return None, cortado
+
+# Tarea que ejecuta cada trabajador: explora el subárbol bajo 'prefijo' con el grafo global del proceso.
+def _explorar_subarbol(prefijo, objetivo, limite):
+    if _CANCELAR.is_set():
+        return None, True
+    return _dls_desde_prefijo(_GRAFO, prefijo, objetivo, limite, _CANCELAR)
+
+# Genera los prefijos en los que se parte una iteración con límite 'limite'.
+# Profundiza nivel a nivel (caminos simples, en el mismo orden que la DFS) hasta tener al menos 'min_tareas' prefijos
+# o hasta 'limite - 1' aristas, para que cada tarea tenga como mínimo un nivel que explorar.
+# Retorna (prefijos, camino): 'camino' es el camino si al generar los prefijos se llegó al objetivo, o None.
+# Las ramas que no pueden seguir antes del corte desaparecen sin más: no cuentan como cortadas por el límite.
+def _prefijos(grafo, inicio, objetivo, limite, min_tareas):
+    prefijos = [[inicio]]
+    profundidad = 0
+    while len(prefijos) < min_tareas and profundidad < limite - 1:
+        siguientes = []
+        for prefijo in prefijos:
+            for vecino in grafo[prefijo[-1]]:
+                if vecino == objetivo:
+                    return [], prefijo + [vecino]
+                if vecino not in prefijo:
+                    siguientes.append(prefijo + [vecino])
+        if not siguientes:
+            break
+        prefijos = siguientes
+        profundidad += 1
+    return prefijos, None
+
+# Define la IDDFS paralela.
+# Recibe:
+# - grafo, inicio, objetivo: Igual que busqueda_profundidad_iterativa.
+# - procesos: Número de procesos trabajadores (por defecto, uno por núcleo).
+# - tareas_por_proceso: Cuántos subárboles se generan como mínimo por trabajador en cada iteración. Más tareas
+#                       reparten mejor la carga cuando los subárboles tienen tamaños muy distintos.
+# En cada iteración se lanzan todas las tareas; la primera que encuentra el objetivo activa un evento compartido,
+# las tareas pendientes se cancelan y las que están en marcha lo detectan en pocas expansiones y terminan.
+# Como el límite crece de uno en uno y la iteración anterior no encontró nada, cualquier camino encontrado tiene la
+# longitud mínima; entre varios caminos de igual longitud puede devolver uno distinto al de la versión secuencial.
+# Igual que busqueda_profundidad_iterativa_pila, no repite nodos de la rama y retorna None si el objetivo es inalcanzable.
+def busqueda_profundidad_iterativa_paralela(grafo, inicio, objetivo, procesos=None, tareas_por_proceso=4):
+    if inicio == objetivo:
+        return [inicio]
+    procesos = procesos or mp.cpu_count()
+    # 'fork' comparte el grafo sin copiarlo; donde no existe (Windows, macOS por defecto) se usa el método estándar.
+    contexto = mp.get_context('fork' if 'fork' in mp.get_all_start_methods() else None)
+    cancelar = contexto.Event()
+    with ProcessPoolExecutor(max_workers=procesos, mp_context=contexto,
+                             initializer=_iniciar_trabajador, initargs=(grafo, cancelar)) as pool:
+        profundidad = 1
+        while True:
+            prefijos, camino = _prefijos(grafo, inicio, objetivo, profundidad, procesos * tareas_por_proceso)
+            if camino is not None:
+                return camino
+            if not prefijos:
+                return None
+            tareas = [pool.submit(_explorar_subarbol, prefijo, objetivo, profundidad) for prefijo in prefijos]
+            cortado = False
+            for tarea in as_completed(tareas):
+                camino, cortado_tarea = tarea.result()
+                if camino is not None:
+                    # Avisa a los trabajadores en marcha y descarta las tareas que aún no han empezado.
+                    cancelar.set()
+                    pool.shutdown(wait=True, cancel_futures=True)
+                    return camino
+                cortado = cortado or cortado_tarea
+            if not cortado:
+                return None
+            profundidad += 1
+
 # Define una segunda función para IDDFS, esta vez utilizando una implementación iterativa de DLS
 # dentro del bucle principal, y gestionando un conjunto de visitados por cada iteración DLS.
 def iddfs_completo(grafo, inicio, objetivo):
@@ -124,6 +425,44 @@ def iddfs_completo(grafo, inicio, objetivo):
     # después de explorar todas las profundidades posibles.
     return None # Si no se encontró el objetivo después de todas las iteraciones de profundidad
 
+# Define la IDDFS sobre un problema implícito (protocolo de 00009_Problema_Implicito.py).
+# Igual que busqueda_profundidad_iterativa_pila, pero con claves: solo se recuerda la rama actual, así que la
+# memoria es proporcional a la profundidad de la solución aunque el espacio de estados sea gigantesco.
+# Retorna un camino de estados de longitud mínima hasta una meta, o None si ninguna rama quedó cortada por el límite.
+def busqueda_profundidad_iterativa_problema(problema):
+    inicial = problema.estado_inicial
+    if problema.es_objetivo(inicial):
+        return [inicial]
+    profundidad = 1
+    while True:
+        cortado = False
+        estados = [inicial]
+        claves = [problema.clave(inicial)]
+        en_rama = set(claves)
+        iteradores = [problema.sucesores(inicial)]
+        while iteradores:
+            for vecino, _ in iteradores[-1]:
+                if problema.es_objetivo(vecino):
+                    return estados + [vecino]
+                clave = problema.clave(vecino)
+                if clave in en_rama:
+                    continue
+                if len(estados) < profundidad:
+                    estados.append(vecino)
+                    claves.append(clave)
+                    en_rama.add(clave)
+                    iteradores.append(problema.sucesores(vecino))
+                    break
+                # En un problema implícito no se sabe si el vecino tiene sucesores sin generarlos: se asume que sí.
+                cortado = True
+            else:
+                estados.pop()
+                en_rama.discard(claves.pop())
+                iteradores.pop()
+        if not cortado:
+            return None
+        profundidad += 1
+
 # Este bloque de código se ejecuta solo cuando el script se corre directamente (no cuando es importado).
 # Contiene el ejemplo de cómo usar ambas funciones de IDDFS.
 if __name__ == "__main__":
@@ -152,4 +491,44 @@ if __name__ == "__main__":
     # Llama a la función IDDFS completa.
     camino_completo = iddfs_completo(grafo, inicio, objetivo)
     # Imprime el resultado de la versión completa.
-    print(" -> ".join(camino_completo) if camino_completo else "Camino no encontrado")
\ No newline at end of file
+    print(" -> ".join(camino_completo) if camino_completo else "Camino no encontrado")
+
+    # Muestra un encabezado para la versión con pila explícita.
+    print("\nVersión con pila explícita:")
+    camino_pila = busqueda_profundidad_iterativa_pila(grafo, inicio, objetivo)
+    print(" -> ".join(camino_pila) if camino_pila else "Camino no encontrado")
+
+    # Muestra un encabezado para la versión con tabla de transposición.
+    print("\nVersión con tabla de transposición:")
+    registro = []
+    camino_tabla = iddfs_con_tabla(grafo, inicio, objetivo, registro=registro)
+    print(" -> ".join(camino_tabla) if camino_tabla else "Camino no encontrado")
+    # Nodos expandidos, nuevos y podados en cada iteración.
+    for iteracion in registro:
+        print(iteracion)
+    # Un objetivo inexistente: la búsqueda termina en lugar de iterar para siempre.
+    print("Objetivo inalcanzable:", iddfs_con_tabla(grafo, inicio, 'Z'))
+
+    # Muestra un encabezado para la versión paralela.
+    print("\nVersión paralela:")
+    camino_paralelo = busqueda_profundidad_iterativa_paralela(grafo, inicio, objetivo, procesos=2)
+    print(" -> ".join(camino_paralelo) if camino_paralelo else "Camino no encontrado")
+
+    # Cuadrícula de 9x9 con vecinos en 4 direcciones, de una esquina a la opuesta: en cada iteración el número de
+    # caminos simples crece exponencialmente con el límite, que es el caso en que repartir subárboles compensa.
+    n = 9
+    cuadricula = {(i, j): [(i + di, j + dj) for di, dj in ((1, 0), (0, 1), (-1, 0), (0, -1))
+                           if 0 <= i + di < n and 0 <= j + dj < n]
+                  for i in range(n) for j in range(n)}
+    t0 = time.perf_counter()
+    secuencial = busqueda_profundidad_iterativa_pila(cuadricula, (0, 0), (n - 1, n - 1))
+    t1 = time.perf_counter()
+    paralelo = busqueda_profundidad_iterativa_paralela(cuadricula, (0, 0), (n - 1, n - 1))
+    t2 = time.perf_counter()
+    print(f"Cuadrícula {n}x{n}: secuencial {t1 - t0:.2f} s, paralela ({mp.cpu_count()} procesos) {t2 - t1:.2f} s,"
+          f" misma longitud: {len(secuencial) == len(paralelo)}")
+
+    # Jarras de 4 y 3 litros para medir exactamente 2 (Jarras de 00009_Problema_Implicito.py). IDDFS da la
+    # secuencia con menos acciones guardando solo el camino actual.
+    implicito = cargar_modulo('00001_Busqueda_No_Info/00009_Problema_Implicito.py')
+    print("Jarras (IDDFS):", busqueda_profundidad_iterativa_problema(implicito.Jarras(4, 3, 2)))
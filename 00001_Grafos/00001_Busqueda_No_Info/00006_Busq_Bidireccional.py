@@ -1,121 +1,237 @@
-# Importa la clase deque del módulo collections. 'deque' es una implementación de una cola doblemente terminada,
-# que es eficiente para operaciones de añadir y eliminar elementos de ambos lados. Es ideal para implementar
-# colas (FIFO) que se necesitan en algoritmos de búsqueda como BFS y, en este caso, en la búsqueda bidireccional.
-from collections import deque  # Cola eficiente para recorrido BFS
+# Importa heapq para las dos colas de prioridad de la versión ponderada (Dijkstra bidireccional).
+import heapq  # Colas de prioridad (min-heap)
+# Importa time para medir la duración de cada fase en las estadísticas.
+import time  # Reloj monotónico (perf_counter)
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import agotar, aristas, registrar  # Búsqueda por pasos, pares (vecino, costo), estadísticas
 
 # Define la función para realizar una Búsqueda Bidireccional.
 # Este algoritmo ejecuta dos búsquedas simultáneas (una desde el inicio y otra desde el objetivo)
 # hasta que se encuentran en un nodo común.
-# Recibe tres argumentos:
+# En cada paso se expande un NIVEL completo de uno de los dos lados, y se elige el lado cuya frontera tiene
+# menor grado de salida total (la suma de vecinos de todos sus nodos), que es el trabajo que costará expandirla.
+# En grafos con grados muy desiguales esto evita expandir el lado "caro" mientras el otro es barato.
+# Se asume un grafo no dirigido: la búsqueda desde el objetivo usa las mismas listas de vecinos.
+# Recibe:
 # - grafo: Un diccionario que representa el grafo.
 # - inicio: El nodo desde el cual comienza la primera búsqueda.
 # - objetivo: El nodo hacia el cual se dirige la segunda búsqueda.
-def busqueda_bidireccional(grafo, inicio, objetivo):
+# - estadisticas: Diccionario opcional donde se guardan contadores (nodos expandidos y niveles de cada lado,
+#                 aristas examinadas, vecinos duplicados, pico de las dos fronteras juntas y tiempo de cada fase)
+#                 para medir el ahorro.
+def busqueda_bidireccional(grafo, inicio, objetivo, estadisticas=None):
+    return agotar(busqueda_bidireccional_pasos(grafo, inicio, objetivo, estadisticas, informar=False))
+
+# Define la búsqueda bidireccional por pasos (generador; ver 00012_Busqueda_Por_Pasos.py). Es la implementación de
+# busqueda_bidireccional. Como se expanden niveles completos, cada next() expande un NIVEL de uno de los lados;
+# 'frontera' es el tamaño de las dos fronteras juntas y 'mejor_f' es la suma de los niveles de ambos lados
+# (cota inferior de la longitud del camino).
+def busqueda_bidireccional_pasos(grafo, inicio, objetivo, estadisticas=None, informar=True):
+    contar = estadisticas is not None  # Sin 'estadisticas' no se toman tiempos ni se cuentan aristas
+    t0 = time.perf_counter() if contar else None
     # Caso trivial: Si el nodo de inicio es el mismo que el nodo objetivo, ya hemos llegado.
     if inicio == objetivo:
         # Retorna una lista que contiene solo el nodo (el camino es simplemente el nodo).
+        registrar(estadisticas, t0, None, expandidos_inicio=0, expandidos_objetivo=0, niveles_inicio=0,
+                  niveles_objetivo=0, aristas_examinadas=0, duplicados=0, pico_frontera=1)
         return [inicio]  # Caso trivial
 
-    # Inicializa las estructuras de datos para la búsqueda desde el inicio (forward search).
-    # cola_inicio: Cola de nodos a visitar desde el inicio. Empieza con el nodo 'inicio'.
-    cola_inicio = deque([inicio])
-    # visitado_inicio: Diccionario para rastrear los nodos visitados desde el inicio
-    # y almacenar el predecesor (el nodo desde el que llegamos a este nodo).
-    # Esto es crucial para reconstruir el camino después.
-    visitado_inicio = {inicio: None} # {nodo: predecesor}
-
-    # Inicializa las estructuras de datos para la búsqueda desde el objetivo (backward search).
-    # cola_objetivo: Cola de nodos a visitar desde el objetivo (explorando "hacia atrás"). Empieza con el nodo 'objetivo'.
-    cola_objetivo = deque([objetivo])
-    # visitado_objetivo: Diccionario para rastrear los nodos visitados desde el objetivo
-    # y almacenar el predecesor (el nodo desde el que llegamos a este nodo en la búsqueda hacia atrás).
-    visitado_objetivo = {objetivo: None} # {nodo: predecesor}
+    # Estructuras de cada lado. Índice 0 = búsqueda desde el inicio, índice 1 = búsqueda desde el objetivo.
+    # fronteras: Lista con los nodos del último nivel alcanzado por cada lado.
+    fronteras = [[inicio], [objetivo]]
+    # visitados: Diccionarios {nodo: predecesor} de cada lado, necesarios para reconstruir el camino.
+    visitados = [{inicio: None}, {objetivo: None}]
+    # grados: Grado de salida total de cada frontera (cuántas aristas habrá que examinar al expandirla).
+    grados = [len(grafo.get(inicio, ())), len(grafo.get(objetivo, ()))]
+    # Contadores para las estadísticas. Las aristas examinadas se suman una vez por nodo expandido (todos sus
+    # vecinos); los duplicados son las examinadas que no añadieron un nodo a 'visitados'.
+    expandidos = [0, 0]
+    niveles = [0, 0]
+    examinadas = 0
+    pico_frontera = 2
 
     # Variable para almacenar el nodo donde se encuentran las dos búsquedas (la intersección). Inicialmente es None.
     nodo_interseccion = None
 
-    # Inicia el bucle principal. Continúa mientras ambas colas tengan nodos para explorar.
-    # Si alguna cola se vacía antes de encontrar una intersección, significa que no hay camino.
-    while cola_inicio and cola_objetivo:
-        # --- Expansión desde el Inicio ---
-        # Saca el primer nodo de la cola de inicio (FIFO).
-        actual_i = cola_inicio.popleft()
-
-        # Comprueba si el nodo actual de la búsqueda desde el inicio ya ha sido visitado por la búsqueda desde el objetivo.
-        # Esta es la condición de intersección.
-        if actual_i in visitado_objetivo:
-            # Si se encuentra una intersección, guarda el nodo de intersección.
-            nodo_interseccion = actual_i
-            # Rompe el bucle principal porque se ha encontrado un camino.
-            break
+    # Inicia el bucle principal. Continúa mientras ambas fronteras tengan nodos.
+    # Si alguna se vacía antes de encontrar una intersección, significa que no hay camino.
+    while fronteras[0] and fronteras[1] and nodo_interseccion is None:
+        # Elige el lado con menor grado de salida total; en empate, el lado del inicio.
+        lado = 0 if grados[0] <= grados[1] else 1
+        otro = 1 - lado
+        siguiente = []  # Nodos del siguiente nivel de este lado
+        grado_siguiente = 0
 
-        # Explora los vecinos del nodo actual de la búsqueda desde el inicio.
-        for vecino in grafo[actual_i]:
-            # Para cada vecino, comprueba si no ha sido visitado aún por la búsqueda desde el inicio.
-            if vecino not in visitado_inicio:
-                # Si no ha sido visitado, lo marca como visitado desde el inicio, registrando 'actual_i' como su predecesor.
-                visitado_inicio[vecino] = actual_i
-                # Añade el vecino al final de la cola de inicio para su posterior exploración.
-                cola_inicio.append(vecino)
-
-        # --- Expansión desde el Objetivo ---
-        # Saca el primer nodo de la cola del objetivo (FIFO).
-        actual_o = cola_objetivo.popleft()
-
-        # Comprueba si el nodo actual de la búsqueda desde el objetivo ya ha sido visitado por la búsqueda desde el inicio.
-        # Esta es la otra posible condición de intersección.
-        if actual_o in visitado_inicio:
-            # Si se encuentra una intersección, guarda el nodo de intersección.
-            nodo_interseccion = actual_o
-            # Rompe el bucle principal.
-            break
+        # Expande todos los nodos del nivel actual.
+        for actual in fronteras[lado]:
+            expandidos[lado] += 1
+            vecinos = grafo.get(actual, ())
+            if contar:
+                examinadas += len(vecinos)
+            for vecino in vecinos:
+                if vecino not in visitados[lado]:
+                    visitados[lado][vecino] = actual
+                    siguiente.append(vecino)
+                    grado_siguiente += len(grafo.get(vecino, ()))
+                    # Si el otro lado ya alcanzó este vecino, las búsquedas se encontraron.
+                    # Como cada lado tiene sus niveles completos, el primer encuentro da un camino de longitud mínima.
+                    if vecino in visitados[otro]:
+                        nodo_interseccion = vecino
+                        if contar:
+                            examinadas -= len(vecinos) - 1 - vecinos.index(vecino)  # Los que no se llegaron a ver
+                        break
+                # Si el vecino ya fue alcanzado por este lado, se descarta (un duplicado).
+            if nodo_interseccion is not None:
+                break
 
-        # Explora los vecinos del nodo actual de la búsqueda desde el objetivo.
-        for vecino in grafo[actual_o]:
-            # Para cada vecino, comprueba si no ha sido visitado aún por la búsqueda desde el objetivo.
-            if vecino not in visitado_objetivo:
-                # Si no ha sido visitado, lo marca como visitado desde el objetivo, registrando 'actual_o' como su predecesor.
-                visitado_objetivo[vecino] = actual_o
-                # Añade el vecino al final de la cola del objetivo.
-                cola_objetivo.append(vecino)
+        fronteras[lado] = siguiente
+        grados[lado] = grado_siguiente
+        niveles[lado] += 1
+        if contar and len(fronteras[0]) + len(fronteras[1]) > pico_frontera:
+            pico_frontera = len(fronteras[0]) + len(fronteras[1])
+        if informar and nodo_interseccion is None:
+            yield {'expandidos': expandidos[0] + expandidos[1], 'frontera': len(fronteras[0]) + len(fronteras[1]),
+                   'mejor_f': niveles[0] + niveles[1]}
 
-    # Después del bucle principal, verifica si se encontró un nodo de intersección.
-    if nodo_interseccion:
-        # Si se encontró una intersección, reconstruye el camino completo.
+    # Fin de la fase de búsqueda; las estadísticas se vuelcan al retornar, con el tiempo de reconstrucción.
+    t_objetivo = time.perf_counter() if contar else None
+    contadores = dict(expandidos_inicio=expandidos[0], expandidos_objetivo=expandidos[1],
+                      niveles_inicio=niveles[0], niveles_objetivo=niveles[1], aristas_examinadas=examinadas,
+                      duplicados=examinadas - (len(visitados[0]) + len(visitados[1]) - 2), pico_frontera=pico_frontera)
 
+    # Después del bucle principal, verifica si se encontró un nodo de intersección.
+    if nodo_interseccion is not None:
         # --- Reconstrucción del camino desde el inicio hasta la intersección ---
-        # Inicializa una lista para almacenar la primera parte del camino.
         camino = []
-        # Comienza desde el nodo de intersección.
         nodo = nodo_interseccion
-        # Retrocede desde la intersección hasta el inicio usando los predecesores almacenados en 'visitado_inicio'.
+        # Retrocede desde la intersección hasta el inicio usando los predecesores del lado del inicio.
         while nodo is not None:
-            # Añade el nodo actual a la lista (temporalmente estará en orden inverso).
             camino.append(nodo)
-            # Se mueve al predecesor de este nodo en la búsqueda desde el inicio.
-            nodo = visitado_inicio[nodo]
+            nodo = visitados[0][nodo]
         # Invierte la lista para que el camino vaya desde el inicio hasta la intersección.
         camino.reverse()  # Orden correcto: inicio → intersección
 
-        # --- Reconstrucción y unión de la parte desde la intersección hasta el objetivo ---
-        # Comienza desde el predecesor del nodo de intersección en la búsqueda desde el objetivo.
-        # No incluimos el 'nodo_interseccion' de nuevo porque ya está al final de la primera parte del camino.
-        nodo = visitado_objetivo[nodo_interseccion]
-        # Avanza desde el predecesor de la intersección (en la búsqueda hacia atrás) hasta el objetivo
-        # usando los predecesores almacenados en 'visitado_objetivo'.
+        # --- Parte desde la intersección hasta el objetivo ---
+        # Avanza desde el predecesor de la intersección (en la búsqueda hacia atrás) hasta el objetivo.
+        nodo = visitados[1][nodo_interseccion]
         while nodo is not None:
-            # Añade el nodo actual a la lista del camino.
             camino.append(nodo)
-            # Se mueve al predecesor de este nodo en la búsqueda desde el objetivo.
-            nodo = visitado_objetivo[nodo]
+            nodo = visitados[1][nodo]
 
         # Retorna el camino completo combinado.
+        registrar(estadisticas, t0, t_objetivo, **contadores)
         return camino
 
     # Si el bucle principal terminó y no se encontró un nodo de intersección, significa que no hay un camino
     # entre el nodo de inicio y el nodo objetivo en este grafo.
+    registrar(estadisticas, t0, t_objetivo, **contadores)
     return None  # Si no hay conexión entre los nodos
 
+# Construye el índice inverso de un grafo ponderado: para cada nodo, la lista de (predecesor, costo).
+# La búsqueda hacia atrás lo necesita para recorrer las aristas en sentido contrario en grafos dirigidos.
+# Conviene construirlo una vez y reutilizarlo en todas las consultas sobre el mismo grafo.
+def indice_inverso(grafo):
+    inverso = {nodo: [] for nodo in grafo}
+    for nodo, vecinos in grafo.items():
+        for vecino, costo in aristas(vecinos):
+            inverso.setdefault(vecino, []).append((nodo, costo))
+    return inverso
+
+# Define la Búsqueda Bidireccional ponderada (Dijkstra bidireccional).
+# Mantiene dos colas de prioridad: una hacia adelante desde el inicio y otra hacia atrás desde el objetivo
+# (sobre el índice inverso). En cada paso expande el lado cuya frontera es más pequeña.
+# Cada vez que una arista llega a un nodo ya alcanzado por el otro lado se actualiza el mejor costo de encuentro.
+# Condición de parada correcta: cuando la suma de los mínimos de las dos colas es mayor o igual que el mejor
+# costo de encuentro, ningún camino sin explorar puede mejorarlo. (Parar en la primera intersección, como en la
+# versión no ponderada, no garantiza el camino de menor costo.)
+# Recibe:
+# - grafo: Diccionario {nodo: [(vecino, costo)]} o {nodo: {vecino: costo}} con costos no negativos.
+# - inicio, objetivo: Nodos de inicio y objetivo.
+# - inverso: Índice inverso precalculado con indice_inverso(grafo). Si no se da, se construye en la llamada.
+# - estadisticas: Diccionario opcional donde se guardan los nodos asentados de cada lado, las aristas relajadas,
+#                 las inserciones en las colas, el pico de las dos colas juntas y el tiempo de cada fase.
+# Retorna (costo, camino) como busqueda_costo_uniforme, o None si no hay camino.
+def busqueda_bidireccional_ponderada(grafo, inicio, objetivo, inverso=None, estadisticas=None):
+    contar = estadisticas is not None  # Sin 'estadisticas' no se toman tiempos ni se cuentan relajaciones
+    t0 = time.perf_counter() if contar else None
+    if inicio == objetivo:
+        registrar(estadisticas, t0, None, asentados_inicio=0, asentados_objetivo=0, relajadas=0, inserciones=0,
+                  pico_frontera=1)
+        return (0, [inicio])
+    if inverso is None:
+        inverso = indice_inverso(grafo)
+
+    # Estructuras de cada lado: índice 0 = hacia adelante (desde el inicio), 1 = hacia atrás (desde el objetivo).
+    adyacencias = (grafo, inverso)
+    costos = ({inicio: 0}, {objetivo: 0})  # Mejor costo conocido desde la raíz de cada lado
+    padres = ({inicio: None}, {objetivo: None})  # Predecesor de cada nodo en su lado
+    colas = ([(0, inicio)], [(0, objetivo)])  # Colas de prioridad (costo, nodo)
+    asentados = (set(), set())  # Nodos extraídos con costo definitivo
+
+    mejor = float('inf')  # Mejor costo de un camino completo encontrado hasta ahora
+    encuentro = None  # Nodo donde se unen las dos mitades del mejor camino
+    relajadas = 0  # Aristas examinadas al asentar nodos (se suman todas las de cada nodo asentado)
+    inserciones = 2  # Entradas añadidas a las colas, contando las dos raíces
+    pico_frontera = 2
+
+    while colas[0] and colas[1]:
+        # Parada: ningún camino que pase por nodos aún no asentados puede costar menos que 'mejor'.
+        if colas[0][0][0] + colas[1][0][0] >= mejor:
+            break
+        # Expande el lado con la frontera más pequeña.
+        lado = 0 if len(colas[0]) <= len(colas[1]) else 1
+        otro = 1 - lado
+        costo, actual = heapq.heappop(colas[lado])
+        # Descarta entradas obsoletas.
+        if actual in asentados[lado] or costo > costos[lado][actual]:
+            continue
+        asentados[lado].add(actual)
+
+        vecinos = adyacencias[lado].get(actual, ())
+        if contar:
+            relajadas += len(vecinos)
+        for vecino, paso in aristas(vecinos):
+            nuevo_costo = costo + paso
+            if vecino not in costos[lado] or nuevo_costo < costos[lado][vecino]:
+                costos[lado][vecino] = nuevo_costo
+                padres[lado][vecino] = actual
+                heapq.heappush(colas[lado], (nuevo_costo, vecino))
+                if contar:
+                    inserciones += 1
+            # Si el otro lado ya alcanzó este vecino, hay un camino completo que pasa por él.
+            if vecino in costos[otro]:
+                total = costos[lado][vecino] + costos[otro][vecino]
+                if total < mejor:
+                    mejor, encuentro = total, vecino
+        if contar and len(colas[0]) + len(colas[1]) > pico_frontera:
+            pico_frontera = len(colas[0]) + len(colas[1])
+
+    # Fin de la fase de búsqueda; las estadísticas se vuelcan al retornar, con el tiempo de reconstrucción.
+    t_objetivo = time.perf_counter() if contar else None
+    contadores = dict(asentados_inicio=len(asentados[0]), asentados_objetivo=len(asentados[1]), relajadas=relajadas,
+                      inserciones=inserciones, pico_frontera=pico_frontera)
+
+    if encuentro is None:
+        registrar(estadisticas, t0, t_objetivo, **contadores)
+        return None
+    # Une la mitad inicio -> encuentro (padres hacia adelante) con la mitad encuentro -> objetivo (padres hacia atrás).
+    camino, nodo = [], encuentro
+    while nodo is not None:
+        camino.append(nodo)
+        nodo = padres[0][nodo]
+    camino.reverse()
+    nodo = padres[1][encuentro]
+    while nodo is not None:
+        camino.append(nodo)
+        nodo = padres[1][nodo]
+    registrar(estadisticas, t0, t_objetivo, **contadores)
+    return (mejor, camino)
+
 # Este bloque de código solo se ejecuta cuando el script se corre directamente.
 # Contiene un ejemplo de cómo usar la función de búsqueda bidireccional.
 if __name__ == "__main__":
@@ -135,9 +251,25 @@ if __name__ == "__main__":
 
     # Llama a la función de búsqueda bidireccional con el grafo, inicio y objetivo.
     # El resultado (el camino o None) se guarda en la variable 'camino'.
-    camino = busqueda_bidireccional(grafo, inicio, objetivo)
+    contadores = {}
+    camino = busqueda_bidireccional(grafo, inicio, objetivo, contadores)
 
     # Imprime el resultado. Usa una f-string y un operador ternario:
     # Si 'camino' existe (no es None), imprime "Camino encontrado: [lista del camino]".
     # Si 'camino' es None, imprime "No se encontró camino".
-    print(f"Camino encontrado: {camino}" if camino else "No se encontró camino")
\ No newline at end of file
+    print(f"Camino encontrado: {camino}" if camino else "No se encontró camino")
+    # Imprime los contadores de la búsqueda por niveles.
+    print("Contadores:", contadores)
+
+    # Ejemplo de la versión ponderada con el grafo de la búsqueda de costo uniforme.
+    grafo_costos = {
+        'A': [('B', 1), ('C', 4)],
+        'B': [('A', 1), ('D', 5), ('E', 2)],
+        'C': [('A', 4), ('F', 3)],
+        'D': [('B', 5)],
+        'E': [('B', 2), ('F', 1)],
+        'F': [('C', 3), ('E', 1)]
+    }
+    estadisticas = {}
+    print("Bidireccional ponderada:", busqueda_bidireccional_ponderada(grafo_costos, inicio, objetivo, estadisticas=estadisticas))
+    print("Estadísticas:", estadisticas)
@@ -2,6 +2,15 @@
 # 'deque' es una estructura de datos que permite añadir y eliminar elementos eficientemente de ambos extremos,
 # lo que la hace perfecta para actuar como una cola (usando append y popleft) o como una pila (usando append y pop).
 from collections import deque  # Cola doble para manejar FIFO (BFS) o LIFO (DFS)
+# Importa time para medir la duración de cada fase en las estadísticas.
+import time  # Reloj monotónico (perf_counter)
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import agotar, cargar_modulo, registrar  # Búsqueda por pasos, archivos numerados, estadísticas
 
 # Define la función de búsqueda general que puede realizar BFS o DFS.
 # Recibe tres argumentos obligatorios y uno opcional:
@@ -9,10 +18,27 @@ from collections import deque  # Cola doble para manejar FIFO (BFS) o LIFO (DFS)
 # - inicio: El nodo desde el cual comenzar la búsqueda.
 # - objetivo: El nodo que se desea encontrar.
 # - estrategia: Una cadena ('bfs' o 'dfs') para determinar qué algoritmo usar. Por defecto es 'bfs'.
-def busqueda_grafo(grafo, inicio, objetivo, estrategia='bfs'):
+# - estadisticas: Diccionario opcional donde se guardan, al terminar, los contadores de la búsqueda (expandidos,
+#                 generados, duplicados descartados, inserciones en la frontera, pico de la frontera) y el tiempo
+#                 de cada fase (ver registrar en busqueda_comun.py).
+def busqueda_grafo(grafo, inicio, objetivo, estrategia='bfs', estadisticas=None):
+    return agotar(busqueda_grafo_pasos(grafo, inicio, objetivo, estrategia, estadisticas, informar=False))
+
+# Define la búsqueda general (BFS o DFS) por pasos (generador; ver 00012_Busqueda_Por_Pasos.py). Es la
+# implementación de busqueda_grafo. Aquí 'mejor_f' no tiene sentido y vale None.
+def busqueda_grafo_pasos(grafo, inicio, objetivo, estrategia='bfs', estadisticas=None, informar=True):
+    # Contadores para 'estadisticas' (se vuelcan solo al terminar). Como en busqueda_anchura, solo se cuentan y se
+    # toman tiempos si se pidieron, y las inserciones salen del tamaño de 'visitados'.
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    expandidos = generados = 0
+    pico_frontera = 1
+
     # Caso trivial: Si el nodo de inicio es el mismo que el nodo objetivo, ya hemos llegado.
     if inicio == objetivo:
         # Retorna una lista que contiene solo el nodo (el camino es simplemente el nodo).
+        registrar(estadisticas, t0, None, expandidos=0, generados=0, duplicados=0, inserciones=0,
+                  pico_frontera=1)
         return [inicio]  # Caso trivial
 
     # Inicializa la estructura que actuará como cola para BFS o pila para DFS.
@@ -35,6 +61,7 @@ def busqueda_grafo(grafo, inicio, objetivo, estrategia='bfs'):
         # Comprueba si el nodo actual extraído es el objetivo.
         if actual == objetivo:
             # Si es el objetivo, hemos encontrado el camino.
+            t_objetivo = time.perf_counter() if contar else None
             # Inicializa una lista vacía para construir el camino.
             camino = []
             # Retrocede desde el nodo objetivo hasta el inicio usando el diccionario 'visitados'.
@@ -44,13 +71,19 @@ def busqueda_grafo(grafo, inicio, objetivo, estrategia='bfs'):
                 # Se mueve al predecesor de este nodo.
                 actual = visitados[actual]
             # Invierte la lista del camino para que vaya desde el inicio hasta el objetivo.
-            return camino[::-1]  # Invertir para ir de inicio a objetivo
+            camino.reverse()  # Invertir para ir de inicio a objetivo
+            inserciones = len(visitados) - 1  # Cada inserción es un nodo nuevo en 'visitados'
+            registrar(estadisticas, t0, t_objetivo, expandidos=expandidos, generados=generados,
+                      duplicados=generados - inserciones, inserciones=inserciones, pico_frontera=pico_frontera)
+            return camino
 
+        expandidos += 1
         # Explora los vecinos del nodo actual.
         # grafo.get(actual, []) accede a la lista de vecinos del nodo 'actual'.
         # Si 'actual' no existe como clave en 'grafo', devuelve una lista vacía [], evitando un error Key Error.
-        for vecino in grafo.get(actual, []):  # .get() evita errores si no tiene vecinos
-            # Para cada vecino, comprueba si no ha sido visitado aún.
+        vecinos = grafo.get(actual, [])  # .get() evita errores si no tiene vecinos
+        for vecino in vecinos:
+            # Para cada vecino, comprueba si no ha sido visitado aún (si ya lo fue, se descarta).
             if vecino not in visitados:
                 # Si el vecino no ha sido visitado:
                 # Lo marca como visitado y registra 'actual' como su predecesor.
@@ -59,11 +92,69 @@ def busqueda_grafo(grafo, inicio, objetivo, estrategia='bfs'):
                 # El método append() funciona correctamente tanto para colas (donde popleft saca del otro lado)
                 # como para pilas (donde pop saca del mismo lado).
                 cola.append(vecino)  # Mismo método para BFS y DFS
+        if contar:
+            generados += len(vecinos)
+            if len(cola) > pico_frontera:
+                pico_frontera = len(cola)
+        if informar:
+            yield {'expandidos': expandidos, 'frontera': len(cola), 'mejor_f': None}
 
     # Si el bucle 'while cola:' termina (la cola/pila se vació) y no se encontró el objetivo,
     # significa que el objetivo no es alcanzable desde el nodo de inicio.
+    inserciones = len(visitados) - 1
+    registrar(estadisticas, t0, None, expandidos=expandidos, generados=generados, duplicados=generados - inserciones,
+              inserciones=inserciones, pico_frontera=pico_frontera)
     return None  # No se encontró camino
 
+# Define la búsqueda general (BFS o DFS) sobre un problema implícito (protocolo de 00009_Problema_Implicito.py).
+# Igual que busqueda_grafo, con la tabla de visitados indexada por problema.clave(estado):
+# clave -> (clave del padre, estado).
+# Retorna la lista de estados desde el inicial hasta una meta, o None.
+# 'estadisticas' recibe los mismos contadores que en busqueda_grafo, contados como en busqueda_anchura_problema
+# (00001_Busq_De_Anchura.py).
+def busqueda_grafo_problema(problema, estrategia='bfs', estadisticas=None):
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    expandidos = generados = 0
+    pico_frontera = 1
+    inicial = problema.estado_inicial
+    if problema.es_objetivo(inicial):
+        registrar(estadisticas, t0, None, expandidos=0, generados=0, duplicados=0, inserciones=0,
+                  pico_frontera=1)
+        return [inicial]
+    clave_inicial = problema.clave(inicial)
+    cola = deque([(clave_inicial, inicial)])
+    visitados = {clave_inicial: (None, inicial)}
+    while cola:
+        clave, actual = cola.popleft() if estrategia == 'bfs' else cola.pop()
+        if problema.es_objetivo(actual):
+            t_objetivo = time.perf_counter() if contar else None
+            camino = []
+            while clave is not None:
+                clave, estado = visitados[clave]
+                camino.append(estado)
+            inserciones = len(visitados) - 1
+            registrar(estadisticas, t0, t_objetivo, expandidos=expandidos, generados=generados,
+                      duplicados=generados - inserciones, inserciones=inserciones, pico_frontera=pico_frontera)
+            return camino[::-1]
+        sucesores = problema.sucesores(actual)
+        if contar:
+            sucesores = list(sucesores)
+        for vecino, _ in sucesores:
+            clave_vecino = problema.clave(vecino)
+            if clave_vecino not in visitados:
+                visitados[clave_vecino] = (clave, vecino)
+                cola.append((clave_vecino, vecino))
+        if contar:
+            expandidos += 1
+            generados += len(sucesores)
+            if len(cola) > pico_frontera:
+                pico_frontera = len(cola)
+    inserciones = len(visitados) - 1
+    registrar(estadisticas, t0, None, expandidos=expandidos, generados=generados, duplicados=generados - inserciones,
+              inserciones=inserciones, pico_frontera=pico_frontera)
+    return None
+
 # Este bloque de código solo se ejecuta cuando el script se corre directamente.
 # Contiene ejemplos de cómo usar la función 'busqueda_grafo' con ambas estrategias.
 if __name__ == "__main__":
@@ -89,4 +180,11 @@ if __name__ == "__main__":
     # --- Ejemplo de uso para DFS ---
     print("\nDFS (Profundidad):")
     # Llama a la función 'busqueda_grafo' con estrategia 'dfs'.
-    print("Camino:", busqueda_grafo(grafo, inicio, objetivo, 'dfs'))
\ No newline at end of file
+    print("Camino:", busqueda_grafo(grafo, inicio, objetivo, 'dfs'))
+
+    # Jarras de 4 y 3 litros para medir exactamente 2 (Jarras de 00009_Problema_Implicito.py), con las dos
+    # estrategias.
+    implicito = cargar_modulo('00001_Busqueda_No_Info/00009_Problema_Implicito.py')
+    jarras = implicito.Jarras(4, 3, 2)
+    print("Jarras (BFS):", busqueda_grafo_problema(jarras, 'bfs'))
+    print("Jarras (DFS):", busqueda_grafo_problema(jarras, 'dfs'))
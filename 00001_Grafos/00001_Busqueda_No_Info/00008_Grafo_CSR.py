@@ -0,0 +1,420 @@
+# Importa numpy. Lo usamos para guardar el grafo en arreglos compactos (formato CSR) en lugar de
+# diccionarios de listas, que en grafos con millones de nodos ocupan varios GB.
+import numpy as np  # Arreglos compactos para el formato CSR
+# Importa heapq para la cola de prioridad de la búsqueda de costo uniforme.
+import heapq  # Cola de prioridad (min-heap)
+# Importa deque para las colas FIFO de las búsquedas en anchura.
+from collections import deque  # Cola eficiente para BFS
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import aristas  # Pares (vecino, costo) de una lista de adyacencia ponderada
+
+# --- Grafo en formato CSR (Compressed Sparse Row) ---
+# En formato CSR cada nodo recibe un identificador entero 0..n-1 (se hace una sola vez al construir el grafo).
+# Los vecinos de todos los nodos se guardan uno tras otro en un único arreglo 'indices', y el arreglo 'indptr'
+# indica dónde empiezan y terminan los vecinos de cada nodo:
+#   vecinos del nodo i = indices[indptr[i]:indptr[i + 1]]
+# Si las aristas tienen costo, el arreglo 'pesos' es paralelo a 'indices'.
+# Así cada arista ocupa 4-8 bytes en lugar de un objeto de Python, y las búsquedas trabajan con enteros.
+class GrafoCSR:
+    # Método constructor. Recibe los arreglos ya construidos:
+    # - etiquetas: lista con la etiqueta original de cada nodo (etiquetas[i] es el nombre del nodo con id i), o None
+    #              si la etiqueta de cada nodo es su propio id (así no se guarda ninguna lista ni diccionario por nodo).
+    # - indptr: arreglo de n + 1 posiciones con el inicio de los vecinos de cada nodo.
+    # - indices: arreglo con los ids de los vecinos de todos los nodos, uno tras otro.
+    # - pesos: arreglo opcional con el costo de cada arista (paralelo a 'indices').
+    # - formato: forma del diccionario original ('lista', 'tuplas' o 'dict'), usada por la vista compatible.
+    def __init__(self, etiquetas, indptr, indices, pesos=None, formato='lista'):
+        self.etiquetas = None if etiquetas is None else list(etiquetas)  # id -> etiqueta
+        # Diccionario inverso etiqueta -> id. Se construye la primera vez que se consulta (ver indice).
+        self._indice = None
+        self.indptr = np.asarray(indptr, dtype=np.int64)  # Inicio de los vecinos de cada nodo
+        self.indices = np.asarray(indices, dtype=np.int32)  # Vecinos de todos los nodos
+        # Los pesos son opcionales: los grafos no ponderados (BFS/DFS) no los necesitan.
+        self.pesos = None if pesos is None else np.asarray(pesos)
+        self.formato = formato
+
+    # Construye un GrafoCSR a partir de los diccionarios que usan las búsquedas de esta carpeta.
+    # Acepta los tres formatos del repositorio:
+    # - {nodo: [vecino, ...]}                 (BFS, DFS, bidireccional)
+    # - {nodo: [(vecino, costo), ...]}        (costo uniforme)
+    # - {nodo: {vecino: costo, ...}}          (A*, búsqueda voraz)
+    @classmethod
+    def desde_diccionario(cls, grafo):
+        # Detecta el formato mirando la primera lista de vecinos que no esté vacía.
+        formato = 'lista'
+        for vecinos in grafo.values():
+            if isinstance(vecinos, dict):
+                formato = 'dict'
+                break
+            if vecinos:
+                formato = 'tuplas' if isinstance(vecinos[0], tuple) else 'lista'
+                break
+
+        # Reúne todas las etiquetas: las claves del diccionario y los vecinos que no aparecen como clave.
+        # Los grafos no ponderados tienen listas de vecinos; los ponderados, pares (vecino, costo) (ver aristas).
+        etiquetas = dict.fromkeys(grafo)
+        for vecinos in grafo.values():
+            etiquetas.update(dict.fromkeys(vecinos if formato == 'lista' else (v for v, _ in aristas(vecinos))))
+        # Si las etiquetas se pueden ordenar, los ids siguen ese orden. Así, cuando dos entradas del heap
+        # empatan en costo, desempatar por id equivale a desempatar por etiqueta como en la versión con diccionarios.
+        try:
+            etiquetas = sorted(etiquetas)
+        except TypeError:
+            etiquetas = list(etiquetas)
+        indice = {etiqueta: i for i, etiqueta in enumerate(etiquetas)}
+
+        # Recorre el diccionario una única vez llenando los arreglos CSR en el orden original de los vecinos.
+        indptr = np.zeros(len(etiquetas) + 1, dtype=np.int64)
+        indices, pesos = [], []
+        for i, etiqueta in enumerate(etiquetas):
+            vecinos = grafo.get(etiqueta, ())
+            if formato == 'lista':
+                indices.extend(indice[vecino] for vecino in vecinos)
+            else:
+                for vecino, costo in aristas(vecinos):
+                    indices.append(indice[vecino])
+                    pesos.append(costo)
+            indptr[i + 1] = len(indices)
+
+        # Los grafos no ponderados no guardan pesos. El diccionario etiqueta -> id ya construido se reutiliza.
+        csr = cls(etiquetas, indptr, indices, None if formato == 'lista' else pesos, formato)
+        csr._indice = indice
+        return csr
+
+    # Construye un GrafoCSR directamente desde arreglos de aristas (origen, destino[, peso]) con ids enteros,
+    # sin pasar por diccionarios de Python. Es la forma recomendada para grafos de millones de nodos.
+    # - n: número de nodos. Si no se indica, se deduce del id más grande.
+    # - etiquetas: etiquetas opcionales; por defecto la etiqueta de cada nodo es su propio id (etiquetas = None).
+    @classmethod
+    def desde_aristas(cls, origenes, destinos, pesos=None, n=None, etiquetas=None):
+        origenes = np.asarray(origenes, dtype=np.int64)
+        destinos = np.asarray(destinos, dtype=np.int32)
+        if n is None:
+            n = int(max(origenes.max(initial=-1), destinos.max(initial=-1))) + 1
+        # Ordena las aristas por origen. 'stable' conserva el orden relativo de los vecinos de cada nodo.
+        orden = np.argsort(origenes, kind='stable')
+        # Cuenta cuántas aristas salen de cada nodo y acumula para obtener indptr.
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(origenes, minlength=n), out=indptr[1:])
+        pesos = None if pesos is None else np.asarray(pesos)[orden]
+        return cls(etiquetas, indptr, destinos[orden], pesos, 'lista' if pesos is None else 'tuplas')
+
+    # Número de nodos del grafo.
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    # Permite usar 'nodo in grafo' igual que con un diccionario.
+    def __contains__(self, etiqueta):
+        if self.etiquetas is None:
+            return isinstance(etiqueta, (int, np.integer)) and 0 <= etiqueta < len(self)
+        return etiqueta in self._diccionario()
+
+    # Devuelve el id del nodo con esa etiqueta (KeyError si no existe, como un diccionario).
+    def indice(self, etiqueta):
+        if self.etiquetas is None:
+            if etiqueta not in self:
+                raise KeyError(etiqueta)
+            return int(etiqueta)
+        return self._diccionario()[etiqueta]
+
+    # Devuelve la etiqueta del nodo con id 'i'.
+    def etiqueta(self, i):
+        return i if self.etiquetas is None else self.etiquetas[i]
+
+    # Diccionario etiqueta -> id, construido una sola vez y solo para grafos con etiquetas propias.
+    def _diccionario(self):
+        if self._indice is None:
+            self._indice = {etiqueta: i for i, etiqueta in enumerate(self.etiquetas)}
+        return self._indice
+
+    # Devuelve los ids de los vecinos del nodo con id 'i' (una vista del arreglo, sin copiar).
+    def vecinos_id(self, i):
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    # --- Vista compatible con los diccionarios ---
+    # grafo[nodo] devuelve los vecinos en el mismo formato que el diccionario original.
+    # Gracias a esto las funciones originales de esta carpeta (incluidas las recursivas) también aceptan un GrafoCSR
+    # sin cambios, aunque las versiones *_csr de abajo son las que evitan el costo del intérprete.
+    def __getitem__(self, etiqueta):
+        i = self.indice(etiqueta)
+        inicio, fin = self.indptr[i], self.indptr[i + 1]
+        vecinos = self.indices[inicio:fin].tolist()
+        if self.etiquetas is not None:
+            vecinos = [self.etiquetas[j] for j in vecinos]
+        if self.formato == 'lista':
+            return vecinos
+        costos = self.pesos[inicio:fin].tolist()
+        if self.formato == 'dict':
+            return dict(zip(vecinos, costos))
+        return list(zip(vecinos, costos))
+
+    # Equivalente a dict.get: devuelve 'defecto' si el nodo no existe.
+    def get(self, etiqueta, defecto=None):
+        return self[etiqueta] if etiqueta in self else defecto
+
+    # Reconstruye el camino de etiquetas siguiendo 'padres' desde 'destino' hasta la raíz (padre -1).
+    def _camino(self, padres, destino):
+        camino = []
+        while destino != -1:
+            camino.append(destino)
+            destino = int(padres[destino])
+        if self.etiquetas is not None:
+            camino = [self.etiquetas[i] for i in camino]
+        return camino[::-1]
+
+
+# --- Búsqueda en Anchura sobre CSR ---
+# Mismo recorrido que busqueda_anchura: cola FIFO, los vecinos se visitan en el orden del grafo
+# y cada nodo recuerda a su padre. Los visitados son un bytearray (1 byte por nodo) y los padres un arreglo de enteros.
+def busqueda_anchura_csr(grafo, inicio, objetivo):
+    indptr, indices = grafo.indptr, grafo.indices
+    s, t = grafo.indice(inicio), grafo.indice(objetivo)
+    visitados = bytearray(len(grafo))  # 0 = no visitado, 1 = visitado
+    padres = np.full(len(grafo), -1, dtype=np.int64)  # -1 = sin padre
+    visitados[s] = 1
+    cola = deque([s])
+    while cola:
+        actual = cola.popleft()
+        if actual == t:
+            return grafo._camino(padres, actual)
+        # Extrae los vecinos como lista de enteros de una sola vez (mucho más rápido que iterar el arreglo numpy).
+        for vecino in indices[indptr[actual]:indptr[actual + 1]].tolist():
+            if not visitados[vecino]:
+                visitados[vecino] = 1
+                padres[vecino] = actual
+                cola.append(vecino)
+    return None
+
+
+# --- Búsqueda de Costo Uniforme sobre CSR ---
+# Mismo algoritmo que busqueda_costo_uniforme. Retorna (costo, camino) o None.
+# Los costos acumulados se guardan en un arreglo de flotantes inicializado a infinito.
+def busqueda_costo_uniforme_csr(grafo, inicio, objetivo):
+    indptr, indices, pesos = grafo.indptr, grafo.indices, grafo.pesos
+    # Un grafo sin pesos se trata como si todas las aristas costaran 1.
+    if pesos is None:
+        pesos = np.ones(len(indices), dtype=np.int64)
+    s, t = grafo.indice(inicio), grafo.indice(objetivo)
+    costos = np.full(len(grafo), np.inf)  # Costo acumulado de cada nodo
+    padres = np.full(len(grafo), -1, dtype=np.int64)
+    costos[s] = 0
+    cola = [(0, s)]  # (costo acumulado, id del nodo)
+    while cola:
+        costo, actual = heapq.heappop(cola)
+        if actual == t:
+            return (costo, grafo._camino(padres, actual))
+        inicio_v, fin_v = indptr[actual], indptr[actual + 1]
+        for vecino, paso in zip(indices[inicio_v:fin_v].tolist(), pesos[inicio_v:fin_v].tolist()):
+            nuevo_costo = costo + paso
+            if nuevo_costo < costos[vecino]:
+                costos[vecino] = nuevo_costo
+                padres[vecino] = actual
+                heapq.heappush(cola, (nuevo_costo, vecino))
+    return None
+
+
+# --- Búsqueda en Profundidad sobre CSR ---
+# Mismo recorrido que busqueda_profundidad. En lugar de apilar (nodo, camino) se apilan dos listas paralelas
+# (nodo, padre) y el camino se reconstruye con los padres: así no se copia el camino en cada paso.
+def busqueda_profundidad_csr(grafo, inicio, objetivo):
+    indptr, indices = grafo.indptr, grafo.indices
+    t = grafo.indice(objetivo)
+    visitados = bytearray(len(grafo))
+    padres = np.full(len(grafo), -1, dtype=np.int64)
+    pila, pila_padres = [grafo.indice(inicio)], [-1]  # Pilas paralelas: nodo y padre con el que se apiló
+    while pila:
+        actual, padre = pila.pop(), pila_padres.pop()
+        if actual == t:
+            padres[actual] = padre
+            return grafo._camino(padres, actual)
+        if not visitados[actual]:
+            visitados[actual] = 1
+            # El padre se fija la primera vez que el nodo sale de la pila, igual que el camino en la versión original.
+            padres[actual] = padre
+            # Vecinos en orden inverso para que el primero del grafo sea el primero en explorarse.
+            for vecino in indices[indptr[actual]:indptr[actual + 1]][::-1].tolist():
+                if not visitados[vecino]:
+                    pila.append(vecino)
+                    pila_padres.append(actual)
+    return None
+
+
+# --- Búsqueda en Profundidad Limitada sobre CSR ---
+# Mismo recorrido que busqueda_profundidad_limitada, con una tercera pila paralela para la profundidad.
+def busqueda_profundidad_limitada_csr(grafo, inicio, objetivo, limite):
+    indptr, indices = grafo.indptr, grafo.indices
+    t = grafo.indice(objetivo)
+    visitados = bytearray(len(grafo))
+    padres = np.full(len(grafo), -1, dtype=np.int64)
+    pila, pila_padres, pila_prof = [grafo.indice(inicio)], [-1], [0]
+    while pila:
+        actual, padre, profundidad = pila.pop(), pila_padres.pop(), pila_prof.pop()
+        if actual == t:
+            padres[actual] = padre
+            return grafo._camino(padres, actual)
+        if not visitados[actual] and profundidad < limite:
+            visitados[actual] = 1
+            padres[actual] = padre
+            for vecino in indices[indptr[actual]:indptr[actual + 1]][::-1].tolist():
+                if not visitados[vecino]:
+                    pila.append(vecino)
+                    pila_padres.append(actual)
+                    pila_prof.append(profundidad + 1)
+    return None
+
+
+# --- Búsqueda en Profundidad Iterativa sobre CSR ---
+# Devuelve el mismo camino que busqueda_profundidad_iterativa (DLS en árbol con límites crecientes).
+# Diferencias internas:
+# - La DLS usa una pila explícita de (nodo, posición del siguiente vecino) en lugar de recursión.
+# - Se podan las ramas que repiten un nodo del camino actual. Con el límite mínimo ningún camino al objetivo
+#   repite nodos (habría uno más corto), así que el resultado no cambia.
+# - Si en una iteración ninguna rama se cortó por el límite, el objetivo es inalcanzable y se retorna None
+#   (la versión original iteraría para siempre).
+def busqueda_profundidad_iterativa_csr(grafo, inicio, objetivo):
+    indptr, indices = grafo.indptr, grafo.indices
+    s, t = grafo.indice(inicio), grafo.indice(objetivo)
+    if s == t:
+        return [inicio]
+    en_camino = bytearray(len(grafo))  # Marca los nodos de la rama actual
+    limite = 1
+    while True:
+        cortado = False  # ¿Alguna rama quedó sin explorar por el límite?
+        pila, posiciones = [s], [int(indptr[s])]
+        en_camino[s] = 1
+        while pila:
+            actual = pila[-1]
+            if posiciones[-1] < indptr[actual + 1]:
+                # La rama actual ya tiene 'limite' aristas: no se puede bajar más.
+                if len(pila) > limite:
+                    cortado = True
+                    posiciones[-1] = int(indptr[actual + 1])
+                    continue
+                vecino = int(indices[posiciones[-1]])
+                posiciones[-1] += 1
+                if vecino == t:
+                    camino = [grafo.etiqueta(i) for i in pila]
+                    for i in pila:
+                        en_camino[i] = 0
+                    return camino + [objetivo]
+                if not en_camino[vecino]:
+                    en_camino[vecino] = 1
+                    pila.append(vecino)
+                    posiciones.append(int(indptr[vecino]))
+            else:
+                # Todos los vecinos revisados: retrocede.
+                en_camino[pila.pop()] = 0
+                posiciones.pop()
+        if not cortado:
+            return None
+        limite += 1
+
+
+# --- Búsqueda Bidireccional sobre CSR ---
+# Mismo algoritmo que busqueda_bidireccional: expande niveles completos desde el lado cuya frontera tiene
+# menor grado de salida total (se asume un grafo no dirigido). Con CSR el grado de un nodo es indptr[i + 1] - indptr[i].
+def busqueda_bidireccional_csr(grafo, inicio, objetivo):
+    if inicio == objetivo:
+        return [inicio]
+    indptr, indices = grafo.indptr, grafo.indices
+    grados_nodo = np.diff(indptr)  # Grado de salida de cada nodo
+    s, t = grafo.indice(inicio), grafo.indice(objetivo)
+    n = len(grafo)
+    # Padres de cada lado; -2 = no visitado, -1 = raíz.
+    padres = [np.full(n, -2, dtype=np.int64), np.full(n, -2, dtype=np.int64)]
+    padres[0][s], padres[1][t] = -1, -1
+    fronteras = [[s], [t]]
+    grados = [int(grados_nodo[s]), int(grados_nodo[t])]
+    interseccion = -1
+    while fronteras[0] and fronteras[1] and interseccion == -1:
+        lado = 0 if grados[0] <= grados[1] else 1
+        propios, otros = padres[lado], padres[1 - lado]
+        siguiente, grado_siguiente = [], 0
+        for actual in fronteras[lado]:
+            for vecino in indices[indptr[actual]:indptr[actual + 1]].tolist():
+                if propios[vecino] == -2:
+                    propios[vecino] = actual
+                    siguiente.append(vecino)
+                    grado_siguiente += int(grados_nodo[vecino])
+                    if otros[vecino] != -2:
+                        interseccion = vecino
+                        break
+            if interseccion != -1:
+                break
+        fronteras[lado], grados[lado] = siguiente, grado_siguiente
+    if interseccion == -1:
+        return None
+    # Une la mitad inicio -> intersección con la mitad intersección -> objetivo.
+    camino = grafo._camino(padres[0], interseccion)
+    nodo = int(padres[1][interseccion])
+    while nodo != -1:
+        camino.append(grafo.etiqueta(nodo))
+        nodo = int(padres[1][nodo])
+    return camino
+
+
+# --- Búsqueda general (BFS o DFS) sobre CSR ---
+# Mismo algoritmo que busqueda_grafo: 'bfs' usa la estructura como cola y 'dfs' como pila.
+def busqueda_grafo_csr(grafo, inicio, objetivo, estrategia='bfs'):
+    if inicio == objetivo:
+        return [inicio]
+    indptr, indices = grafo.indptr, grafo.indices
+    s, t = grafo.indice(inicio), grafo.indice(objetivo)
+    visitados = bytearray(len(grafo))
+    padres = np.full(len(grafo), -1, dtype=np.int64)
+    visitados[s] = 1
+    cola = deque([s])
+    sacar = cola.popleft if estrategia == 'bfs' else cola.pop
+    while cola:
+        actual = sacar()
+        if actual == t:
+            return grafo._camino(padres, actual)
+        for vecino in indices[indptr[actual]:indptr[actual + 1]].tolist():
+            if not visitados[vecino]:
+                visitados[vecino] = 1
+                padres[vecino] = actual
+                cola.append(vecino)
+    return None
+
+
+# Este bloque de código solo se ejecuta cuando el script se corre directamente.
+# Construye el grafo de ejemplo de las otras búsquedas en formato CSR y ejecuta cada versión.
+if __name__ == "__main__":
+    # Grafo no ponderado de ejemplo (el mismo que usan BFS, DFS, IDDFS y la búsqueda bidireccional).
+    grafo = {
+        'A': ['B', 'C'],
+        'B': ['A', 'D', 'E'],
+        'C': ['A', 'F'],
+        'D': ['B'],
+        'E': ['B', 'F'],
+        'F': ['C', 'E']
+    }
+    # Grafo ponderado de ejemplo (el mismo que usa la búsqueda de costo uniforme).
+    grafo_costos = {
+        'A': [('B', 1), ('C', 4)],
+        'B': [('A', 1), ('D', 5), ('E', 2)],
+        'C': [('A', 4), ('F', 3)],
+        'D': [('B', 5)],
+        'E': [('B', 2), ('F', 1)],
+        'F': [('C', 3), ('E', 1)]
+    }
+
+    # Convierte ambos grafos a CSR una sola vez.
+    csr = GrafoCSR.desde_diccionario(grafo)
+    csr_costos = GrafoCSR.desde_diccionario(grafo_costos)
+    inicio, objetivo = 'A', 'F'
+
+    print("Anchura:", busqueda_anchura_csr(csr, inicio, objetivo))
+    print("Costo uniforme:", busqueda_costo_uniforme_csr(csr_costos, inicio, objetivo))
+    print("Profundidad:", busqueda_profundidad_csr(csr, inicio, objetivo))
+    print("Profundidad limitada (3):", busqueda_profundidad_limitada_csr(csr, inicio, objetivo, 3))
+    print("Profundidad iterativa:", busqueda_profundidad_iterativa_csr(csr, inicio, objetivo))
+    print("Bidireccional:", busqueda_bidireccional_csr(csr, inicio, objetivo))
+    print("Grafo (dfs):", busqueda_grafo_csr(csr, inicio, objetivo, 'dfs'))
+    # La vista compatible permite consultar el grafo CSR como si fuera el diccionario original.
+    print("Vecinos de B:", csr['B'], csr_costos['B'])
@@ -0,0 +1,141 @@
+# --- Problemas con espacio de estados implícito ---
+# Las búsquedas de esta carpeta y de 00002_Busqueda_Informada reciben un diccionario 'grafo' que debe existir
+# completo en memoria antes de buscar. En muchos problemas de planificación el espacio de estados es enorme
+# (10^9 estados o más) y solo se conoce una regla para generar los sucesores de un estado.
+# Para esos casos cada búsqueda tiene una variante '*_problema' que recibe un objeto "problema" con:
+# - estado_inicial: El estado de partida.
+# - sucesores(estado): Generador de pares (estado_siguiente, costo_del_paso). Se consume de forma perezosa,
+#                      así que nunca se construye la lista de todos los sucesores si la búsqueda no la necesita.
+# - es_objetivo(estado): True si el estado es una meta (puede haber muchas metas, no un único nodo objetivo).
+# - clave(estado): Valor hashable y compacto (idealmente un int) que identifica al estado en las tablas de
+#                  visitados. Dos estados iguales deben tener la misma clave.
+# - heuristica(estado): Solo para la búsqueda informada; estimación del costo restante hasta una meta.
+# Las búsquedas no importan ninguna clase de este archivo: basta con que el objeto tenga esos miembros.
+# Las tablas de visitados se indexan por clave y guardan el padre de cada estado generado, de modo que la memoria
+# crece con el número de nodos generados por la búsqueda y no con el tamaño del espacio de estados.
+# Los caminos que retornan las variantes '*_problema' son listas de estados (no de claves).
+
+# Clase base opcional con los valores por defecto del protocolo: la clave es el propio estado y la heurística es
+# nula. estado_inicial, sucesores y es_objetivo los define cada problema.
+class Problema:
+    def clave(self, estado):
+        return estado
+
+    def heuristica(self, estado):
+        return 0
+
+# Adaptador: presenta un grafo explícito como problema, para usar las variantes '*_problema' con los grafos de
+# ejemplo. Acepta los tres formatos del repositorio: {nodo: [vecinos]} (costo 1), {nodo: [(vecino, costo)]}
+# y {nodo: {vecino: costo}}. 'heuristica' es opcional y tiene la firma de siempre, h(nodo, objetivo).
+class ProblemaGrafo(Problema):
+    def __init__(self, grafo, inicio, objetivo, heuristica=None):
+        self.grafo = grafo
+        self.estado_inicial = inicio
+        self.objetivo = objetivo
+        self.h = heuristica
+
+    def sucesores(self, estado):
+        vecinos = self.grafo.get(estado, [])
+        if isinstance(vecinos, dict):
+            yield from vecinos.items()
+            return
+        for vecino in vecinos:
+            yield vecino if isinstance(vecino, tuple) else (vecino, 1)
+
+    def es_objetivo(self, estado):
+        return estado == self.objetivo
+
+    def heuristica(self, estado):
+        return self.h(estado, self.objetivo) if self.h else 0
+
+# Problema de las jarras de agua: dos jarras de capacidades 'a' y 'b' litros, sin marcas. Se puede llenar una
+# jarra, vaciarla o verter una en la otra hasta que la primera se vacíe o la segunda se llene.
+# El estado es (litros en la primera, litros en la segunda); la meta es tener exactamente 'meta' litros en alguna.
+# El costo de cada acción es el número de litros que se mueven (vaciar cuesta lo que se tira). Las acciones que no
+# cambian nada (llenar una jarra llena, vaciar una vacía, verter sin que pase agua) no se generan.
+class Jarras(Problema):
+    def __init__(self, a, b, meta):
+        self.a, self.b, self.meta = a, b, meta
+        self.estado_inicial = (0, 0)
+
+    def sucesores(self, estado):
+        x, y = estado
+        p = min(x, self.b - y)  # Litros que pasan al verter la primera en la segunda
+        q = min(y, self.a - x)  # Litros que pasan al verter la segunda en la primera
+        acciones = (((self.a, y), self.a - x),  # Llenar la primera
+                    ((x, self.b), self.b - y),  # Llenar la segunda
+                    ((0, y), x),  # Vaciar la primera
+                    ((x, 0), y),  # Vaciar la segunda
+                    ((x - p, y + p), p),  # Verter la primera en la segunda
+                    ((x + q, y - q), q))  # Verter la segunda en la primera
+        for siguiente, costo in acciones:
+            if siguiente != estado:
+                yield siguiente, costo
+
+    def es_objetivo(self, estado):
+        return self.meta in estado
+
+    # (x, y) -> un solo entero: x * (b + 1) + y.
+    def clave(self, estado):
+        return estado[0] * (self.b + 1) + estado[1]
+
+# Puzzle deslizante de n x n (8-puzzle para n = 3, 15-puzzle para n = 4, con unos 10^13 estados alcanzables).
+# El estado es una tupla con las fichas fila a fila y 0 en el hueco; cada movimiento cuesta 1.
+# La clave empaqueta cada casilla en 4 bits (n <= 4), así que un estado del 15-puzzle ocupa un solo int de 64 bits.
+# La heurística es la distancia Manhattan de cada ficha a su posición final (admisible).
+# 'meta' cambia la configuración final (por defecto, las fichas en orden con el hueco al final). Una meta
+# inalcanzable, como [0] * (n * n), sirve para recorrer todo el espacio alcanzable; la heurística supone la meta
+# por defecto.
+class PuzzleDeslizante(Problema):
+    def __init__(self, inicial, n=3, meta=None):
+        self.n = n
+        self.estado_inicial = tuple(inicial)
+        self.meta = tuple(list(range(1, n * n)) + [0]) if meta is None else tuple(meta)
+
+    def sucesores(self, estado):
+        n = self.n
+        hueco = estado.index(0)
+        fila, columna = divmod(hueco, n)
+        for df, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            f, c = fila + df, columna + dc
+            if 0 <= f < n and 0 <= c < n:
+                casillas = list(estado)
+                otra = f * n + c
+                casillas[hueco], casillas[otra] = casillas[otra], 0
+                yield tuple(casillas), 1
+
+    def es_objetivo(self, estado):
+        return estado == self.meta
+
+    def clave(self, estado):
+        valor = 0
+        for ficha in estado:
+            valor = (valor << 4) | ficha
+        return valor
+
+    def heuristica(self, estado):
+        n = self.n
+        total = 0
+        for posicion, ficha in enumerate(estado):
+            if ficha:
+                f, c = divmod(posicion, n)
+                fm, cm = divmod(ficha - 1, n)
+                total += abs(f - fm) + abs(c - cm)
+        return total
+
+# Este bloque de código se ejecuta solo cuando el script se corre directamente.
+if __name__ == "__main__":
+    # Las jarras de 4 y 3 litros: los sucesores se generan a medida que se piden.
+    jarras = Jarras(4, 3, 2)
+    print("Sucesores de (0, 0):", list(jarras.sucesores(jarras.estado_inicial)))
+    print("Clave de (4, 2):", jarras.clave((4, 2)))
+
+    # El 15-puzzle: la clave de un estado cabe en un entero de 64 bits.
+    puzzle = PuzzleDeslizante([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 0, 15], n=4)
+    print("Clave del estado inicial:", hex(puzzle.clave(puzzle.estado_inicial)))
+    print("Heurística del estado inicial:", puzzle.heuristica(puzzle.estado_inicial))
+
+    # Un grafo explícito visto como problema.
+    grafo = {'A': ['B', 'C'], 'B': ['D'], 'C': ['D'], 'D': []}
+    problema = ProblemaGrafo(grafo, 'A', 'D')
+    print("Sucesores de A:", list(problema.sucesores('A')))
@@ -0,0 +1,268 @@
+# Importa numpy para guardar las tablas de estados en arreglos de enteros de tamaño fijo.
+import numpy as np  # Arreglos compactos para la tabla hash
+# Importa heapq para las colas de prioridad de UCS y A*.
+import heapq  # Cola de prioridad (min-heap)
+# Importa deque para la cola FIFO de BFS.
+from collections import deque  # Cola eficiente para BFS
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import cargar_modulo  # Carga los archivos numerados por ruta
+
+# --- Estados compactos ---
+# Con el protocolo de problemas implícitos (00009_Problema_Implicito.py), las búsquedas guardan en 'visitados'
+# y 'padres' los estados completos: una tupla de 9 casillas del 8-puzzle ocupa ~120 bytes, y con la entrada del
+# diccionario, la tupla (padre, estado) y la clave, cada estado generado cuesta unos 300-400 bytes.
+# Aquí cada estado se codifica en un entero de ancho fijo (un codificador) y la lista de cerrados es una tabla hash
+# de direccionamiento abierto sobre arreglos de numpy: por estado guarda solo su código, el código del padre, un
+# byte de ocupación y, si hace falta, el costo acumulado (8 + 8 + 1 + 8 bytes por ranura). Los estados se reconstruyen decodificando.
+# A cambio, cada consulta a la tabla es algo más lenta que en un diccionario (bucle de Python sobre numpy).
+
+# Codificador de tuplas de longitud fija con enteros pequeños no negativos (tableros, vectores de contadores...).
+# Cada elemento ocupa 'bits' bits y el código cabe en 64 bits, así que se guarda en un uint64 (un tablero del
+# 15-puzzle ocupa exactamente 16 x 4 = 64 bits).
+class CodificadorTupla:
+    def __init__(self, longitud, bits):
+        if longitud * bits > 64:
+            raise ValueError("El estado no cabe en 64 bits")
+        self.longitud = longitud
+        self.bits = bits
+        self.mascara = (1 << bits) - 1
+        # Desplazamiento de cada elemento dentro del código (el primero ocupa los bits más altos).
+        self.desplazamientos = tuple(bits * (longitud - 1 - i) for i in range(longitud))
+
+    def codificar(self, estado):
+        codigo = 0
+        for valor in estado:
+            codigo = (codigo << self.bits) | valor
+        return codigo
+
+    def decodificar(self, codigo):
+        mascara = self.mascara
+        return tuple((codigo >> d) & mascara for d in self.desplazamientos)
+
+    # El mismo código como 'bytes' de ancho fijo (por ejemplo, para escribirlo a disco o usarlo como clave externa).
+    def a_bytes(self, codigo):
+        return codigo.to_bytes((self.longitud * self.bits + 7) // 8, 'little')
+
+    def desde_bytes(self, datos):
+        return int.from_bytes(datos, 'little')
+
+# Codificador de posiciones (fila, columna) en una cuadrícula de 'columnas' columnas: fila * columnas + columna.
+class CodificadorCuadricula:
+    def __init__(self, columnas):
+        self.columnas = columnas
+
+    def codificar(self, estado):
+        return estado[0] * self.columnas + estado[1]
+
+    def decodificar(self, codigo):
+        return divmod(codigo, self.columnas)
+
+# Tabla hash de direccionamiento abierto (sondeo lineal) con claves enteras de hasta 64 bits.
+# - claves: uint64. Cualquier valor de 64 bits es una clave válida, así que no hay un valor reservado para las
+#   ranuras libres: las marca el arreglo 'ocupadas'.
+# - ocupadas: bool, True en las ranuras que guardan una clave.
+# - padres: uint64, el código del padre de cada estado (el estado inicial es su propio padre).
+# - costos: float64, solo si 'con_costo' (UCS y A*).
+# La capacidad es siempre una potencia de 2 y se duplica al superar 'carga_maxima'.
+# No admite borrados: en una lista de cerrados los estados solo se añaden o se actualizan.
+class TablaHashAbierta:
+    MASCARA = (1 << 64) - 1
+    # Constante multiplicativa de Fibonacci (2^64 / razón áurea): reparte bien claves consecutivas.
+    MULTIPLICADOR = 0x9E3779B97F4A7C15
+
+    def __init__(self, capacidad=1024, con_costo=False, carga_maxima=0.75):
+        self.con_costo = con_costo
+        self.carga_maxima = carga_maxima
+        self.n = 0
+        self._reservar(max(8, 1 << (capacidad - 1).bit_length()))
+
+    def _reservar(self, capacidad):
+        self.capacidad = capacidad
+        self.desplazamiento = 64 - (capacidad.bit_length() - 1)  # Bits altos del producto = índice de ranura
+        self.claves = np.zeros(capacidad, dtype=np.uint64)
+        self.ocupadas = np.zeros(capacidad, dtype=np.bool_)
+        self.padres = np.zeros(capacidad, dtype=np.uint64)
+        self.costos = np.zeros(capacidad, dtype=np.float64) if self.con_costo else None
+
+    # Ranura donde está 'clave' o, si no está, la ranura libre donde iría.
+    def _ranura(self, clave):
+        i = ((clave * self.MULTIPLICADOR) & self.MASCARA) >> self.desplazamiento
+        claves, ocupadas = self.claves, self.ocupadas
+        mascara = self.capacidad - 1
+        while ocupadas[i] and claves[i] != clave:
+            i = (i + 1) & mascara
+        return i
+
+    def _crecer(self):
+        claves, padres, costos = self.claves, self.padres, self.costos
+        ocupadas = np.nonzero(self.ocupadas)[0]
+        self._reservar(self.capacidad * 2)
+        for j in ocupadas:
+            i = self._ranura(int(claves[j]))
+            self.claves[i] = claves[j]
+            self.ocupadas[i] = True
+            self.padres[i] = padres[j]
+            if costos is not None:
+                self.costos[i] = costos[j]
+
+    def __len__(self):
+        return self.n
+
+    def __contains__(self, clave):
+        return bool(self.ocupadas[self._ranura(clave)])
+
+    # Inserta 'clave' o actualiza su padre y su costo. Retorna True si la clave era nueva.
+    def guardar(self, clave, padre, costo=0.0):
+        i = self._ranura(clave)
+        nueva = not self.ocupadas[i]
+        if nueva:
+            if (self.n + 1) > self.carga_maxima * self.capacidad:
+                self._crecer()
+                i = self._ranura(clave)
+            self.claves[i] = clave
+            self.ocupadas[i] = True
+            self.n += 1
+        self.padres[i] = padre
+        if self.con_costo:
+            self.costos[i] = costo
+        return nueva
+
+    def padre(self, clave):
+        return int(self.padres[self._ranura(clave)])
+
+    # Costo guardado para 'clave', o infinito si la clave no está.
+    def costo(self, clave):
+        i = self._ranura(clave)
+        return float(self.costos[i]) if self.ocupadas[i] else float('inf')
+
+    # Memoria ocupada por los arreglos de la tabla, en bytes.
+    def bytes_usados(self):
+        total = self.claves.nbytes + self.ocupadas.nbytes + self.padres.nbytes
+        return total + (self.costos.nbytes if self.costos is not None else 0)
+
+    # Reconstruye la lista de códigos desde el estado inicial (su propio padre) hasta 'clave'.
+    def camino(self, clave):
+        codigos = [clave]
+        padre = self.padre(clave)
+        while padre != codigos[-1]:
+            codigos.append(padre)
+            padre = self.padre(padre)
+        return codigos[::-1]
+
+# Define la búsqueda en anchura sobre estados compactos.
+# Igual que busqueda_anchura_problema (00001_Busq_De_Anchura.py), pero la cola guarda códigos (enteros) y la lista de
+# cerrados es una TablaHashAbierta. Los estados se decodifican solo para generar sus sucesores.
+# Recibe:
+# - problema: Objeto con estado_inicial, sucesores(estado) y es_objetivo(estado) (ver 00009_Problema_Implicito.py).
+# - codificador: Objeto con codificar(estado) -> int y decodificar(int) -> estado.
+# - tabla: TablaHashAbierta a usar (por defecto, una nueva). Al terminar contiene todos los estados generados.
+# Retorna la lista de estados desde el inicial hasta una meta, o None.
+def busqueda_anchura_compacta(problema, codificador, tabla=None):
+    tabla = TablaHashAbierta() if tabla is None else tabla
+    inicio = codificador.codificar(problema.estado_inicial)
+    tabla.guardar(inicio, inicio)
+    cola = deque([inicio])
+    while cola:
+        actual = cola.popleft()
+        estado = codificador.decodificar(actual)
+        if problema.es_objetivo(estado):
+            return [codificador.decodificar(c) for c in tabla.camino(actual)]
+        for vecino, _ in problema.sucesores(estado):
+            codigo = codificador.codificar(vecino)
+            if codigo not in tabla:
+                tabla.guardar(codigo, actual)
+                cola.append(codigo)
+    return None
+
+# Define la búsqueda de costo uniforme sobre estados compactos.
+# Igual que busqueda_costo_uniforme_problema (00002_Busq_De_Anch_Costo_Uniform.py): la frontera guarda
+# (costo, código) y la tabla guarda el padre y el mejor costo conocido de cada código.
+# Retorna (costo, camino de estados) o None.
+def busqueda_costo_uniforme_compacta(problema, codificador, tabla=None):
+    tabla = TablaHashAbierta(con_costo=True) if tabla is None else tabla
+    inicio = codificador.codificar(problema.estado_inicial)
+    tabla.guardar(inicio, inicio, 0)
+    frontera = [(0, inicio)]
+    while frontera:
+        costo, actual = heapq.heappop(frontera)
+        if costo > tabla.costo(actual):
+            continue
+        estado = codificador.decodificar(actual)
+        if problema.es_objetivo(estado):
+            return (costo, [codificador.decodificar(c) for c in tabla.camino(actual)])
+        for vecino, paso in problema.sucesores(estado):
+            nuevo_costo = costo + paso
+            codigo = codificador.codificar(vecino)
+            if nuevo_costo < tabla.costo(codigo):
+                tabla.guardar(codigo, actual, nuevo_costo)
+                heapq.heappush(frontera, (nuevo_costo, codigo))
+    return None
+
+# Define A* sobre estados compactos.
+# Igual que a_star_problema (00003_Busq_A*_AO*.py en 00002_Busqueda_Informada): la frontera guarda (f, g, código),
+# la tabla guarda el padre y el mejor g de cada código, y h(n) es problema.heuristica(estado).
+# Retorna (camino de estados, costo) o (None, None).
+def a_star_compacto(problema, codificador, tabla=None):
+    tabla = TablaHashAbierta(con_costo=True) if tabla is None else tabla
+    inicial = problema.estado_inicial
+    inicio = codificador.codificar(inicial)
+    tabla.guardar(inicio, inicio, 0)
+    frontera = [(problema.heuristica(inicial), 0, inicio)]
+    while frontera:
+        _, g, actual = heapq.heappop(frontera)
+        if g > tabla.costo(actual):
+            continue
+        estado = codificador.decodificar(actual)
+        if problema.es_objetivo(estado):
+            return [codificador.decodificar(c) for c in tabla.camino(actual)], g
+        for vecino, costo in problema.sucesores(estado):
+            g_tentativo = g + costo
+            codigo = codificador.codificar(vecino)
+            if g_tentativo < tabla.costo(codigo):
+                tabla.guardar(codigo, actual, g_tentativo)
+                heapq.heappush(frontera, (g_tentativo + problema.heuristica(vecino), g_tentativo, codigo))
+    return None, None
+
+# Este bloque de código se ejecuta solo cuando el script se corre directamente.
+if __name__ == "__main__":
+    import tracemalloc
+
+    # 8-puzzle como problema implícito (PuzzleDeslizante de 00009_Problema_Implicito.py).
+    Puzzle8 = cargar_modulo('00001_Busqueda_No_Info/00009_Problema_Implicito.py').PuzzleDeslizante
+
+    codificador = CodificadorTupla(9, 4)  # 9 casillas de 4 bits: 36 bits por estado
+    puzzle = Puzzle8([8, 6, 7, 2, 5, 4, 3, 0, 1])
+
+    camino, costo = a_star_compacto(puzzle, codificador)
+    print("A* compacto:", costo, "movimientos")
+    print("UCS compacta:", busqueda_costo_uniforme_compacta(Puzzle8([1, 2, 3, 4, 0, 6, 7, 5, 8]), codificador)[0],
+          "movimientos")
+
+    # BFS sobre todo el espacio alcanzable (la meta imposible fuerza a recorrerlo entero: 181440 estados).
+    tabla = TablaHashAbierta()
+    busqueda_anchura_compacta(Puzzle8(puzzle.estado_inicial, meta=[0] * 9), codificador, tabla)
+    print(f"Estados alcanzables: {len(tabla)}, tabla compacta: {tabla.bytes_usados() / len(tabla):.0f} bytes por estado")
+
+    # La misma lista de cerrados como en busqueda_anchura_problema: {clave: (clave del padre, estado)},
+    # medida sobre una muestra de 20000 estados.
+    tracemalloc.start()
+    ocupadas = tabla.claves[tabla.ocupadas][:20000]
+    diccionario = {int(c): (tabla.padre(int(c)), codificador.decodificar(int(c))) for c in ocupadas}
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"Diccionario de tuplas: {memoria / len(diccionario):.0f} bytes por estado")
+
+    # Un tablero del 15-puzzle ocupa los 64 bits enteros del código (con la ficha 15 en la primera casilla, el bit
+    # más alto está encendido).
+    codificador_15 = CodificadorTupla(16, 4)
+    tablero = (15, 14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1, 0)
+    codigo = codificador_15.codificar(tablero)
+    tabla_15 = TablaHashAbierta()
+    tabla_15.guardar(codigo, codigo)
+    print(f"15-puzzle: código {codigo:#x}, en la tabla: {codigo in tabla_15},",
+          "decodificado igual:", codificador_15.decodificar(codigo) == tablero)
@@ -0,0 +1,238 @@
+# Importa numpy para leer y escribir los niveles como arreglos de códigos (uint64) en disco.
+import numpy as np  # Arreglos de códigos y memmap
+# Importa os, glob, json y time para los archivos de cada nivel, el manifiesto y las estadísticas.
+import os  # Rutas y reemplazo atómico del manifiesto
+import glob  # Localiza las corridas de un nivel
+import json  # Manifiesto para reanudar la búsqueda
+import time  # Tiempo por nivel
+# Importa sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import cargar_modulo  # Carga los archivos numerados por ruta
+
+# --- Búsqueda en anchura en memoria externa ---
+# Para enumerar espacios de estados que no caben en memoria, la búsqueda en anchura se hace nivel a nivel y cada
+# nivel vive en disco como un archivo de códigos (ver los codificadores de 00010_Estados_Compactos.py) ordenados y
+# sin repetidos. En memoria solo hay, en cada momento, un bloque de códigos.
+# Expandir el nivel k:
+# 1. Se lee el archivo del nivel k por bloques (memmap) y se generan los sucesores de cada estado.
+# 2. Los códigos generados se acumulan en un búfer; cuando llega a 'max_memoria' códigos se ordena, se eliminan sus
+#    repetidos y se escribe a disco como una "corrida".
+# 3. Las corridas se mezclan (mezcla de k vías por ventanas) junto con los niveles anteriores: un código pasa al
+#    nivel k+1 solo si aparece en alguna corrida y en ninguno de esos niveles (detección de duplicados diferida).
+# En un problema reversible (grafo no dirigido) los sucesores de un estado del nivel k solo pueden estar en los
+# niveles k-1, k o k+1, así que basta comparar contra los dos niveles anteriores. Si el problema es dirigido hay
+# que comparar contra todos ('niveles_previos=None'), con más lectura de disco.
+# Tras completar cada nivel se reescribe un manifiesto JSON (de forma atómica): si el proceso se interrumpe,
+# volver a llamar a la función con el mismo directorio continúa desde el último nivel completo.
+
+NOMBRE_MANIFIESTO = 'manifiesto.json'
+
+# Ruta del archivo con los códigos del nivel 'k'.
+def _archivo_nivel(directorio, k):
+    return os.path.join(directorio, f'nivel_{k:05d}.bin')
+
+# Abre un archivo de códigos como memmap de solo lectura (un archivo vacío no se puede mapear).
+def _leer_codigos(ruta):
+    if os.path.getsize(ruta) == 0:
+        return np.empty(0, dtype=np.uint64)
+    return np.memmap(ruta, dtype=np.uint64, mode='r')
+
+# Escribe el manifiesto en un archivo temporal y lo renombra: nunca queda un manifiesto a medio escribir.
+def _guardar_manifiesto(directorio, manifiesto):
+    ruta = os.path.join(directorio, NOMBRE_MANIFIESTO)
+    with open(ruta + '.tmp', 'w') as archivo:
+        json.dump(manifiesto, archivo, indent=1)
+    os.replace(ruta + '.tmp', ruta)
+
+# Mezcla las fuentes ordenadas y sin repetidos (memmaps) por ventanas de como máximo 'bloque' códigos por fuente.
+# En cada paso, el límite de la ventana es el menor de los últimos códigos de los bloques de las fuentes activas;
+# todo lo que es <= límite se puede resolver ya, porque ninguna fuente tiene más códigos menores que él.
+# Genera arreglos ordenados con los códigos que aparecen en 'nuevas' y no en 'previas', y suma a 'estadisticas'
+# los bytes leídos.
+def _mezclar(nuevas, previas, bloque, estadisticas):
+    fuentes = nuevas + previas
+    es_nueva = [True] * len(nuevas) + [False] * len(previas)
+    posiciones = [0] * len(fuentes)
+    while True:
+        activas = [i for i, fuente in enumerate(fuentes) if posiciones[i] < len(fuente)]
+        if not any(es_nueva[i] for i in activas):
+            return
+        limite = min(fuentes[i][min(posiciones[i] + bloque, len(fuentes[i])) - 1] for i in activas)
+        trozos_nuevos, trozos_previos = [], []
+        for i in activas:
+            ventana = fuentes[i][posiciones[i]:posiciones[i] + bloque]
+            fin = int(np.searchsorted(ventana, limite, side='right'))
+            trozo = np.asarray(ventana[:fin])
+            estadisticas['bytes_leidos'] += trozo.nbytes
+            (trozos_nuevos if es_nueva[i] else trozos_previos).append(trozo)
+            posiciones[i] += fin
+        if not trozos_nuevos:
+            continue
+        codigos = np.unique(np.concatenate(trozos_nuevos))
+        if trozos_previos:
+            codigos = codigos[~np.isin(codigos, np.concatenate(trozos_previos), assume_unique=True)]
+        yield codigos
+
+# Define la búsqueda en anchura en memoria externa.
+# Recibe:
+# - problema: Objeto con estado_inicial, sucesores(estado) y es_objetivo(estado) (ver 00009_Problema_Implicito.py).
+# - codificador: Objeto con codificar(estado) -> int (0 <= código < 2^64, se guarda como uint64) y
+#                decodificar(int) -> estado.
+# - directorio: Carpeta donde se guardan los niveles, las corridas y el manifiesto. Si ya contiene un manifiesto,
+#               la búsqueda se reanuda desde el último nivel completo.
+# - max_memoria: Códigos que se acumulan en memoria antes de escribir una corrida.
+# - bloque: Códigos que se leen a la vez de cada archivo al expandir y al mezclar.
+# - niveles_previos: Niveles anteriores contra los que se eliminan duplicados (2 para problemas reversibles;
+#                    None para todos).
+# - max_niveles: Si se indica, se detiene tras completar ese número de niveles nuevos (se puede reanudar luego).
+# Retorna el manifiesto: un diccionario con
+# - 'niveles': número de estados de cada nivel (la distancia en pasos desde el estado inicial).
+# - 'terminado': True si se recorrió todo el espacio alcanzable o se encontró una meta.
+# - 'meta': None o {'nivel': profundidad, 'codigo': código de la primera meta encontrada}.
+# - 'estadisticas': por nivel, estados generados, corridas, bytes leídos y escritos, y segundos.
+def busqueda_anchura_externa(problema, codificador, directorio, max_memoria=1_000_000, bloque=100_000,
+                             niveles_previos=2, max_niveles=None):
+    os.makedirs(directorio, exist_ok=True)
+    ruta_manifiesto = os.path.join(directorio, NOMBRE_MANIFIESTO)
+    if os.path.exists(ruta_manifiesto):
+        with open(ruta_manifiesto) as archivo:
+            manifiesto = json.load(archivo)
+        if manifiesto['niveles_previos'] != niveles_previos:
+            raise ValueError("El directorio contiene una búsqueda con otro valor de 'niveles_previos'")
+    else:
+        # Nivel 0: el estado inicial.
+        inicial = problema.estado_inicial
+        np.array([codificador.codificar(inicial)], dtype=np.uint64).tofile(_archivo_nivel(directorio, 0))
+        manifiesto = {'niveles': [1], 'niveles_previos': niveles_previos, 'terminado': False, 'meta': None,
+                      'estadisticas': []}
+        if problema.es_objetivo(inicial):
+            manifiesto['terminado'] = True
+            manifiesto['meta'] = {'nivel': 0, 'codigo': codificador.codificar(inicial)}
+        _guardar_manifiesto(directorio, manifiesto)
+
+    completados = 0
+    while not manifiesto['terminado'] and (max_niveles is None or completados < max_niveles):
+        k = len(manifiesto['niveles']) - 1  # Último nivel completo: se expande para obtener el nivel k + 1
+        # Borra lo que haya dejado un intento interrumpido de construir el nivel k + 1.
+        for ruta in glob.glob(os.path.join(directorio, f'corrida_{k + 1:05d}_*.bin')):
+            os.remove(ruta)
+        if os.path.exists(_archivo_nivel(directorio, k + 1)):
+            os.remove(_archivo_nivel(directorio, k + 1))
+
+        inicio_nivel = time.perf_counter()
+        estadisticas = {'nivel': k + 1, 'generados': 0, 'corridas': 0, 'bytes_leidos': 0, 'bytes_escritos': 0}
+        meta = None
+
+        # 1 y 2: expandir el nivel k por bloques y volcar los sucesores en corridas ordenadas.
+        def volcar(bufer):
+            corrida = np.unique(np.array(bufer, dtype=np.uint64))
+            corrida.tofile(os.path.join(directorio, f'corrida_{k + 1:05d}_{estadisticas["corridas"]:05d}.bin'))
+            estadisticas['corridas'] += 1
+            estadisticas['bytes_escritos'] += corrida.nbytes
+
+        actual = _leer_codigos(_archivo_nivel(directorio, k))
+        bufer = []
+        for desde in range(0, len(actual), bloque):
+            codigos = np.asarray(actual[desde:desde + bloque])
+            estadisticas['bytes_leidos'] += codigos.nbytes
+            for codigo in codigos.tolist():
+                for vecino, _ in problema.sucesores(codificador.decodificar(codigo)):
+                    if meta is None and problema.es_objetivo(vecino):
+                        meta = codificador.codificar(vecino)
+                    bufer.append(codificador.codificar(vecino))
+                    if len(bufer) >= max_memoria:
+                        estadisticas['generados'] += len(bufer)
+                        volcar(bufer)
+                        bufer = []
+        estadisticas['generados'] += len(bufer)
+        if bufer:
+            volcar(bufer)
+        del actual
+
+        # 3: mezclar las corridas contra los niveles anteriores y escribir el nivel k + 1.
+        corridas = [_leer_codigos(ruta)
+                    for ruta in sorted(glob.glob(os.path.join(directorio, f'corrida_{k + 1:05d}_*.bin')))]
+        primero = 0 if niveles_previos is None else max(0, k + 1 - niveles_previos)
+        previos = [_leer_codigos(_archivo_nivel(directorio, j)) for j in range(primero, k + 1)]
+        nuevos = 0
+        with open(_archivo_nivel(directorio, k + 1), 'wb') as archivo:
+            for codigos in _mezclar(corridas, previos, bloque, estadisticas):
+                codigos.tofile(archivo)
+                nuevos += len(codigos)
+                estadisticas['bytes_escritos'] += codigos.nbytes
+        del corridas, previos
+        for ruta in glob.glob(os.path.join(directorio, f'corrida_{k + 1:05d}_*.bin')):
+            os.remove(ruta)
+
+        estadisticas['nuevos'] = nuevos
+        estadisticas['segundos'] = round(time.perf_counter() - inicio_nivel, 4)
+        manifiesto['estadisticas'].append(estadisticas)
+        if meta is not None:
+            manifiesto['niveles'].append(nuevos)
+            manifiesto['meta'] = {'nivel': k + 1, 'codigo': meta}
+            manifiesto['terminado'] = True
+        elif nuevos == 0:
+            # Ningún estado nuevo: se recorrió todo el espacio alcanzable (el nivel vacío no se guarda).
+            os.remove(_archivo_nivel(directorio, k + 1))
+            manifiesto['terminado'] = True
+        else:
+            manifiesto['niveles'].append(nuevos)
+        _guardar_manifiesto(directorio, manifiesto)
+        completados += 1
+    return manifiesto
+
+# Reconstruye el camino hasta una meta encontrada por busqueda_anchura_externa.
+# Los niveles no guardan padres (duplicarían el espacio en disco), así que se recorre cada nivel hacia atrás
+# buscando un estado que tenga como sucesor al último estado del camino. Cuesta una lectura de cada nivel.
+# Retorna la lista de estados desde el inicial hasta la meta del manifiesto, o None si no hay meta.
+def camino_externo(problema, codificador, directorio, bloque=100_000):
+    with open(os.path.join(directorio, NOMBRE_MANIFIESTO)) as archivo:
+        manifiesto = json.load(archivo)
+    if manifiesto['meta'] is None:
+        return None
+    buscado = manifiesto['meta']['codigo']
+    camino = [codificador.decodificar(buscado)]
+    for k in range(manifiesto['meta']['nivel'] - 1, -1, -1):
+        nivel = _leer_codigos(_archivo_nivel(directorio, k))
+        padre = None
+        for desde in range(0, len(nivel), bloque):
+            for codigo in np.asarray(nivel[desde:desde + bloque]).tolist():
+                estado = codificador.decodificar(codigo)
+                if any(codificador.codificar(vecino) == buscado for vecino, _ in problema.sucesores(estado)):
+                    padre = codigo
+                    break
+            if padre is not None:
+                break
+        buscado = padre
+        camino.append(codificador.decodificar(padre))
+    return camino[::-1]
+
+# Este bloque de código se ejecuta solo cuando el script se corre directamente.
+if __name__ == "__main__":
+    import tempfile
+
+    # 8-puzzle como problema implícito (PuzzleDeslizante de 00009_Problema_Implicito.py) y su codificador de
+    # 9 casillas de 4 bits (CodificadorTupla de 00010_Estados_Compactos.py).
+    Puzzle8 = cargar_modulo('00001_Busqueda_No_Info/00009_Problema_Implicito.py').PuzzleDeslizante
+    codificador = cargar_modulo('00001_Busqueda_No_Info/00010_Estados_Compactos.py').CodificadorTupla(9, 4)
+    with tempfile.TemporaryDirectory() as directorio:
+        # Enumera todo el espacio alcanzable (meta imposible) con solo 20000 códigos en memoria por corrida.
+        # Se interrumpe a propósito tras 12 niveles y se reanuda con una segunda llamada.
+        puzzle = Puzzle8([1, 2, 3, 4, 5, 6, 7, 8, 0], meta=[0] * 9)
+        parcial = busqueda_anchura_externa(puzzle, codificador, directorio, max_memoria=20000, bloque=20000,
+                                           max_niveles=12)
+        print("Niveles tras la interrupción:", len(parcial['niveles']), "terminado:", parcial['terminado'])
+        final = busqueda_anchura_externa(puzzle, codificador, directorio, max_memoria=20000, bloque=20000)
+        print("Estados alcanzables:", sum(final['niveles']), "en", len(final['niveles']), "niveles")
+        for fila in final['estadisticas'][-4:]:
+            print(fila)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        # Con una meta: se detiene en el nivel donde aparece y reconstruye el camino leyendo los niveles hacia atrás.
+        puzzle = Puzzle8([1, 2, 3, 4, 0, 6, 7, 5, 8], meta=[1, 2, 3, 4, 5, 6, 7, 8, 0])
+        resultado = busqueda_anchura_externa(puzzle, codificador, directorio)
+        print("Meta en el nivel", resultado['meta']['nivel'], "camino:",
+              camino_externo(puzzle, codificador, directorio))
@@ -0,0 +1,121 @@
+# Importa time para medir los presupuestos de tiempo de cada paso.
+import time  # Reloj monotónico (perf_counter)
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import cargar_modulo  # Carga los archivos numerados por ruta
+
+# --- Búsquedas por pasos ---
+# Cada archivo de búsqueda tiene una versión generadora '*_pasos' (busqueda_anchura_pasos,
+# busqueda_costo_uniforme_pasos, a_star_pasos, busqueda_a_estrella_pasos, busqueda_voraz_pasos, ...).
+# Cada next() expande un nodo y entrega un diccionario de progreso {'expandidos', 'frontera', 'mejor_f'} (qué es
+# 'mejor_f' lo dice el comentario de cada generador); al terminar, el resultado de la búsqueda llega como valor de
+# StopIteration.
+# Un generador ya es una búsqueda suspendida: mientras nadie llame a next(), su frontera y sus tablas quedan
+# congeladas en memoria, y la siguiente llamada continúa exactamente donde se quedó.
+# El generador es la única implementación de cada búsqueda: la función normal (busqueda_anchura, a_star, ...) lo
+# crea con informar=False, con lo que no entrega progreso y la búsqueda entera corre dentro del primer next(), y lo
+# agota con agotar() de busqueda_comun.py. Así no se paga un yield por expansión y las dos versiones no pueden
+# separarse. Los generadores aceptan además el diccionario 'estadisticas' de su función normal, si esta lo tiene.
+# MotorBusqueda envuelve uno de esos generadores para avanzarlo con presupuestos de nodos y de tiempo, de modo que
+# un bucle de eventos pueda intercalar muchas búsquedas sin que ninguna se pase de su latencia.
+
+# Motor de una búsqueda por pasos.
+# - generador: El generador de una búsqueda '*_pasos' (ya creado, con sus argumentos).
+# Atributos:
+# - progreso: El último diccionario de progreso entregado.
+# - terminado: True cuando la búsqueda terminó (con o sin éxito).
+# - resultado: El resultado de la búsqueda (el mismo que retorna la función normal) una vez terminada.
+# - segundos: Tiempo total dedicado a esta búsqueda en todos los pasos.
+class MotorBusqueda:
+    def __init__(self, generador):
+        self.generador = generador
+        self.progreso = {'expandidos': 0, 'frontera': 0, 'mejor_f': None}
+        self.terminado = False
+        self.resultado = None
+        self.segundos = 0.0
+
+    # Avanza la búsqueda hasta 'max_nodos' expansiones o hasta agotar 'max_segundos' (None = sin límite).
+    # El tiempo se comprueba tras cada expansión, así que un paso puede excederlo en lo que dura una expansión.
+    # Retorna True si la búsqueda terminó.
+    def paso(self, max_nodos=1, max_segundos=None):
+        if self.terminado:
+            return True
+        inicio = time.perf_counter()
+        limite = None if max_segundos is None else inicio + max_segundos
+        nodos = 0
+        try:
+            while max_nodos is None or nodos < max_nodos:
+                self.progreso = next(self.generador)
+                nodos += 1
+                if limite is not None and time.perf_counter() >= limite:
+                    break
+        except StopIteration as fin:
+            self.terminado = True
+            self.resultado = fin.value
+        self.segundos += time.perf_counter() - inicio
+        return self.terminado
+
+    # Avanza hasta terminar (o hasta agotar los presupuestos) y retorna el resultado.
+    def ejecutar(self, max_nodos=None, max_segundos=None):
+        self.paso(max_nodos, max_segundos)
+        return self.resultado
+
+# Intercala varias búsquedas por turnos (round-robin): en cada turno, cada motor no terminado avanza como máximo
+# 'nodos_por_turno' expansiones. Se detiene cuando todas terminan o cuando se agota 'max_segundos' en total.
+# Retorna la lista de motores (con su progreso, estado y resultado).
+def intercalar(motores, nodos_por_turno=100, max_segundos=None):
+    limite = None if max_segundos is None else time.perf_counter() + max_segundos
+    pendientes = [motor for motor in motores if not motor.terminado]
+    while pendientes:
+        for motor in pendientes:
+            restante = None if limite is None else max(0.0, limite - time.perf_counter())
+            motor.paso(nodos_por_turno, restante)
+        pendientes = [motor for motor in pendientes if not motor.terminado]
+        if limite is not None and time.perf_counter() >= limite:
+            break
+    return motores
+
+# Este bloque de código se ejecuta solo cuando el script se corre directamente.
+if __name__ == "__main__":
+    # Los archivos de búsqueda empiezan con números y no se pueden importar con 'import'; se cargan por ruta.
+    ucs = cargar_modulo('00001_Busqueda_No_Info/00002_Busq_De_Anch_Costo_Uniform.py')
+    heuristicas = cargar_modulo('00002_Busqueda_Informada/00001_Heuristicas.py')
+
+    # Cuadrícula de 200x200 con costos 1 en 4 direcciones, en los dos formatos que usan UCS y A*.
+    n = 200
+    vecinos = {(i, j): [(i + di, j + dj) for di, dj in ((1, 0), (0, 1), (-1, 0), (0, -1))
+                        if 0 <= i + di < n and 0 <= j + dj < n]
+               for i in range(n) for j in range(n)}
+    con_costos = {nodo: [(v, 1) for v in lista] for nodo, lista in vecinos.items()}
+    como_diccionario = {nodo: {v: 1 for v in lista} for nodo, lista in vecinos.items()}
+
+    # Un generador a mano: cada next() expande un nodo y el resultado llega en StopIteration.
+    pasos = ucs.busqueda_costo_uniforme_pasos(con_costos, (0, 0), (1, 1))
+    try:
+        while True:
+            print("Progreso:", next(pasos))
+    except StopIteration as fin:
+        print("Resultado:", fin.value)
+
+    motores = [
+        MotorBusqueda(ucs.busqueda_costo_uniforme_pasos(con_costos, (0, 0), (n - 1, n - 1))),
+        MotorBusqueda(heuristicas.busqueda_a_estrella_pasos(como_diccionario, (0, 0), (n - 1, n - 1),
+                                                            heuristicas.heuristica_manhattan)),
+        MotorBusqueda(ucs.busqueda_costo_uniforme_pasos(con_costos, (0, 0), (5, 5))),
+    ]
+
+    # Turnos de 2000 expansiones por búsqueda durante 50 ms como máximo: las que no terminan quedan suspendidas.
+    intercalar(motores, nodos_por_turno=2000, max_segundos=0.05)
+    for numero, motor in enumerate(motores):
+        print(f"Búsqueda {numero}: terminada={motor.terminado}, progreso={motor.progreso}")
+
+    # Se reanudan hasta terminar, con turnos de 5000 expansiones.
+    intercalar(motores, nodos_por_turno=5000)
+    for numero, motor in enumerate(motores):
+        costo = motor.resultado[0] if numero != 1 else motor.resultado[1]
+        print(f"Búsqueda {numero}: costo {costo}, {motor.progreso['expandidos']} expansiones,"
+              f" {motor.segundos:.3f} s")
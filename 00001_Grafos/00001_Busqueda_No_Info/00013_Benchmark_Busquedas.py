@@ -0,0 +1,451 @@
+# Importa los módulos de la biblioteca estándar que usa el banco de pruebas.
+import argparse  # Opciones de la línea de comandos
+import gc  # Recolectar basura antes de cada medición
+import json  # Resultados legibles por máquina
+import math  # Raíces y distancias de los generadores
+import os  # Rutas de los archivos
+import platform  # Versión de Python y máquina, para documentar cada corrida
+import random  # Generadores con semilla
+import statistics  # Mediana de las repeticiones
+import sys  # Salida de errores y código de salida
+import time  # Reloj monotónico (perf_counter)
+import tracemalloc  # Pico de memoria de cada búsqueda
+from collections import deque  # BFS para elegir el objetivo
+# Busca busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import cargar_modulo  # Carga los archivos de búsqueda por ruta, sin mostrar sus ejemplos
+
+# --- Banco de pruebas de las búsquedas ---
+# Genera grafos con semilla (cuadrículas, grafos geométricos aleatorios, grafos libres de escala y árboles
+# profundos) de 10^3 a 10^7 nodos, ejecuta sobre ellos las búsquedas de 00001_Busqueda_No_Info y
+# 00002_Busqueda_Informada y guarda, para cada combinación, el tiempo, el pico de memoria y los nodos expandidos
+# en un archivo JSON. Con --comparar se contrastan dos archivos y se señalan las regresiones.
+# La misma semilla produce exactamente los mismos grafos, el mismo inicio y el mismo objetivo, así que los
+# nodos expandidos y el costo del camino deben coincidir entre corridas: solo el tiempo y la memoria varían.
+# Uso:
+#   python 00013_Benchmark_Busquedas.py --tamanos 1000,10000 --salida base.json
+#   python 00013_Benchmark_Busquedas.py --tamanos 1000,10000 --salida nuevo.json
+#   python 00013_Benchmark_Busquedas.py --comparar base.json nuevo.json
+# Nota sobre 10^7 nodos: los grafos se guardan como diccionarios de Python (el formato que reciben las búsquedas),
+# que a ese tamaño ocupan varios GB. Conviene limitar la corrida con --familias y --algoritmos (por ejemplo, solo
+# anchura, costo uniforme y sus versiones CSR).
+
+# --- Generadores de grafos ---
+# Todos retornan (grafo, inicio, heuristica):
+# - grafo: Diccionario {nodo: {vecino: costo}}; los demás formatos se derivan de él (ver convertir).
+# - inicio: Nodo de partida. El objetivo se elige después (ver elegir_objetivo).
+# - heuristica: Función h(nodo, objetivo) admisible para el grafo, o None si no hay geometría (h = 0).
+# Los nodos numerados empiezan en 1: varias búsquedas reconstruyen el camino con 'while actual:', que se
+# detendría en un nodo 0.
+# 'rng' es un random.Random ya sembrado: así cada grafo depende solo de la semilla, la familia y el tamaño.
+
+# Cuadrícula de lado sqrt(n) con 4 vecinos por casilla, costo 1 y un porcentaje de casillas bloqueadas.
+# Los nodos son tuplas (fila, columna) y la heurística es la distancia Manhattan.
+def generar_cuadricula(n, rng, obstaculos=0.2):
+    lado = max(2, math.isqrt(n))
+    libre = [[rng.random() >= obstaculos for _ in range(lado)] for _ in range(lado)]
+    libre[0][0] = True  # El inicio siempre está libre
+    grafo = {}
+    for i in range(lado):
+        fila = libre[i]
+        for j in range(lado):
+            if fila[j]:
+                vecinos = {}
+                for a, b in ((i + 1, j), (i, j + 1), (i - 1, j), (i, j - 1)):
+                    if 0 <= a < lado and 0 <= b < lado and libre[a][b]:
+                        vecinos[(a, b)] = 1
+                grafo[(i, j)] = vecinos
+
+    def manhattan(nodo, objetivo):
+        return abs(nodo[0] - objetivo[0]) + abs(nodo[1] - objetivo[1])
+    return grafo, (0, 0), manhattan
+
+# Grafo geométrico aleatorio: n puntos uniformes en el cuadrado unidad, unidos si están a distancia <= radio.
+# El radio se elige para que el grado medio sea 'grado'. El costo de cada arista es la distancia euclidiana,
+# así que la heurística euclidiana es admisible.
+# Los puntos se reparten en celdas de lado 'radio': cada punto solo se compara con las 9 celdas vecinas (O(n)).
+def generar_geometrico(n, rng, grado=8):
+    puntos = [(rng.random(), rng.random()) for _ in range(n)]
+    radio = math.sqrt(grado / (math.pi * n))
+    celdas = {}
+    for nodo, (x, y) in enumerate(puntos, 1):
+        celdas.setdefault((int(x / radio), int(y / radio)), []).append(nodo)
+    grafo = {nodo: {} for nodo in range(1, n + 1)}
+    for (cx, cy), nodos in celdas.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                otros = celdas.get((cx + dx, cy + dy))
+                if not otros:
+                    continue
+                for a in nodos:
+                    pa = puntos[a - 1]
+                    for b in otros:
+                        if a < b:  # Cada par una sola vez
+                            distancia = math.dist(pa, puntos[b - 1])
+                            if distancia <= radio:
+                                grafo[a][b] = grafo[b][a] = distancia
+
+    def euclidiana(nodo, objetivo):
+        return math.dist(puntos[nodo - 1], puntos[objetivo - 1])
+    return grafo, 1, euclidiana
+
+# Grafo libre de escala (modelo de Barabási-Albert): cada nodo nuevo se une a 'm' nodos existentes elegidos con
+# probabilidad proporcional a su grado, lo que produce unos pocos nodos con grado enorme ("hubs").
+# Costos enteros aleatorios de 1 a 10; no hay heurística. La búsqueda empieza en el último nodo (grado bajo).
+def generar_libre_escala(n, rng, m=3):
+    m = max(1, min(m, n - 1))
+    grafo = {nodo: {} for nodo in range(1, n + 1)}
+    extremos = []  # Cada nodo aparece una vez por arista: elegir de aquí es elegir proporcional al grado
+
+    def unir(a, b):
+        grafo[a][b] = grafo[b][a] = rng.randint(1, 10)
+        extremos.append(a)
+        extremos.append(b)
+    # Núcleo inicial: un grafo completo de m + 1 nodos.
+    for a in range(1, m + 2):
+        for b in range(a + 1, m + 2):
+            unir(a, b)
+    for nuevo in range(m + 2, n + 1):
+        elegidos = set()
+        while len(elegidos) < m:
+            elegidos.add(extremos[rng.randrange(len(extremos))])
+        for otro in elegidos:
+            unir(nuevo, otro)
+    return grafo, n, None
+
+# Árbol profundo y dirigido (de padres a hijos), con costo 1: cada nodo cuelga de uno de los 'ventana' nodos
+# anteriores, de modo que la profundidad media ronda 'profundidad' (por defecto sqrt(n)).
+# Es el caso que castiga a las búsquedas en profundidad iterativa y a las que guardan caminos enteros.
+def generar_arbol(n, rng, profundidad=None):
+    profundidad = profundidad or max(2, math.isqrt(n))
+    ventana = max(1, 2 * n // profundidad)
+    grafo = {nodo: {} for nodo in range(1, n + 1)}
+    for nodo in range(2, n + 1):
+        grafo[rng.randint(max(1, nodo - ventana), nodo - 1)][nodo] = 1
+    return grafo, 1, None
+
+GENERADORES = {
+    'cuadricula': generar_cuadricula,
+    'geometrico': generar_geometrico,
+    'libre_escala': generar_libre_escala,
+    'arbol': generar_arbol,
+}
+
+# Familias con aristas dirigidas: la búsqueda bidireccional simple (que recorre las mismas listas desde el
+# objetivo) y LRTA* (que no puede salir de una hoja) no se aplican a ellas.
+DIRIGIDOS = {'arbol'}
+
+# Elige como objetivo el último nodo que alcanza una BFS desde el inicio: es alcanzable y está a la máxima
+# distancia en aristas. Retorna (objetivo, profundidad del objetivo en aristas).
+def elegir_objetivo(grafo, inicio):
+    profundidad = {inicio: 0}
+    cola = deque([inicio])
+    ultimo = inicio
+    while cola:
+        ultimo = cola.popleft()
+        for vecino in grafo[ultimo]:
+            if vecino not in profundidad:
+                profundidad[vecino] = profundidad[ultimo] + 1
+                cola.append(vecino)
+    return ultimo, profundidad[ultimo]
+
+# --- Formatos de grafo ---
+# Cada búsqueda recibe el formato de su archivo:
+# - 'lista':  {nodo: [vecinos]}            (anchura, profundidad, bidireccional, búsqueda en grafos)
+# - 'tuplas': {nodo: [(vecino, costo)]}    (costo uniforme)
+# - 'dict':   {nodo: {vecino: costo}}      (A*, voraz, AO*, LRTA*, bidireccional ponderada)
+# - 'csr':    GrafoCSR de 00008_Grafo_CSR.py
+# La conversión no entra en los tiempos medidos.
+def convertir(grafo, formato, modulos):
+    if formato == 'dict':
+        return grafo
+    if formato == 'lista':
+        return {nodo: list(vecinos) for nodo, vecinos in grafo.items()}
+    if formato == 'tuplas':
+        return {nodo: list(vecinos.items()) for nodo, vecinos in grafo.items()}
+    if formato == 'csr':
+        return modulos['csr'].GrafoCSR.desde_diccionario(convertir(grafo, 'tuplas', modulos))
+    raise ValueError(f"Formato desconocido: {formato}")
+
+# --- Búsquedas a medir ---
+# Cada entrada indica el archivo, el formato del grafo, las familias a las que se aplica (None = todas), el número
+# máximo de nodos con el que se ejecuta (None = sin límite) y cómo llamarla.
+# La llamada recibe (módulo, grafo ya convertido, caso, estadisticas) y retorna el camino (o None).
+# Los límites de tamaño evitan casos que en Python tardarían horas: la IDDFS y AO* recorren el árbol una y otra
+# vez, la DFS básica copia el camino en cada nodo apilado y LRTA* puede dar muchas vueltas antes de aprender.
+# Las rutas de ARCHIVOS son relativas a la carpeta 00001_Grafos (ver cargar_modulo).
+ARCHIVOS = {
+    'anchura': '00001_Busqueda_No_Info/00001_Busq_De_Anchura.py',
+    'costo_uniforme': '00001_Busqueda_No_Info/00002_Busq_De_Anch_Costo_Uniform.py',
+    'profundidad': '00001_Busqueda_No_Info/00003_Busq_De_Profundidad.py',
+    'prof_limitada': '00001_Busqueda_No_Info/00004_Busq_De_Prof_Limitada.py',
+    'prof_iterativa': '00001_Busqueda_No_Info/00005_Busq_De_Prof_Iterativa.py',
+    'bidireccional': '00001_Busqueda_No_Info/00006_Busq_Bidireccional.py',
+    'grafos': '00001_Busqueda_No_Info/00007_Busq_en_grafos.py',
+    'csr': '00001_Busqueda_No_Info/00008_Grafo_CSR.py',
+    'heuristicas': '00002_Busqueda_Informada/00001_Heuristicas.py',
+    'voraz': '00002_Busqueda_Informada/00002_Busq_Voraz_primero_mejor.py',
+    'a_ao': '00002_Busqueda_Informada/00003_Busq_A*_AO*.py',
+    'online': '00002_Busqueda_Informada/00009_Busq_Online.py',
+}
+
+# Heurística del caso, o la nula si la familia no tiene geometría.
+def _h(caso):
+    return caso['heuristica'] or (lambda nodo, objetivo: 0)
+
+ALGORITMOS = {
+    'anchura': dict(archivo='anchura', formato='lista', familias=None, max_nodos=None,
+                    llamar=lambda m, g, c, e: m.busqueda_anchura(g, c['inicio'], c['objetivo'], estadisticas=e)),
+    'costo_uniforme': dict(archivo='costo_uniforme', formato='tuplas', familias=None, max_nodos=None,
+                           llamar=lambda m, g, c, e: (m.busqueda_costo_uniforme(g, c['inicio'], c['objetivo'],
+                                                                                estadisticas=e) or (None, None))[1]),
+    'profundidad': dict(archivo='profundidad', formato='lista', familias=None, max_nodos=10 ** 4,
+                        llamar=lambda m, g, c, e: m.busqueda_profundidad(g, c['inicio'], c['objetivo'],
+                                                                         estadisticas=e)),
+    'prof_limitada': dict(archivo='prof_limitada', formato='lista', familias=None, max_nodos=10 ** 5,
+                          llamar=lambda m, g, c, e: m.busqueda_profundidad_limitada(
+                              g, c['inicio'], c['objetivo'], c['profundidad'], estadisticas=e)),
+    'prof_iterativa': dict(archivo='prof_iterativa', formato='lista', familias=('arbol',), max_nodos=10 ** 4,
+                           llamar=lambda m, g, c, e: m.busqueda_profundidad_iterativa(g, c['inicio'], c['objetivo'],
+                                                                                      estadisticas=e)),
+    'bidireccional': dict(archivo='bidireccional', formato='lista', familias=('cuadricula', 'geometrico',
+                                                                             'libre_escala'), max_nodos=None,
+                          llamar=lambda m, g, c, e: m.busqueda_bidireccional(g, c['inicio'], c['objetivo'],
+                                                                             estadisticas=e)),
+    'bidireccional_ponderada': dict(archivo='bidireccional', formato='dict', familias=None, max_nodos=None,
+                                    llamar=lambda m, g, c, e: (m.busqueda_bidireccional_ponderada(
+                                        g, c['inicio'], c['objetivo'], estadisticas=e) or (None, None))[1]),
+    'grafo_bfs': dict(archivo='grafos', formato='lista', familias=None, max_nodos=None,
+                      llamar=lambda m, g, c, e: m.busqueda_grafo(g, c['inicio'], c['objetivo'], 'bfs',
+                                                                 estadisticas=e)),
+    'grafo_dfs': dict(archivo='grafos', formato='lista', familias=None, max_nodos=None,
+                      llamar=lambda m, g, c, e: m.busqueda_grafo(g, c['inicio'], c['objetivo'], 'dfs',
+                                                                 estadisticas=e)),
+    'anchura_csr': dict(archivo='csr', formato='csr', familias=None, max_nodos=None,
+                        llamar=lambda m, g, c, e: m.busqueda_anchura_csr(g, c['inicio'], c['objetivo'])),
+    'costo_uniforme_csr': dict(archivo='csr', formato='csr', familias=None, max_nodos=None,
+                               llamar=lambda m, g, c, e: (m.busqueda_costo_uniforme_csr(
+                                   g, c['inicio'], c['objetivo']) or (None, None))[1]),
+    'a_estrella': dict(archivo='heuristicas', formato='dict', familias=None, max_nodos=None,
+                       llamar=lambda m, g, c, e: m.busqueda_a_estrella(g, c['inicio'], c['objetivo'], _h(c),
+                                                                       estadisticas=e)[0]),
+    'voraz': dict(archivo='voraz', formato='dict', familias=None, max_nodos=None,
+                  llamar=lambda m, g, c, e: m.busqueda_voraz(g, c['inicio'], c['objetivo'], _h(c), estadisticas=e)),
+    'a_star': dict(archivo='a_ao', formato='dict', familias=None, max_nodos=None,
+                   llamar=lambda m, g, c, e: m.a_star(g, c['inicio'], c['objetivo'], _h(c), estadisticas=e)[0]),
+    'ao_star': dict(archivo='a_ao', formato='dict', familias=('arbol',), max_nodos=10 ** 4,
+                    llamar=lambda m, g, c, e: m.ao_star(g, c['inicio'], c['objetivo'], _h(c), estadisticas=e)[0]),
+    'lrta_star': dict(archivo='online', formato='dict', familias=('cuadricula', 'geometrico', 'libre_escala'),
+                      max_nodos=10 ** 4,
+                      llamar=lambda m, g, c, e: m.BusquedaOnline(g, _h(c)).lrta_star(c['inicio'], c['objetivo'],
+                                                                                     estadisticas=e)),
+}
+
+# Nodos expandidos según las estadísticas de cada búsqueda (None si la búsqueda no las da, como las CSR).
+def _expandidos(estadisticas):
+    if 'expandidos' in estadisticas:
+        return estadisticas['expandidos']
+    if 'expandidos_inicio' in estadisticas:
+        return estadisticas['expandidos_inicio'] + estadisticas['expandidos_objetivo']
+    if 'asentados_inicio' in estadisticas:
+        return estadisticas['asentados_inicio'] + estadisticas['asentados_objetivo']
+    return estadisticas.get('movimientos')
+
+# Costo de un camino en el grafo original, o None si el camino no existe o usa una arista inexistente.
+# Sirve de control: el costo de cada búsqueda debe ser el mismo en todas las corridas con la misma semilla.
+def costo_camino(grafo, camino):
+    if not camino:
+        return None
+    total = 0
+    for a, b in zip(camino, camino[1:]):
+        if b not in grafo.get(a, ()):
+            return None
+        total += grafo[a][b]
+    return total
+
+# Mide una búsqueda sobre un caso:
+# - 'repeticiones' corridas cronometradas (sin tracemalloc, que hace el código varias veces más lento);
+# - una corrida más bajo tracemalloc para el pico de memoria (solo lo que la búsqueda reserva, no el grafo).
+# Retorna el registro con tiempo (mediana y mínimo), memoria, expandidos, costo y si se encontró el objetivo.
+def medir(algoritmo, modulo, grafo, caso, repeticiones=3, memoria=True):
+    tiempos = []
+    for _ in range(repeticiones):
+        estadisticas = {}
+        gc.collect()
+        t0 = time.perf_counter()
+        camino = algoritmo['llamar'](modulo, grafo, caso, estadisticas)
+        tiempos.append(time.perf_counter() - t0)
+    registro = {
+        'tiempo': statistics.median(tiempos),
+        'tiempo_min': min(tiempos),
+        'memoria_pico': None,
+        'expandidos': _expandidos(estadisticas),
+        'encontrado': bool(camino),
+        'longitud': len(camino) - 1 if camino else None,
+        'costo': costo_camino(caso['grafo'], camino),
+    }
+    if memoria:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            base = tracemalloc.get_traced_memory()[0]
+            algoritmo['llamar'](modulo, grafo, caso, {})
+            registro['memoria_pico'] = tracemalloc.get_traced_memory()[1] - base
+        finally:
+            tracemalloc.stop()
+    return registro
+
+# Ejecuta el banco completo y retorna el documento de resultados (un diccionario listo para json.dump).
+# - familias, tamanos, algoritmos: Qué combinar (por defecto todo).
+# - semilla: Semilla base; cada grafo usa la cadena "semilla-familia-tamaño", así que añadir familias o tamaños
+#            no cambia los grafos de los demás.
+# - progreso: Archivo donde se escribe una línea por medición (None = en silencio).
+# Las combinaciones que no se ejecutan (familia no aplicable o tamaño por encima de max_nodos) quedan registradas
+# con 'omitido' y el motivo, para que la comparación distinga "no se midió" de "desapareció".
+def ejecutar(familias=None, tamanos=(10 ** 3, 10 ** 4, 10 ** 5), algoritmos=None, semilla=0, repeticiones=3,
+             memoria=True, progreso=None):
+    familias = list(familias or GENERADORES)
+    algoritmos = list(algoritmos or ALGORITMOS)
+    modulos = {}
+    resultados = []
+    for familia in familias:
+        for tamano in tamanos:
+            rng = random.Random(f"{semilla}-{familia}-{tamano}")
+            t0 = time.perf_counter()
+            grafo, inicio, heuristica = GENERADORES[familia](tamano, rng)
+            objetivo, profundidad = elegir_objetivo(grafo, inicio)
+            generacion = time.perf_counter() - t0
+            caso = dict(grafo=grafo, inicio=inicio, objetivo=objetivo, profundidad=profundidad,
+                        heuristica=heuristica)
+            base = dict(familia=familia, tamano=tamano, nodos=len(grafo),
+                        aristas=sum(len(vecinos) for vecinos in grafo.values()), profundidad_objetivo=profundidad)
+            if progreso:
+                print(f"{familia} n={tamano}: {base['nodos']} nodos, {base['aristas']} aristas, objetivo a "
+                      f"{profundidad} aristas (generado en {generacion:.2f} s)", file=progreso)
+            # Se agrupan las búsquedas por formato para tener un solo grafo convertido en memoria a la vez.
+            for formato in sorted({ALGORITMOS[nombre]['formato'] for nombre in algoritmos}):
+                grupo = [nombre for nombre in algoritmos if ALGORITMOS[nombre]['formato'] == formato]
+                convertido = None
+                for nombre in grupo:
+                    algoritmo = ALGORITMOS[nombre]
+                    registro = dict(base, algoritmo=nombre)
+                    if algoritmo['familias'] is not None and familia not in algoritmo['familias']:
+                        registro['omitido'] = 'familia no aplicable'
+                    elif algoritmo['max_nodos'] is not None and tamano > algoritmo['max_nodos']:
+                        registro['omitido'] = f"más de {algoritmo['max_nodos']} nodos"
+                    else:
+                        if algoritmo['archivo'] not in modulos:
+                            modulos[algoritmo['archivo']] = cargar_modulo(ARCHIVOS[algoritmo['archivo']])
+                        if formato == 'csr' and 'csr' not in modulos:
+                            modulos['csr'] = cargar_modulo(ARCHIVOS['csr'])
+                        if convertido is None:
+                            convertido = convertir(grafo, formato, modulos)
+                        registro.update(medir(algoritmo, modulos[algoritmo['archivo']], convertido, caso,
+                                              repeticiones, memoria))
+                        if progreso:
+                            memoria_kb = ('-' if registro['memoria_pico'] is None
+                                          else f"{registro['memoria_pico'] / 1024:.0f} KB")
+                            print(f"  {nombre:<24} {registro['tiempo'] * 1000:10.2f} ms  {memoria_kb:>10}  "
+                                  f"expandidos={registro['expandidos']}  costo={registro['costo']}", file=progreso)
+                    resultados.append(registro)
+                del convertido
+            del grafo, caso
+    return {
+        'version': 1,
+        'semilla': semilla,
+        'repeticiones': repeticiones,
+        'python': platform.python_version(),
+        'maquina': platform.machine(),
+        'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'resultados': resultados,
+    }
+
+# --- Comparación de dos corridas ---
+# Empareja los registros por (familia, tamaño, algoritmo) y señala:
+# - 'regresion' si el tiempo o la memoria crecen más del 'umbral' relativo Y más de un mínimo absoluto
+#   ('minimo_tiempo' segundos, 'minimo_memoria' bytes), para no confundir ruido con regresiones en casos de
+#   microsegundos; también si aumentan los nodos expandidos o si deja de encontrarse el objetivo.
+# - 'cambio' si el costo del camino es distinto (con la misma semilla debería ser idéntico: es un error de
+#   corrección, no de rendimiento) o si una combinación medida en la base ya no se mide.
+# - 'mejora' si el tiempo o la memoria bajan más del umbral, o si se expanden menos nodos.
+# Retorna la lista de hallazgos, cada uno un diccionario con la clave, el tipo, la métrica y los dos valores.
+def comparar(base, nuevo, umbral=0.10, minimo_tiempo=0.001, minimo_memoria=64 * 1024):
+    def indice(documento):
+        return {(r['familia'], r['tamano'], r['algoritmo']): r for r in documento['resultados']}
+    anteriores, actuales = indice(base), indice(nuevo)
+    hallazgos = []
+
+    def anotar(clave, tipo, metrica, antes, despues):
+        hallazgos.append(dict(familia=clave[0], tamano=clave[1], algoritmo=clave[2], tipo=tipo, metrica=metrica,
+                              base=antes, nuevo=despues))
+
+    for clave, antes in anteriores.items():
+        despues = actuales.get(clave)
+        if 'omitido' in antes:
+            continue
+        if despues is None or 'omitido' in despues:
+            anotar(clave, 'cambio', 'medido', True, False)
+            continue
+        for metrica, minimo in (('tiempo', minimo_tiempo), ('memoria_pico', minimo_memoria)):
+            a, b = antes.get(metrica), despues.get(metrica)
+            if a is None or b is None:
+                continue
+            if b > a * (1 + umbral) and b - a > minimo:
+                anotar(clave, 'regresion', metrica, a, b)
+            elif b < a * (1 - umbral) and a - b > minimo:
+                anotar(clave, 'mejora', metrica, a, b)
+        a, b = antes.get('expandidos'), despues.get('expandidos')
+        if a is not None and b is not None and a != b:
+            anotar(clave, 'regresion' if b > a else 'mejora', 'expandidos', a, b)
+        if antes['encontrado'] and not despues['encontrado']:
+            anotar(clave, 'regresion', 'encontrado', True, False)
+        elif antes.get('costo') is not None and despues.get('costo') is not None \
+                and not math.isclose(antes['costo'], despues['costo'], rel_tol=1e-9):
+            anotar(clave, 'cambio', 'costo', antes['costo'], despues['costo'])
+    return hallazgos
+
+# Este bloque de código se ejecuta solo cuando el script se corre directamente.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Banco de pruebas de las búsquedas sobre grafos generados.")
+    parser.add_argument('--tamanos', default='1000,10000,100000',
+                        help="Tamaños separados por comas (admite 1e6; hasta 1e7 si hay memoria).")
+    parser.add_argument('--familias', default=','.join(GENERADORES), help="Familias de grafos separadas por comas.")
+    parser.add_argument('--algoritmos', default=','.join(ALGORITMOS), help="Búsquedas separadas por comas.")
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--repeticiones', type=int, default=3)
+    parser.add_argument('--sin-memoria', action='store_true', help="No medir la memoria (ahorra una corrida).")
+    parser.add_argument('--salida', help="Archivo JSON de resultados (por defecto, la salida estándar).")
+    parser.add_argument('--comparar', nargs=2, metavar=('BASE', 'NUEVO'),
+                        help="Compara dos archivos de resultados en lugar de medir.")
+    parser.add_argument('--umbral', type=float, default=0.10, help="Variación relativa tolerada (0.10 = 10%%).")
+    argumentos = parser.parse_args()
+
+    if argumentos.comparar:
+        with open(argumentos.comparar[0]) as f:
+            base = json.load(f)
+        with open(argumentos.comparar[1]) as f:
+            nuevo = json.load(f)
+        hallazgos = comparar(base, nuevo, argumentos.umbral)
+        for h in hallazgos:
+            print(f"{h['tipo'].upper():<10} {h['familia']:<13} n={h['tamano']:<9} {h['algoritmo']:<24} "
+                  f"{h['metrica']}: {h['base']} -> {h['nuevo']}")
+        regresiones = sum(h['tipo'] != 'mejora' for h in hallazgos)
+        print(f"{regresiones} regresiones o cambios, {len(hallazgos) - regresiones} mejoras.")
+        if argumentos.salida:
+            with open(argumentos.salida, 'w') as f:
+                json.dump(hallazgos, f, indent=2)
+        # Código de salida 1 si hay regresiones: permite usar la comparación como control automático.
+        sys.exit(1 if regresiones else 0)
+
+    documento = ejecutar(familias=argumentos.familias.split(','),
+                         tamanos=[int(float(t)) for t in argumentos.tamanos.split(',')],
+                         algoritmos=argumentos.algoritmos.split(','), semilla=argumentos.semilla,
+                         repeticiones=argumentos.repeticiones, memoria=not argumentos.sin_memoria,
+                         progreso=sys.stderr)
+    if argumentos.salida:
+        with open(argumentos.salida, 'w') as f:
+            json.dump(documento, f, indent=2)
+    else:
+        json.dump(documento, sys.stdout, indent=2)
@@ -4,6 +4,17 @@
 # siempre está en la raíz y se puede extraer rápidamente. Esto es fundamental para A* para siempre expandir
 # el nodo con el menor f_score.
 import heapq  # Cola de prioridad (min-heap)
+# Importa time para medir la duración de cada fase en las estadísticas.
+import time  # Reloj monotónico (perf_counter)
+# Importa numpy para evaluar la heurística de todos los vecinos de una expansión en una sola operación.
+import numpy as np  # Arreglos de coordenadas indexados por id de nodo
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import agotar, registrar  # Corre una búsqueda por pasos; estadísticas
 
 # Define la función principal para la búsqueda A* (A-estrella).
 # Este algoritmo busca el camino de menor costo desde un inicio a un objetivo en un grafo ponderado,
@@ -15,7 +26,26 @@ import heapq  # Cola de prioridad (min-heap)
 # - objetivo: El nodo que se desea encontrar.
 # - heuristica: Una función que estima el costo desde un nodo dado hasta el nodo objetivo.
 #               Debe ser una heurística admisible (nunca sobreestima el costo real) para garantizar la optimalidad del camino encontrado.
-def busqueda_a_estrella(grafo, inicio, objetivo, heuristica):
+#               Si además tiene un método 'lote(nodos, objetivo)' (como HeuristicaMemo), los vecinos que mejoran su
+#               g_score en una expansión se evalúan todos juntos con una sola llamada a 'lote'.
+# - estadisticas: Diccionario opcional donde se guardan, al terminar, los contadores de la búsqueda (expandidos,
+#                 generados, duplicados que no mejoran su costo, inserciones en la frontera, evaluaciones de la
+#                 heurística, pico de la frontera) y el tiempo de cada fase (ver registrar en busqueda_comun.py).
+def busqueda_a_estrella(grafo, inicio, objetivo, heuristica, estadisticas=None):
+    return agotar(busqueda_a_estrella_pasos(grafo, inicio, objetivo, heuristica, estadisticas, informar=False))
+
+# Define la búsqueda A* por pasos (generador; ver 00001_Busqueda_No_Info/00012_Busqueda_Por_Pasos.py). Es la
+# implementación de busqueda_a_estrella. Aquí 'mejor_f' es el f_score del último nodo expandido.
+def busqueda_a_estrella_pasos(grafo, inicio, objetivo, heuristica, estadisticas=None, informar=True):
+    # Contadores para 'estadisticas' (se vuelcan solo al terminar). Solo se cuentan y se toman tiempos si se
+    # pidieron; los generados se suman una vez por expansión. Como no hay conjunto cerrado, cada extracción de la
+    # frontera es una expansión (o el objetivo), así que las inserciones (con la del inicio) salen al final de
+    # expandidos + extracción del objetivo + lo que quede en la frontera.
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    expandidos = generados = 0
+    pico_frontera = 1
+
     # Inicializa la 'frontera' de exploración como una lista que actuará como una cola de prioridad (min-heap).
     # Los elementos en la frontera son tuplas (f_score, nodo), donde f_score = g_score + h_score.
     frontera = []  # Cola de prioridad: (f_score, nodo)
@@ -34,16 +64,20 @@ def busqueda_a_estrella(grafo, inicio, objetivo, heuristica):
     # El nodo de inicio no tiene padre en el contexto de la búsqueda.
     padres = {inicio: None}  # Registro de padres para reconstruir camino
 
+    # Evaluación por lotes de la heurística, si la ofrece (None = una llamada por vecino).
+    lote = getattr(heuristica, 'lote', None)
+
     # Inicia el bucle principal del algoritmo A*. Continúa mientras la frontera (cola de prioridad) no esté vacía.
     while frontera:
         # Extrae el nodo con el menor f_score de la cola de prioridad.
         # heapq.heappop(heap) extrae y devuelve el elemento más pequeño del heap (la tupla con el menor f_score).
-        # Desempaquetamos la tupla, guardando el f_score en '_' (indicando que no lo usaremos directamente después) y el nodo en 'actual'.
-        _, actual = heapq.heappop(frontera)  # Nodo con menor f_score
+        # Desempaquetamos la tupla, guardando el f_score (solo se usa en el progreso por pasos) y el nodo en 'actual'.
+        f_actual, actual = heapq.heappop(frontera)  # Nodo con menor f_score
 
         # Comprueba si el nodo actual extraído es el objetivo.
         if actual == objetivo:
             # Si es el objetivo, hemos encontrado el camino de menor costo (debido a las propiedades de A* con heurística admisible).
+            t_objetivo = time.perf_counter() if contar else None
             # Inicializa una lista vacía para construir el camino.
             camino = []
             # Retrocede desde el nodo objetivo hasta el inicio usando el diccionario 'padres'.
@@ -55,33 +89,61 @@ def busqueda_a_estrella(grafo, inicio, objetivo, heuristica):
             # Invierte la lista del camino para que vaya desde el inicio hasta el objetivo.
             # Retorna la lista del camino invertido y el costo total para llegar al objetivo, que es el g_score del nodo objetivo.
             # Nota: camino[0] será el objetivo después de la inversión, por eso se usa g_scores[camino[0]] o g_scores[objetivo].
-            return camino[::-1], g_scores[camino[0]]  # Camino y costo total
+            resultado = camino[::-1], g_scores[camino[0]]  # Camino y costo total
+            inserciones = expandidos + 1 + len(frontera)
+            registrar(estadisticas, t0, t_objetivo, expandidos=expandidos, generados=generados,
+                      duplicados=generados - (inserciones - 1), inserciones=inserciones,
+                      evaluaciones_heuristica=inserciones, pico_frontera=pico_frontera)
+            return resultado
 
+        expandidos += 1
+        # Vecinos mejorados en esta expansión, pendientes de evaluar por lotes (solo si la heurística tiene 'lote').
+        mejorados = []
         # Explora los vecinos del nodo actual.
         # Itera sobre los pares (vecino, costo_de_arista) en el diccionario de vecinos del nodo 'actual' en el 'grafo'.
-        for vecino, costo in grafo[actual].items():
+        vecinos = grafo[actual]
+        for vecino, costo in vecinos.items():
             # Calcula el costo tentativo para llegar al vecino a través del nodo 'actual'.
             # Es el g_score del nodo actual más el costo de la arista para llegar al vecino.
             g_tentativo = g_scores[actual] + costo
 
             # Condición clave de A* (y Dijkstra): Comprueba si este camino al vecino es el mejor encontrado hasta ahora.
             # Esto ocurre si el vecino no ha sido visitado antes (no tiene g_score) O si el costo tentativo por este camino
-            # es menor que el g_score previamente registrado para el vecino.
+            # es menor que el g_score previamente registrado para el vecino. Si no, se descarta (un duplicado).
             if vecino not in g_scores or g_tentativo < g_scores[vecino]:
                 # Si este camino es mejor:
                 # Establece el nodo actual como el padre del vecino en el camino óptimo encontrado hasta ahora.
                 padres[vecino] = actual
                 # Actualiza el g_score del vecino con el costo real más bajo encontrado hasta ahora.
                 g_scores[vecino] = g_tentativo
+                if lote is not None:
+                    # Se evaluará junto con los demás vecinos mejorados al terminar el bucle.
+                    mejorados.append(vecino)
+                    continue
                 # Calcula el f_score para el vecino: g_score actualizado + el valor de la heurística desde el vecino al objetivo.
                 f_score = g_tentativo + heuristica(vecino, objetivo)
                 # Añade el vecino a la cola de prioridad con su f_score. La cola lo ordenará automáticamente.
                 # Esto asegura que siempre expandamos el nodo con el menor costo estimado total.
                 heapq.heappush(frontera, (f_score, vecino))
+        # Una sola evaluación para todos los vecinos mejorados; se insertan en el mismo orden que sin lotes,
+        # así que la búsqueda expande exactamente los mismos nodos.
+        if mejorados:
+            for vecino, h in zip(mejorados, lote(mejorados, objetivo)):
+                heapq.heappush(frontera, (g_scores[vecino] + h, vecino))
+        if contar:
+            generados += len(vecinos)
+            if len(frontera) > pico_frontera:
+                pico_frontera = len(frontera)
+        if informar:
+            yield {'expandidos': expandidos, 'frontera': len(frontera), 'mejor_f': f_actual}
 
     # Si el bucle 'while frontera:' termina y no se encontró el objetivo (la frontera se vació),
     # significa que el objetivo no es alcanzable desde el nodo de inicio.
     # Retorna None para el camino y None para el costo.
+    inserciones = expandidos  # Frontera vacía: todo lo insertado se expandió
+    registrar(estadisticas, t0, None, expandidos=expandidos, generados=generados,
+              duplicados=generados - (inserciones - 1), inserciones=inserciones, evaluaciones_heuristica=inserciones,
+              pico_frontera=pico_frontera)
     return None, None  # No se encontró camino
 
 # Define una función de heurística de ejemplo: la Distancia de Manhattan.
@@ -95,6 +157,98 @@ def heuristica_manhattan(nodo, objetivo):
     # Calcula y retorna la distancia de Manhattan: |x1 - x2| + |y1 - y2|.
     return abs(x1 - x2) + abs(y1 - y2)
 
+# --- Capa de memoización de la heurística ---
+# A* llama a heuristica(vecino, objetivo) en cada relajación, y un mismo nodo se relaja muchas veces (una por
+# cada camino mejor que se le encuentra), así que el mismo valor se recalcula una y otra vez.
+# HeuristicaMemo envuelve una heurística y guarda h por (nodo, objetivo): cada valor se calcula una sola vez.
+# Las tablas se separan por objetivo, de modo que la misma instancia sirve para muchas consultas.
+# Se construye con una de las dos formas de heurística (o ambas):
+# - heuristica: La función escalar de siempre, h(nodo, objetivo).
+# - lote: Una función vectorizada lote(nodos, objetivo) que retorna la lista de h de todos los nodos de una vez
+#         (ver heuristica_vectorizada). Si se da, los valores que faltan en la tabla se calculan con una llamada.
+# Se usa como una heurística normal: busqueda_a_estrella(grafo, inicio, objetivo, HeuristicaMemo(h)).
+# busqueda_a_estrella y a_star detectan el método 'lote' y evalúan todos los vecinos de una expansión juntos.
+# Atributos:
+# - calculos: Valores calculados de verdad.
+# - aciertos: Valores servidos desde la tabla.
+class HeuristicaMemo:
+    def __init__(self, heuristica=None, lote=None):
+        if heuristica is None and lote is None:
+            raise ValueError("Se necesita una heurística escalar o una vectorizada")
+        self.heuristica = heuristica
+        self.vectorizada = lote
+        self.tablas = {}  # objetivo -> {nodo: h}
+        self.calculos = 0
+        self.aciertos = 0
+
+    # Valor de h para un nodo (misma firma que una heurística normal).
+    def __call__(self, nodo, objetivo):
+        tabla = self.tablas.get(objetivo)
+        if tabla is None:
+            tabla = self.tablas[objetivo] = {}
+        h = tabla.get(nodo)
+        if h is None:
+            if self.heuristica is not None:
+                h = self.heuristica(nodo, objetivo)
+            else:
+                h = self.vectorizada([nodo], objetivo)[0]
+            tabla[nodo] = h
+            self.calculos += 1
+        else:
+            self.aciertos += 1
+        return h
+
+    # Valores de h para una lista de nodos, en el mismo orden. Los que no están en la tabla se calculan juntos.
+    def lote(self, nodos, objetivo):
+        tabla = self.tablas.get(objetivo)
+        if tabla is None:
+            tabla = self.tablas[objetivo] = {}
+        valores = [tabla.get(nodo) for nodo in nodos]
+        if None not in valores:  # Caso habitual tras las primeras expansiones: todo está en la tabla
+            self.aciertos += len(nodos)
+            return valores
+        faltan = [nodo for nodo, h in zip(nodos, valores) if h is None]
+        if self.vectorizada is not None:
+            nuevos = self.vectorizada(faltan, objetivo)
+        else:
+            nuevos = [self.heuristica(nodo, objetivo) for nodo in faltan]
+        tabla.update(zip(faltan, nuevos))
+        self.calculos += len(faltan)
+        self.aciertos += len(nodos) - len(faltan)
+        return [tabla[nodo] for nodo in nodos]
+
+    # Vacía la tabla de un objetivo (o todas), por ejemplo si cambian las coordenadas o el grafo.
+    def limpiar(self, objetivo=None):
+        if objetivo is None:
+            self.tablas.clear()
+        else:
+            self.tablas.pop(objetivo, None)
+
+# Crea una heurística vectorizada a partir de un arreglo de coordenadas indexado por id de nodo:
+# coordenadas[i] son las coordenadas del nodo i (los nodos del grafo deben ser los enteros 0..n-1).
+# La función retornada, lote(nodos, objetivo), calcula la distancia de todos los nodos al objetivo con una sola
+# operación de numpy en lugar de una llamada de Python por nodo.
+# - metrica: 'euclidiana' o 'manhattan'.
+# - escala: Factor por el que se multiplica la distancia (por ejemplo, el costo mínimo por unidad de distancia,
+#           para que la heurística siga siendo admisible).
+# Retorna listas de floats de Python (no escalares de numpy), para que los f_score de la frontera sigan siendo
+# números normales.
+def heuristica_vectorizada(coordenadas, metrica='euclidiana', escala=1.0):
+    coordenadas = np.asarray(coordenadas, dtype=np.float64)
+    if metrica not in ('euclidiana', 'manhattan'):
+        raise ValueError(f"Métrica desconocida: {metrica}")
+
+    def lote(nodos, objetivo):
+        diferencias = coordenadas[np.asarray(nodos, dtype=np.intp)] - coordenadas[objetivo]
+        if metrica == 'manhattan':
+            distancias = np.abs(diferencias).sum(axis=1)
+        else:
+            distancias = np.sqrt((diferencias * diferencias).sum(axis=1))
+        if escala != 1.0:
+            distancias *= escala
+        return distancias.tolist()
+    return lote
+
 # Este bloque de código solo se ejecuta cuando el script se corre directamente.
 # Contiene un ejemplo de cómo usar la función de búsqueda A* con un grafo y la heurística de Manhattan.
 if __name__ == "__main__":
@@ -123,3 +277,48 @@ if __name__ == "__main__":
     print("Camino encontrado:", camino)
     # Imprime el costo total del camino encontrado.
     print("Costo total:", costo)
+
+    # Estadísticas: se pasa un diccionario vacío y la búsqueda lo rellena al terminar (exportable con json.dumps).
+    import json
+    estadisticas = {}
+    busqueda_a_estrella(grafo, inicio, objetivo, heuristica_manhattan, estadisticas=estadisticas)
+    print("Estadísticas:", json.dumps(estadisticas, indent=2))
+
+    # Heurística memoizada y vectorizada: 30 consultas hacia el mismo objetivo (por ejemplo, varias unidades que van
+    # al mismo punto) en un grafo geométrico denso de 5000 nodos numerados 0..n-1, con unos 150 vecinos por nodo.
+    # La tabla de HeuristicaMemo se conserva entre consultas, así que desde la segunda casi todo son aciertos.
+    # Las tres variantes expanden los mismos nodos y encuentran los mismos costos; solo cambia cuánto cuesta h.
+    # Con una h tan barata como esta la diferencia es pequeña: la memoización compensa cuando h es cara de calcular
+    # (muchas coordenadas, landmarks, distancias sobre mapas) y el lote cuando cada expansión tiene muchos vecinos.
+    import math
+    import random
+    rng = random.Random(1)
+    n, radio = 5000, math.sqrt(150 / (math.pi * 5000))
+    puntos = {i: (rng.random(), rng.random()) for i in range(n)}
+    geometrico = {i: {} for i in range(n)}
+    celdas = {}
+    for i, (x, y) in puntos.items():
+        celdas.setdefault((int(x / radio), int(y / radio)), []).append(i)
+    for (cx, cy), nodos in celdas.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for a in nodos:
+                    for b in celdas.get((cx + dx, cy + dy), ()):
+                        if a < b and math.dist(puntos[a], puntos[b]) <= radio:
+                            # Costo = distancia por un factor entre 1 y 2: la distancia euclidiana es admisible.
+                            geometrico[a][b] = geometrico[b][a] = math.dist(puntos[a], puntos[b]) * (1 + rng.random())
+
+    def h_puntos(nodo, objetivo):
+        x1, y1 = puntos[nodo]
+        x2, y2 = puntos[objetivo]
+        return ((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5
+
+    coordenadas = np.array([puntos[i] for i in range(n)])
+    origenes = rng.sample(range(1, n), 30)
+    for nombre, h in (("escalar", h_puntos),
+                      ("memoizada", HeuristicaMemo(h_puntos)),
+                      ("vectorizada", HeuristicaMemo(lote=heuristica_vectorizada(coordenadas)))):
+        t0 = time.perf_counter()
+        total = sum(busqueda_a_estrella(geometrico, origen, 0, h)[1] for origen in origenes)
+        detalle = f", {h.calculos} cálculos y {h.aciertos} aciertos" if isinstance(h, HeuristicaMemo) else ""
+        print(f"A* con heurística {nombre}: costo total {total:.4f} en {time.perf_counter() - t0:.3f} s{detalle}")
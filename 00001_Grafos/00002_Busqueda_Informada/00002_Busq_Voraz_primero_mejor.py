@@ -2,6 +2,15 @@
 # La Búsqueda Voraz utiliza una cola de prioridad para siempre expandir el nodo que parece "más cercano" al objetivo
 # según la función heurística.
 import heapq  # Cola de prioridad (para elegir el nodo con menor heurística)
+# Importa time para medir la duración de cada fase en las estadísticas.
+import time  # Reloj monotónico (perf_counter)
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import agotar, cargar_modulo, registrar  # Búsqueda por pasos, archivos numerados, estadísticas
 
 # Define la función que implementa el algoritmo de Búsqueda Voraz (Greedy Best-First Search).
 # Este algoritmo es una forma de búsqueda informada que utiliza una heurística para guiar la exploración,
@@ -12,7 +21,24 @@ import heapq  # Cola de prioridad (para elegir el nodo con menor heurística)
 # - objetivo: El nodo que se desea encontrar.
 # - heuristica: Una función que toma dos nodos (el nodo actual y el nodo objetivo) y retorna una estimación
 #               del costo o distancia desde el nodo actual hasta el objetivo (el valor heurístico h(n)).
-def busqueda_voraz(grafo, inicio, objetivo, heuristica):
+# - estadisticas: Diccionario opcional donde se guardan, al terminar, los contadores de la búsqueda (expandidos,
+#                 generados, duplicados descartados, inserciones en la frontera, pico de la frontera) y el tiempo
+#                 de cada fase (ver registrar en busqueda_comun.py).
+def busqueda_voraz(grafo, inicio, objetivo, heuristica, estadisticas=None):
+    return agotar(busqueda_voraz_pasos(grafo, inicio, objetivo, heuristica, estadisticas, informar=False))
+
+# Define la búsqueda voraz por pasos (generador; ver 00001_Busqueda_No_Info/00012_Busqueda_Por_Pasos.py). Es la
+# implementación de busqueda_voraz. Aquí 'mejor_f' es la heurística del último nodo expandido.
+def busqueda_voraz_pasos(grafo, inicio, objetivo, heuristica, estadisticas=None, informar=True):
+    # Contadores para 'estadisticas' (se vuelcan solo al terminar). Solo se cuentan y se toman tiempos si se
+    # pidieron; los generados se suman una vez por expansión y, como cada nodo entra en la frontera una sola vez
+    # (al recibir padre), las inserciones salen al final del tamaño de 'padres'. 'repetidos' cuenta las
+    # extracciones de nodos ya expandidos.
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    expandidos = generados = repetidos = 0
+    pico_frontera = 1
+
     # Inicializa la 'frontera' de exploración como una lista que actuará como una cola de prioridad (min-heap).
     # Los elementos en la frontera son tuplas (valor_de_prioridad, nodo). En Búsqueda Voraz, la prioridad es solo el valor heurístico.
     frontera = []  # Cola: (h(n), nodo)
@@ -34,39 +60,48 @@ def busqueda_voraz(grafo, inicio, objetivo, heuristica):
     while frontera:
         # Extrae el nodo de la frontera que tiene la menor prioridad (el menor valor heurístico).
         # heapq.heappop(heap) extrae y devuelve el elemento más pequeño del heap (la tupla con el menor primer elemento).
-        # Desempaquetamos la tupla, guardando el valor de prioridad (h_score) en '_' (lo descartamos) y el nodo en 'actual'.
-        _, actual = heapq.heappop(frontera)  # Saca el nodo más prometedor (menor h)
+        # Desempaquetamos la tupla, guardando el valor de prioridad (h_score, solo para el progreso por pasos) y el nodo en 'actual'.
+        h_actual, actual = heapq.heappop(frontera)  # Saca el nodo más prometedor (menor h)
 
         # Comprueba si el nodo actual extraído es el objetivo.
         if actual == objetivo:
             # Si es el objetivo, hemos encontrado un camino.
             # Nota: En Búsqueda Voraz, este camino no está garantizado que sea el más corto o el de menor costo.
+            t_objetivo = time.perf_counter() if contar else None
             # Inicializa una lista vacía para construir el camino.
             camino = []
             # Retrocede desde el nodo objetivo hasta el inicio usando el diccionario 'padres'.
-            while actual: # El bucle continúa mientras 'actual' no sea None (hasta llegar al nodo inicial).
+            while actual is not None: # El bucle continúa mientras 'actual' no sea None (hasta llegar al nodo inicial).
                 # Añade el nodo actual a la lista (temporalmente en orden inverso).
                 camino.append(actual)
                 # Se mueve al nodo padre de este nodo.
                 actual = padres[actual]
             # Invierte la lista del camino para que vaya desde el inicio hasta el objetivo.
-            return camino[::-1]  # De inicio a objetivo
+            camino.reverse()  # De inicio a objetivo
+            inserciones = len(padres)
+            registrar(estadisticas, t0, t_objetivo, expandidos=expandidos, generados=generados,
+                      duplicados=generados - (inserciones - 1) + repetidos, inserciones=inserciones,
+                      pico_frontera=pico_frontera)
+            return camino
 
         # Comprueba si el nodo actual ya ha sido visitado (expandido previamente).
         if actual in visitados:
             # Si ya fue visitado, salta al principio del bucle para procesar el siguiente nodo de la frontera.
             # Esto asegura que no expandamos un nodo más de una vez.
+            repetidos += 1
             continue  # Saltar si ya fue expandido
 
         # Si el nodo actual no ha sido visitado, lo marca como visitado.
         visitados.add(actual)
+        expandidos += 1
 
         # Explora los vecinos del nodo actual.
-        for vecino in grafo[actual]:
+        vecinos = grafo[actual]
+        for vecino in vecinos:
             # Comprueba si el vecino no ha sido visitado Y si no tiene un padre asignado aún.
             # La segunda parte (`vecino not in padres`) es una forma de verificar si este vecino ya fue
             # encontrado y puesto en la frontera previamente a través de otro camino. Si ya tiene padre,
-            # significa que ya está en la frontera o ya fue expandido, y no lo reprocesamos desde 'actual'.
+            # significa que ya está en la frontera o ya fue expandido, y no lo reprocesamos (se descarta).
             if vecino not in visitados and vecino not in padres:
                  # Si el vecino es un nodo nuevo (o no procesado aún en esta búsqueda):
                 # Establece el nodo actual como el padre del vecino en el camino.
@@ -75,9 +110,19 @@ def busqueda_voraz(grafo, inicio, objetivo, heuristica):
                 # Añade el vecino a la cola de prioridad, con su valor heurístico como prioridad.
                 # Esto lo pone en el lugar correcto en el heap según su distancia estimada al objetivo.
                 heapq.heappush(frontera, (heuristica(vecino, objetivo), vecino))
+        if contar:
+            generados += len(vecinos)
+            if len(frontera) > pico_frontera:
+                pico_frontera = len(frontera)
+        if informar:
+            yield {'expandidos': expandidos, 'frontera': len(frontera), 'mejor_f': h_actual}
 
     # Si el bucle 'while frontera:' termina (la frontera se vació) y no se encontró el objetivo,
     # significa que el objetivo no es alcanzable desde el nodo de inicio.
+    inserciones = len(padres)
+    registrar(estadisticas, t0, None, expandidos=expandidos, generados=generados,
+              duplicados=generados - (inserciones - 1) + repetidos, inserciones=inserciones,
+              pico_frontera=pico_frontera)
     return None  # No se encontró camino
 
 # Define una función de heurística de ejemplo: la Distancia Euclidiana.
@@ -93,6 +138,60 @@ def heuristica_euclidiana(nodo, objetivo):
     # Se eleva a la potencia 0.5 para obtener la raíz cuadrada.
     return ((x1 - x2)**2 + (y1 - y2)**2)**0.5
 
+# Define la búsqueda voraz sobre un problema implícito (protocolo de 00009_Problema_Implicito.py).
+# Igual que busqueda_voraz, pero la prioridad es problema.heuristica(estado), la meta se reconoce con
+# problema.es_objetivo y la frontera y las tablas trabajan con claves (que deben poder compararse, como un int,
+# porque desempatan en la cola de prioridad). 'padres' guarda clave -> (clave del padre, estado).
+# Retorna la lista de estados desde el inicial hasta una meta, o None.
+# 'estadisticas' recibe los mismos contadores que en busqueda_voraz y se cuentan igual; solo si se pide, los
+# sucesores de cada estado se guardan en una lista para contarlos.
+def busqueda_voraz_problema(problema, estadisticas=None):
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    expandidos = generados = repetidos = 0
+    pico_frontera = 1
+    inicial = problema.estado_inicial
+    clave_inicial = problema.clave(inicial)
+    frontera = [(problema.heuristica(inicial), clave_inicial)]
+    padres = {clave_inicial: (None, inicial)}
+    visitados = set()
+    while frontera:
+        _, clave = heapq.heappop(frontera)
+        actual = padres[clave][1]
+        if problema.es_objetivo(actual):
+            t_objetivo = time.perf_counter() if contar else None
+            camino = []
+            while clave is not None:
+                clave, estado = padres[clave]
+                camino.append(estado)
+            inserciones = len(padres)
+            registrar(estadisticas, t0, t_objetivo, expandidos=expandidos, generados=generados,
+                      duplicados=generados - (inserciones - 1) + repetidos, inserciones=inserciones,
+                      pico_frontera=pico_frontera)
+            return camino[::-1]
+        if clave in visitados:
+            repetidos += 1
+            continue
+        visitados.add(clave)
+        sucesores = problema.sucesores(actual)
+        if contar:
+            sucesores = list(sucesores)
+        for vecino, _ in sucesores:
+            clave_vecino = problema.clave(vecino)
+            if clave_vecino not in visitados and clave_vecino not in padres:
+                padres[clave_vecino] = (clave, vecino)
+                heapq.heappush(frontera, (problema.heuristica(vecino), clave_vecino))
+        if contar:
+            expandidos += 1
+            generados += len(sucesores)
+            if len(frontera) > pico_frontera:
+                pico_frontera = len(frontera)
+    inserciones = len(padres)
+    registrar(estadisticas, t0, None, expandidos=expandidos, generados=generados,
+              duplicados=generados - (inserciones - 1) + repetidos, inserciones=inserciones,
+              pico_frontera=pico_frontera)
+    return None
+
 # Este bloque de código solo se ejecuta cuando el script se corre directamente.
 # Contiene un ejemplo de cómo usar la función de búsqueda voraz con un grafo y una heurística.
 if __name__ == "__main__":
@@ -134,4 +233,11 @@ if __name__ == "__main__":
     camino = busqueda_voraz(grafo, inicio, objetivo, h)
 
     # Imprime el camino encontrado.
-    print("Camino encontrado:", camino)
\ No newline at end of file
+    print("Camino encontrado:", camino)
+
+    # Búsqueda voraz sobre el 8-puzzle (PuzzleDeslizante de 00009_Problema_Implicito.py): ningún estado se genera
+    # antes de que la búsqueda lo pida. La solución óptima de este estado tiene 31 movimientos; la voraz encuentra
+    # una mucho más larga.
+    implicito = cargar_modulo('00001_Busqueda_No_Info/00009_Problema_Implicito.py')
+    camino_puzzle = busqueda_voraz_problema(implicito.PuzzleDeslizante([8, 6, 7, 2, 5, 4, 3, 0, 1]))
+    print("8-puzzle (voraz):", len(camino_puzzle) - 1, "movimientos")
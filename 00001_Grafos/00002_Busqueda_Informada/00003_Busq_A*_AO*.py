@@ -1,11 +1,39 @@
 import heapq # Importa la librería 'heapq', que proporciona una implementación de una cola de prioridad (min-heap). Necesaria para A* y Búsqueda Voraz para extraer eficientemente el nodo con menor costo estimado.
+# Importa time para medir la duración de cada fase en las estadísticas.
+import time  # Reloj monotónico (perf_counter)
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import agotar, cargar_modulo, registrar  # Búsqueda por pasos, archivos numerados, estadísticas
 
 # --- Implementación del algoritmo de Búsqueda A* (A-estrella) ---
 # A* es un algoritmo de búsqueda del camino más corto en un grafo ponderado que utiliza una función heurística
 # para guiar su búsqueda, combinando el costo real desde el inicio (g_score) con una estimación del costo hasta el objetivo (h_score).
 # La prioridad de un nodo se basa en f_score = g_score + h_score.
 # Recibe: grafo, inicio, objetivo, y una función heuristica h(nodo, objetivo).
-def a_star(grafo, inicio, objetivo, heuristica):
+# Si la heurística tiene un método 'lote(nodos, objetivo)' (HeuristicaMemo de 00001_Heuristicas.py), los vecinos
+# mejorados en cada expansión se evalúan con una sola llamada.
+# Opcionalmente 'estadisticas', un diccionario donde se guardan al terminar los contadores de la búsqueda (expandidos,
+# generados, duplicados que no mejoran su g_score, inserciones en la frontera, pico de la frontera) y el tiempo de
+# cada fase (ver registrar en busqueda_comun.py).
+def a_star(grafo, inicio, objetivo, heuristica, estadisticas=None):
+    return agotar(a_star_pasos(grafo, inicio, objetivo, heuristica, estadisticas, informar=False))
+
+# --- A* por pasos ---
+# Generador (ver 00001_Busqueda_No_Info/00012_Busqueda_Por_Pasos.py); es la implementación de a_star.
+# Aquí 'mejor_f' es el f_score del último nodo expandido.
+def a_star_pasos(grafo, inicio, objetivo, heuristica, estadisticas=None, informar=True):
+    # Contadores para 'estadisticas' (se vuelcan solo al terminar). Como en busqueda_a_estrella
+    # (00001_Heuristicas.py), solo se cuentan y se toman tiempos si se pidieron, y las inserciones salen al final de
+    # las extracciones más lo que quede en la frontera.
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    expandidos = generados = 0
+    pico_frontera = 1
+
     # Inicializa la 'frontera' como una cola de prioridad. Almacena tuplas (f_score, nodo).
     # heapq ordena por el primer elemento de la tupla.
     frontera = []  # Cola: (f_score, nodo)
@@ -22,51 +50,78 @@ def a_star(grafo, inicio, objetivo, heuristica):
     # El nodo de inicio no tiene padre.
     padres = {inicio: None}  # Rutas óptimas
 
+    # Evaluación por lotes de la heurística, si la ofrece (None = una llamada por vecino).
+    lote = getattr(heuristica, 'lote', None)
+
     # Bucle principal del algoritmo A*. Continúa mientras haya nodos en la frontera.
     while frontera:
         # Extrae el nodo de la frontera con el menor f_score.
         # heapq.heappop(heap) extrae el elemento con menor prioridad.
-        # Desempaquetamos la tupla, ignorando el f_score extraído (lo guardamos en _) y tomando el nodo.
-        _, actual = heapq.heappop(frontera) # Saca el nodo con menor f_score
+        # Desempaquetamos la tupla: el f_score extraído (solo se usa en el progreso por pasos) y el nodo.
+        f_actual, actual = heapq.heappop(frontera) # Saca el nodo con menor f_score
 
         # Comprueba si el nodo actual es el objetivo.
         if actual == objetivo:
             # Si es el objetivo, hemos encontrado el camino óptimo.
+            t_objetivo = time.perf_counter() if contar else None
             # Inicializa una lista para reconstruir el camino.
             camino = []
             # Retrocede desde el objetivo usando el diccionario de padres.
-            while actual: # Continúa hasta que lleguemos al nodo inicial (donde el padre es None).
+            while actual is not None: # Continúa hasta que lleguemos al nodo inicial (donde el padre es None).
                 # Añade el nodo actual al camino.
                 camino.append(actual)
                 # Se mueve al nodo padre.
                 actual = padres[actual]
             # Invierte el camino para que vaya de inicio a objetivo.
             # Retorna el camino invertido y el costo total para llegar al objetivo (el g_score del objetivo).
-            return camino[::-1], g_score[objetivo] # Camino y costo total
+            resultado = camino[::-1], g_score[objetivo] # Camino y costo total
+            inserciones = expandidos + 1 + len(frontera)  # Con la del inicio
+            registrar(estadisticas, t0, t_objetivo, expandidos=expandidos, generados=generados,
+                      duplicados=generados - (inserciones - 1), inserciones=inserciones, pico_frontera=pico_frontera)
+            return resultado
 
+        expandidos += 1
+        mejorados = []  # Vecinos pendientes de evaluar por lotes (solo si la heurística tiene 'lote')
         # Explora los vecinos del nodo actual.
         # Itera sobre los pares (vecino, costo_de_arista) del diccionario de vecinos en el grafo.
-        for vecino, costo in grafo[actual].items():
+        vecinos = grafo[actual]
+        for vecino, costo in vecinos.items():
             # Calcula el g_score tentativo para el vecino si llegamos a él a través del nodo actual.
             # Es el g_score del nodo actual más el costo de la arista hacia el vecino.
             g_tentativo = g_score[actual] + costo
 
             # Comprueba si este camino al vecino es mejor que cualquier camino encontrado anteriormente.
             # Esto ocurre si el vecino no ha sido visitado antes (no tiene g_score registrado)
-            # O si el costo tentativo es menor que el g_score registrado para el vecino.
+            # O si el costo tentativo es menor que el g_score registrado para el vecino. Si no, se descarta.
             if vecino not in g_score or g_tentativo < g_score[vecino]:
                 # Si este camino es mejor:
                 # Actualiza el padre del vecino para apuntar al nodo actual.
                 padres[vecino] = actual
                 # Actualiza el g_score del vecino con el costo real más bajo encontrado hasta ahora.
                 g_score[vecino] = g_tentativo
+                if lote is not None:
+                    mejorados.append(vecino)
+                    continue
                 # Calcula el f_score para el vecino: g_score actualizado + heurística desde el vecino al objetivo.
                 f_score = g_tentativo + heuristica(vecino, objetivo)
                 # Añade el vecino a la cola de prioridad con su nuevo f_score.
                 heapq.heappush(frontera, (f_score, vecino))
+        # Una sola evaluación para todos los vecinos mejorados, insertados en el mismo orden que sin lotes.
+        if mejorados:
+            for vecino, h in zip(mejorados, lote(mejorados, objetivo)):
+                heapq.heappush(frontera, (g_score[vecino] + h, vecino))
+        if contar:
+            generados += len(vecinos)
+            if len(frontera) > pico_frontera:
+                pico_frontera = len(frontera)
+        if informar:
+            yield {'expandidos': expandidos, 'frontera': len(frontera), 'mejor_f': f_actual}
 
     # Si el bucle termina y no se encontró el objetivo, significa que es inalcanzable.
     # Retorna None para el camino y None para el costo.
+    inserciones = expandidos  # Frontera vacía: todo lo insertado se expandió
+    registrar(estadisticas, t0, None, expandidos=expandidos, generados=generados,
+              duplicados=generados - (inserciones - 1), inserciones=inserciones, pico_frontera=pico_frontera)
     return None, None # No se encontró camino
 
 # --- Implementación del algoritmo AO* ---
@@ -75,7 +130,23 @@ def a_star(grafo, inicio, objetivo, heuristica):
 # Los nodos AND implican que TODOS sus sub-problemas (representados como conjuntos) deben ser resueltos.
 # El grafo para AO* tiene una estructura diferente a la de los grafos para A* o BFS/DFS.
 # Recibe: grafo (con estructura AND/OR), inicio, objetivo, y una función heuristica h(nodo, objetivo).
-def ao_star(grafo, inicio, objetivo, heuristica):
+# Opcionalmente 'estadisticas', un diccionario donde se guardan al terminar los nodos expandidos, las iteraciones
+# del bucle principal, las evaluaciones de costo() (incluidas las que devuelve la tabla 'solucion') y el tiempo
+# total de cada parte: 'tiempo_seleccion' (bajar por el mejor grafo parcial hasta un nodo sin expandir) y
+# 'tiempo_revision' (recalcular costos con costo()).
+def ao_star(grafo, inicio, objetivo, heuristica, estadisticas=None):
+    # Contadores para 'estadisticas' (se vuelcan solo al terminar); costo() los actualiza con 'nonlocal'. El reloj
+    # solo se consulta si se pidieron.
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    evaluaciones = iteraciones = 0
+    tiempo_seleccion = tiempo_revision = 0.0
+
+    # Vuelca las estadísticas antes de cualquier retorno.
+    def terminar():
+        registrar(estadisticas, t0, None, expandidos=len(expandido), iteraciones=iteraciones,
+                  evaluaciones=evaluaciones, tiempo_seleccion=tiempo_seleccion, tiempo_revision=tiempo_revision)
+
     # Diccionario para almacenar la solución encontrada hasta ahora para cada nodo.
     # La clave es el nodo, el valor es una tupla (costo óptimo estimado/conocido, camino óptimo encontrado hasta ahora).
     # Inicialmente, solo conocemos la solución para el objetivo (costo 0, camino a sí mismo).
@@ -87,6 +158,8 @@ def ao_star(grafo, inicio, objetivo, heuristica):
     # Función recursiva anidada para calcular/recalcular el costo óptimo desde un nodo y su camino.
     # Esto se hace propagando los costos hacia arriba desde los nodos expandidos.
     def costo(nodo):
+        nonlocal evaluaciones
+        evaluaciones += 1
         # Si la solución para este nodo ya ha sido calculada (está en 'solucion'), la retorna.
         if nodo in solucion:
             return solucion[nodo][0]
@@ -153,6 +226,8 @@ def ao_star(grafo, inicio, objetivo, heuristica):
     # Bucle principal de AO*. Continúa mientras la solución para el nodo de inicio no sea definitiva
     # (aún no está en 'solucion' o su costo es infinito, indicando que aún no se ha encontrado un camino óptimo completo).
     while inicio not in solucion or solucion[inicio][0] == float('inf'):
+        iteraciones += 1
+        t_fase = time.perf_counter() if contar else 0.0
         # Comienza a trazar el mejor camino parcial desde el inicio.
         nodo = inicio
         # Bucle interno para encontrar un nodo no expandido en el mejor camino parcial actual.
@@ -166,6 +241,7 @@ def ao_star(grafo, inicio, objetivo, heuristica):
                 # Si el camino actual no es viable, la solución desde el inicio es imposible por ahora.
                 # Esto podría indicar inalcanzabilidad o que se necesita explorar otra rama.
                 # En esta implementación, retornamos fallo.
+                terminar()
                 return None, None
             # Obtiene el mejor camino conocido desde el nodo actual.
             camino = solucion[nodo][1]
@@ -178,21 +254,229 @@ def ao_star(grafo, inicio, objetivo, heuristica):
             # significa que la solución actual no lleva a una expansión adicional, pero no ha llegado al objetivo
             # o se atascó. Esto podría indicar inalcanzabilidad o un problema.
             if nodo is None:
+                terminar()
                 return None, None
 
         # Una vez que el bucle interno encuentra un nodo 'nodo' que no ha sido expandido,
         # lo marca como expandido.
         expandido.add(nodo)
+        t_revision = time.perf_counter() if contar else 0.0
+        tiempo_seleccion += t_revision - t_fase
         # Llama a la función 'costo' en este nodo expandido.
         # Esto recalcula el costo y el camino desde este nodo hacia arriba en el árbol de solución parcial,
         # propagando cualquier mejora o nuevo camino encontrado.
         costo(nodo) # Recalcula costos desde este nodo hacia arriba
+        if contar:
+            tiempo_revision += time.perf_counter() - t_revision
 
     # Cuando el bucle principal termina, significa que la solución para el nodo de inicio ha sido finalizada
     # y ya no es infinito.
     # Retorna el camino óptimo y el costo óptimo encontrados para el nodo de inicio.
+    terminar()
     return solucion[inicio][1], solucion[inicio][0]
 
+# --- AO* iterativo con grafo de solución marcado ---
+# ao_star recalcula costo(nodo) recursivamente sobre todo lo que cuelga del nodo en cada vuelta, construye los
+# caminos concatenando listas y no usa la heurística en las hojas, así que no escala a grafos AND-OR grandes.
+# Esta versión es el AO* clásico (Nilsson, Martelli-Montanari), sin recursión:
+# - f(n) es el costo estimado de resolver n: h(n, objetivo) mientras n no se ha expandido; después, el costo de su
+#   mejor conector. Un nodo OR es un único conjunto de alternativas; un nodo AND es una lista de conjuntos, y su costo
+#   es la suma, para cada conjunto, de la mejor alternativa (costo de la arista + f del hijo), igual que en ao_star.
+# - 'marcados' guarda para cada nodo expandido los hijos elegidos. Siguiendo los marcados desde el inicio se obtiene
+#   el mejor grafo de solución parcial. Todas sus hojas sin expandir se expanden en la misma iteración: el grafo
+#   no puede quedar resuelto sin expandirlas, y así se recorre el grafo marcado una vez por cada ola de hojas y no
+#   una vez por cada nodo expandido.
+# - Tras expandir, solo se revisan las hojas expandidas y sus ancestros, de abajo hacia arriba, con una lista de
+#   pendientes. Un padre se revisa solo si el cambio puede afectarle: si el hijo está entre sus marcados o si su
+#   costo bajó.
+# - Un nodo está resuelto cuando es el objetivo o cuando todos sus hijos marcados están resueltos. Los nodos sin
+#   sucesores (salvo el objetivo) quedan con costo infinito, como en ao_star.
+# Retorna (arbol, costo): 'arbol' es el grafo de solución compacto {nodo: [hijos elegidos]} (el objetivo con []);
+# un subproblema compartido aparece una sola vez. aplanar_solucion(arbol, inicio) lo convierte al formato de lista
+# de ao_star. Si no hay solución retorna (None, None). El grafo debe ser acíclico, como en ao_star.
+# Opcionalmente 'estadisticas', un diccionario donde se guardan al terminar los nodos expandidos, las iteraciones, las
+# revisiones de costo, las evaluaciones de la heurística y el tiempo de selección y de revisión.
+def ao_star_iterativo(grafo, inicio, objetivo, heuristica, estadisticas=None):
+    contar = estadisticas is not None  # El reloj solo se consulta si se pidieron estadísticas
+    t0 = time.perf_counter() if contar else None
+    infinito = float('inf')
+    iteraciones = revisiones = 0
+    tiempo_seleccion = tiempo_revision = 0.0
+    f = {inicio: 0 if inicio == objetivo else heuristica(inicio, objetivo)}
+    evaluaciones = 0 if inicio == objetivo else 1  # Evaluaciones de la heurística
+    resueltos = {objetivo}
+    marcados = {}  # nodo expandido -> tupla de hijos elegidos (uno por conjunto)
+    padres = {}  # nodo -> conjunto de padres expandidos
+    profundidad = {inicio: 0}  # Profundidad con la que se descubrió cada nodo (orden de la revisión)
+    expandidos = set()
+
+    # Conjuntos de alternativas de un nodo: un nodo OR es un solo conjunto; un nodo fuera del grafo no tiene ninguno
+    # útil (un conjunto vacío, costo infinito).
+    def conjuntos(nodo):
+        sucesores = grafo.get(nodo, {})
+        return (sucesores,) if isinstance(sucesores, dict) else sucesores
+
+    # Costo, hijos elegidos y estado resuelto de un nodo expandido, a partir del f actual de sus hijos.
+    def revisar(nodo):
+        total, elegidos, resuelto = 0, [], True
+        for conjunto in conjuntos(nodo):
+            mejor, elegido = infinito, None
+            for hijo, costo in conjunto.items():
+                valor = costo + f[hijo]
+                if valor < mejor:
+                    mejor, elegido = valor, hijo
+            total += mejor
+            if elegido is None:
+                resuelto = False
+            else:
+                elegidos.append(elegido)
+                resuelto = resuelto and elegido in resueltos
+        return total, tuple(elegidos), resuelto and total < infinito
+
+    while inicio not in resueltos and f[inicio] < infinito:
+        iteraciones += 1
+        t_fase = time.perf_counter() if contar else 0.0
+        # Selección: las hojas sin expandir ni resolver del mejor grafo de solución parcial (recorrido en
+        # profundidad por los marcados).
+        hojas = []
+        pila, vistos = [inicio], set()
+        while pila:
+            nodo = pila.pop()
+            if nodo in resueltos or nodo in vistos:
+                continue
+            vistos.add(nodo)
+            if nodo in expandidos:
+                pila.extend(marcados[nodo])
+            else:
+                hojas.append(nodo)
+        t_revision = time.perf_counter() if contar else 0.0
+        tiempo_seleccion += t_revision - t_fase
+        if not hojas:
+            break  # Solo pasa si el grafo tiene ciclos
+        # Expansión: los hijos nuevos reciben su heurística y recuerdan a su padre.
+        for hoja in hojas:
+            expandidos.add(hoja)
+            for conjunto in conjuntos(hoja):
+                for hijo in conjunto:
+                    if hijo not in f:
+                        f[hijo] = 0 if hijo == objetivo else heuristica(hijo, objetivo)
+                        evaluaciones += hijo != objetivo
+                        profundidad[hijo] = profundidad[hoja] + 1
+                    padres.setdefault(hijo, set()).add(hoja)
+        # Revisión de abajo hacia arriba: las hojas y, mientras algo cambie, los ancestros afectados. Los pendientes
+        # salen del más profundo al menos profundo, para que cada ancestro se revise después de sus descendientes
+        # (el orden solo afecta a cuántas veces se revisa un nodo, no al resultado).
+        pendientes = [(-profundidad[hoja], i, hoja) for i, hoja in enumerate(hojas)]
+        heapq.heapify(pendientes)
+        en_pendientes = set(hojas)
+        contador = len(pendientes)
+        while pendientes:
+            nodo = heapq.heappop(pendientes)[2]
+            en_pendientes.discard(nodo)
+            revisiones += 1
+            nuevo, elegidos, resuelto = revisar(nodo)
+            anterior = f[nodo]
+            cambio_resuelto = resuelto != (nodo in resueltos)
+            marcados[nodo] = elegidos
+            if nuevo == anterior and not cambio_resuelto:
+                continue
+            f[nodo] = nuevo
+            if resuelto:
+                resueltos.add(nodo)
+            else:
+                resueltos.discard(nodo)
+            for padre in padres.get(nodo, ()):
+                if padre not in en_pendientes and (nuevo < anterior or nodo in marcados[padre]):
+                    contador += 1
+                    heapq.heappush(pendientes, (-profundidad[padre], contador, padre))
+                    en_pendientes.add(padre)
+        if contar:
+            tiempo_revision += time.perf_counter() - t_revision
+
+    t_objetivo = time.perf_counter() if contar else None
+    resultado = (None, None)
+    if inicio in resueltos:
+        # Grafo de solución compacto: los marcados alcanzables desde el inicio.
+        arbol = {}
+        pila = [inicio]
+        while pila:
+            nodo = pila.pop()
+            if nodo not in arbol:
+                arbol[nodo] = [] if nodo == objetivo else list(marcados[nodo])
+                pila.extend(arbol[nodo])
+        resultado = (arbol, f[inicio])
+    registrar(estadisticas, t0, t_objetivo, expandidos=len(expandidos), iteraciones=iteraciones,
+              revisiones=revisiones, evaluaciones_heuristica=evaluaciones, tiempo_seleccion=tiempo_seleccion,
+              tiempo_revision=tiempo_revision)
+    return resultado
+
+# Convierte el árbol de ao_star_iterativo en la lista de ao_star: el nodo seguido de las listas de sus hijos elegidos,
+# en orden (un recorrido en preorden; los subproblemas compartidos se repiten).
+def aplanar_solucion(arbol, inicio):
+    lista = []
+    pila = [inicio]
+    while pila:
+        nodo = pila.pop()
+        lista.append(nodo)
+        pila.extend(reversed(arbol[nodo]))
+    return lista
+
+# --- A* sobre un problema implícito ---
+# Igual que a_star, pero sobre el protocolo de 00009_Problema_Implicito.py (en 00001_Busqueda_No_Info):
+# los vecinos y costos salen de problema.sucesores(estado), h(n) es problema.heuristica(estado) y la meta se
+# reconoce con problema.es_objetivo. La tabla 'g_score' se indexa por clave y guarda (g, clave del padre, estado),
+# así que solo crece con los estados generados. La frontera guarda (f, g, clave); las entradas con un g peor que
+# el registrado quedaron obsoletas y se descartan al extraerlas.
+# Retorna (camino de estados, costo) o (None, None).
+# 'estadisticas' recibe los mismos contadores que en a_star, más las entradas obsoletas descartadas ('obsoletos').
+# Solo se cuenta si se pide: los sucesores de cada estado se guardan entonces en una lista para contarlos, y las
+# inserciones salen al final de las extracciones más lo que quede en la frontera.
+def a_star_problema(problema, estadisticas=None):
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    expandidos = generados = obsoletos = 0
+    pico_frontera = 1
+    inicial = problema.estado_inicial
+    clave_inicial = problema.clave(inicial)
+    frontera = [(problema.heuristica(inicial), 0, clave_inicial)]
+    g_score = {clave_inicial: (0, None, inicial)}
+    while frontera:
+        _, g, clave = heapq.heappop(frontera)
+        mejor_g, _, actual = g_score[clave]
+        if g > mejor_g:
+            obsoletos += 1
+            continue
+        if problema.es_objetivo(actual):
+            t_objetivo = time.perf_counter() if contar else None
+            camino = []
+            while clave is not None:
+                _, clave, estado = g_score[clave]
+                camino.append(estado)
+            inserciones = expandidos + obsoletos + 1 + len(frontera)  # Con la del estado inicial
+            registrar(estadisticas, t0, t_objetivo, expandidos=expandidos, generados=generados,
+                      duplicados=generados - (inserciones - 1), obsoletos=obsoletos, inserciones=inserciones,
+                      pico_frontera=pico_frontera)
+            return camino[::-1], g
+        sucesores = problema.sucesores(actual)
+        if contar:
+            sucesores = list(sucesores)
+        for vecino, costo in sucesores:
+            g_tentativo = g + costo
+            clave_vecino = problema.clave(vecino)
+            if clave_vecino not in g_score or g_tentativo < g_score[clave_vecino][0]:
+                g_score[clave_vecino] = (g_tentativo, clave, vecino)
+                heapq.heappush(frontera, (g_tentativo + problema.heuristica(vecino), g_tentativo, clave_vecino))
+        if contar:
+            expandidos += 1
+            generados += len(sucesores)
+            if len(frontera) > pico_frontera:
+                pico_frontera = len(frontera)
+    inserciones = expandidos + obsoletos
+    registrar(estadisticas, t0, None, expandidos=expandidos, generados=generados,
+              duplicados=generados - (inserciones - 1), obsoletos=obsoletos, inserciones=inserciones,
+              pico_frontera=pico_frontera)
+    return None, None
+
 # --- Ejemplos de uso ---
 
 # Grafo de ejemplo para A*. Es un grafo dirigido con pesos en las aristas.
@@ -234,4 +518,17 @@ grafo_ao = {
 # AO* busca un subgrafo de solución que sea el de menor costo total.
 camino_ao, costo_ao = ao_star(grafo_ao, 'A', 'F', h_simple)
 # Imprime el resultado de AO*. El "camino" para AO* es más bien el conjunto de nodos que componen el plan óptimo.
-print(f"AO*: Camino {camino_ao}, Costo {costo_ao}")
\ No newline at end of file
+print(f"AO*: Camino {camino_ao}, Costo {costo_ao}")
+
+# AO* iterativo sobre el mismo grafo: retorna el grafo de solución compacto {nodo: [hijos elegidos]}.
+arbol_ao, costo_ao = ao_star_iterativo(grafo_ao, 'A', 'F', h_simple)
+print(f"AO* iterativo: Solución {arbol_ao}, Costo {costo_ao}, Lista {aplanar_solucion(arbol_ao, 'A')}")
+
+# A* sobre el 8-puzzle (PuzzleDeslizante de 00009_Problema_Implicito.py en 00001_Busqueda_No_Info): el espacio
+# tiene 181440 estados alcanzables, pero solo se generan los que A* necesita.
+# Este ejemplo tarda bastante más que los anteriores, así que solo se ejecuta cuando el script se corre directamente
+# (no al cargar el archivo desde otros módulos).
+if __name__ == "__main__":
+    implicito = cargar_modulo('00001_Busqueda_No_Info/00009_Problema_Implicito.py')
+    camino_puzzle, costo_puzzle = a_star_problema(implicito.PuzzleDeslizante([8, 6, 7, 2, 5, 4, 3, 0, 1]))
+    print(f"A* (8-puzzle): {costo_puzzle} movimientos")
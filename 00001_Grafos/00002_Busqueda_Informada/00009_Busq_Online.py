@@ -1,5 +1,13 @@
 import heapq # Importa la librería 'heapq'. Aunque está importada, esta implementación específica de LRTA* no la utiliza para una cola de prioridad. Los nodos se seleccionan basándose en la mejor opción local después de actualizar la heurística.
 import math # Importa la librería 'math', utilizada aquí para acceder a 'math.inf' (infinito positivo), usado como valor inicial para encontrar el mínimo.
+import time # Importa 'time' para medir la duración de la búsqueda en las estadísticas (reloj monotónico perf_counter).
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import registrar  # Volcado de contadores y tiempos en 'estadisticas'
 
 # Define una clase para encapsular la lógica de búsqueda online, incluyendo el aprendizaje de la heurística.
 # La búsqueda online implica que el agente explora el entorno paso a paso, aprendiendo a medida que avanza.
@@ -17,7 +25,14 @@ class BusquedaOnline:
     # LRTA* es un algoritmo de búsqueda online que actualiza su estimación heurística
     # h(n) = min_{n' \in successors(n)} (costo(n, n') + h(n')). Se mueve al sucesor con el mínimo costo + h.
     # Recibe: el nodo de inicio y el nodo objetivo.
-    def lrta_star(self, inicio, objetivo):
+    # Opcionalmente 'estadisticas', un diccionario donde se guardan al terminar los movimientos del agente, los vecinos
+    # evaluados (generados), las actualizaciones de H que cambiaron su valor, los nodos con heurística aprendida y
+    # el tiempo de la búsqueda. (El camino es el propio recorrido, así que tiempo_reconstruccion es 0.)
+    def lrta_star(self, inicio, objetivo, estadisticas=None):
+        # Contadores para 'estadisticas' (se vuelcan solo al terminar). Sin 'estadisticas' no se cuenta ni se mide.
+        contar = estadisticas is not None
+        t0 = time.perf_counter() if contar else None
+        generados = actualizaciones = 0
         # Inicializa el nodo actual al nodo de inicio.
         actual = inicio
         # Inicializa la lista del camino tomado por el agente.
@@ -40,7 +55,10 @@ class BusquedaOnline:
             # Explora los vecinos del nodo actual. En un agente online, esta información (vecinos y costos)
             # se obtiene del entorno al estar en el nodo 'actual'.
             # Itera sobre los pares (vecino, costo_arista) para todas las salidas del nodo 'actual'.
-            for vecino, costo in self.grafo[actual].items():
+            vecinos = self.grafo[actual]
+            if contar:
+                generados += len(vecinos)
+            for vecino, costo in vecinos.items():
                 # Obtiene la heurística aprendida para el vecino. Si no está en H, usa la heurística inicial (base).
                 # self.H.get(vecino, ...) es una forma segura de acceder a un diccionario con un valor por defecto.
                 h_vecino = self.H.get(vecino, self.heuristica(vecino, objetivo))
@@ -59,6 +77,8 @@ class BusquedaOnline:
             # La nueva heurística aprendida h(actual) es el mínimo valor encontrado entre sus sucesores
             # (costo al sucesor + h_aprendida del sucesor).
             # Esto garantiza que h(n) nunca sobreestime el costo real + h*(n'), donde h* es la heurística óptima.
+            if contar and self.H[actual] != mejor_valor:
+                actualizaciones += 1 # El valor aprendido cambió.
             self.H[actual] = mejor_valor # Actualiza h(n) usando min_{n'} (costo(n, n') + h(n'))
 
             # El agente se mueve al mejor vecino encontrado.
@@ -68,6 +88,8 @@ class BusquedaOnline:
 
         # Una vez que el bucle termina (cuando actual == objetivo), significa que el agente ha llegado a la meta.
         # Retorna el camino que el agente tomó.
+        registrar(estadisticas, t0, None, movimientos=len(camino) - 1, generados=generados,
+                  actualizaciones=actualizaciones, nodos_aprendidos=len(self.H))
         return camino
 
 # Este bloque de código solo se ejecuta cuando el script se corre directamente.
@@ -109,9 +131,14 @@ if __name__ == "__main__":
 
     # Llama al método lrta_star para encontrar un camino desde 'A' hasta 'H'.
     # La búsqueda se realiza de forma online y la heurística se actualiza durante el recorrido.
-    camino = buscador.lrta_star('A', 'H')
+    # El diccionario 'estadisticas' recoge los contadores del recorrido; solo contiene números, así que se puede
+    # exportar con json.dumps.
+    import json
+    estadisticas = {}
+    camino = buscador.lrta_star('A', 'H', estadisticas)
 
     # Imprime el camino que el agente tomó para llegar al objetivo.
     print("Camino encontrado:", camino)
     # Imprime el diccionario H que contiene los valores de heurística aprendidos para los nodos visitados durante la búsqueda.
-    print("Heurística aprendida:", buscador.H)
\ No newline at end of file
+    print("Heurística aprendida:", buscador.H)
+    print("Estadísticas:", json.dumps(estadisticas))
\ No newline at end of file
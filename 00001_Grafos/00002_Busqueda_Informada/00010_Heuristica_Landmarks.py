@@ -0,0 +1,304 @@
+# Importa heapq para los Dijkstra del preprocesamiento.
+import heapq  # Cola de prioridad (min-heap)
+# Importa os y pickle para guardar en disco la lista de nodos junto a las tablas.
+import os  # Rutas de los archivos de las tablas
+import pickle  # Lista de nodos (etiquetas arbitrarias: cadenas, tuplas...)
+# Importa sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import sys  # Ruta de búsqueda de módulos
+# Importa random para elegir el nodo de partida de la selección de landmarks con semilla.
+import random  # Selección reproducible
+# Importa numpy para las tablas de distancias (float32) y su lectura con memmap.
+import numpy as np  # Tablas compactas y cálculo vectorizado de la cota
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import aristas, cargar_modulo  # Pares (vecino, costo), carga de archivos numerados
+
+# --- Heurística ALT (A*, Landmarks y desigualdad Triangular) ---
+# Cuando se hacen muchas consultas punto a punto sobre el mismo grafo ponderado, la heurística de siempre es nula
+# (h_simple) o una cota geométrica débil. ALT invierte una vez en un preprocesamiento:
+# 1. Se eligen k nodos "landmark" L, repartidos por la periferia del grafo.
+# 2. Para cada landmark se guardan las distancias desde L a todos los nodos, d(L, v), y desde todos los nodos
+#    hasta L, d(v, L) (en un grafo dirigido no son iguales).
+# 3. Por la desigualdad triangular, para cualquier par (v, t) y cualquier landmark L:
+#       d(v, t) >= d(v, L) - d(t, L)     y     d(v, t) >= d(L, t) - d(L, v)
+#    El máximo de esas cotas sobre todos los landmarks es una heurística admisible (y consistente) que suele ser
+#    mucho más ajustada que la geométrica, así que A* expande muchos menos nodos.
+# Las tablas son arreglos float32 de forma (n, k): la fila de un nodo (sus k distancias) es contigua en memoria.
+# Se guardan con np.save y se abren con memmap: los procesos de trabajo solo mapean el archivo, el sistema
+# operativo comparte sus páginas entre todos y nadie recalcula nada.
+
+# Dijkstra sobre listas de adyacencia de enteros, desde un origen.
+# Retorna (distancias, padres, orden): las distancias como arreglo float64 (inf si no se alcanza), los padres del
+# árbol de caminos mínimos (-1 = sin padre) y los nodos en el orden en que se asentaron (cada padre antes que
+# sus hijos, incluso con aristas de costo 0).
+# Trabaja con listas de Python y convierte al final: leer y escribir posiciones sueltas de un arreglo numpy
+# es varias veces más lento.
+def _dijkstra(adyacentes, origen):
+    n = len(adyacentes)
+    inf = float('inf')
+    distancias = [inf] * n
+    padres = [-1] * n
+    distancias[origen] = 0.0
+    cola = [(0.0, origen)]
+    asentados = bytearray(n)
+    orden = []
+    while cola:
+        d, actual = heapq.heappop(cola)
+        if asentados[actual]:
+            continue  # Entrada obsoleta
+        asentados[actual] = 1
+        orden.append(actual)
+        for vecino, costo in adyacentes[actual]:
+            nueva = d + costo
+            if nueva < distancias[vecino]:
+                distancias[vecino] = nueva
+                padres[vecino] = actual
+                heapq.heappush(cola, (nueva, vecino))
+    return np.array(distancias), padres, orden
+
+# Heurística ALT. Se construye con HeuristicaALT.preprocesar(grafo, ...) o HeuristicaALT.cargar(directorio).
+# Se usa como cualquier heurística: busqueda_a_estrella(grafo, inicio, objetivo, alt), y también ofrece
+# 'lote(nodos, objetivo)', así que A* evalúa todos los vecinos de una expansión en una sola operación.
+# Atributos:
+# - nodos: Lista de etiquetas; nodos[i] es el nodo con id i.
+# - indice: Diccionario etiqueta -> id.
+# - landmarks: Ids de los landmarks elegidos.
+# - desde: float32 (n, k), desde[v, j] = d(landmark j, v).
+# - hacia: float32 (n, k), hacia[v, j] = d(v, landmark j).
+# - holgura: Cantidad que se resta a la cota para compensar el redondeo a float32 (ver _holgura).
+class HeuristicaALT:
+    def __init__(self, nodos, landmarks, desde, hacia):
+        self.nodos = list(nodos)
+        self.indice = {nodo: i for i, nodo in enumerate(self.nodos)}
+        self.landmarks = list(landmarks)
+        # np.asarray quita la subclase memmap sin copiar (sigue leyendo del archivo mapeado): las operaciones
+        # sobre np.memmap crean objetos memmap intermedios y cada llamada de la heurística sería más lenta.
+        self.desde = np.asarray(desde)
+        self.hacia = np.asarray(hacia)
+        self.holgura = self._holgura(desde, hacia)
+
+    # float32 guarda unas 7 cifras: cada distancia puede estar redondeada hacia arriba o hacia abajo en
+    # eps * |d|, así que una diferencia de dos distancias puede pasarse del valor real en hasta 2 * eps * max|d|.
+    # Restar esa cantidad mantiene la cota admisible (nunca sobreestima) a cambio de una pérdida despreciable.
+    @staticmethod
+    def _holgura(desde, hacia):
+        finitos = [float(np.max(t, initial=0.0, where=np.isfinite(t))) for t in (desde, hacia)]
+        return 2.0 * float(np.finfo(np.float32).eps) * max(finitos)
+
+    # Preprocesa un grafo ponderado ({nodo: {vecino: costo}} o {nodo: [(vecino, costo)]}, costos no negativos).
+    # - k: Número de landmarks (más landmarks = cota más ajustada, pero más memoria y más trabajo por llamada).
+    # - estrategia: 'lejano' (farthest-point: cada landmark es el nodo más alejado de los ya elegidos) o
+    #               'evitar' (avoid: cada landmark se coloca en la zona del árbol de caminos mínimos de un nodo
+    #               al azar donde la cota actual es peor).
+    # - semilla: Semilla del nodo de partida, para que el preprocesamiento sea reproducible.
+    # Hace 2k Dijkstra (uno hacia adelante y otro sobre el grafo inverso por landmark), más los de la selección.
+    @classmethod
+    def preprocesar(cls, grafo, k=8, estrategia='lejano', semilla=0):
+        if estrategia not in ('lejano', 'evitar'):
+            raise ValueError(f"Estrategia desconocida: {estrategia}")
+        # Ids 0..n-1: primero las claves del grafo y luego los nodos que solo aparecen como destino.
+        indice = {nodo: i for i, nodo in enumerate(grafo)}
+        for vecinos in grafo.values():
+            for vecino, _ in aristas(vecinos):
+                if vecino not in indice:
+                    indice[vecino] = len(indice)
+        nodos = list(indice)
+        n = len(nodos)
+        adelante = [[] for _ in range(n)]
+        atras = [[] for _ in range(n)]
+        for nodo, vecinos in grafo.items():
+            i = indice[nodo]
+            for vecino, costo in aristas(vecinos):
+                adelante[i].append((indice[vecino], costo))
+                atras[indice[vecino]].append((i, costo))
+
+        k = min(k, n)
+        rng = random.Random(semilla)
+        desde = np.empty((n, k), dtype=np.float32)
+        hacia = np.empty((n, k), dtype=np.float32)
+        landmarks = []
+        # Distancia mínima de cada nodo a los landmarks elegidos (para 'lejano').
+        cercania = np.full(n, np.inf)
+        for j in range(k):
+            if estrategia == 'lejano':
+                if j == 0:
+                    # El primero es el nodo más alejado de uno elegido al azar (así cae en la periferia).
+                    distancias = _dijkstra(adelante, rng.randrange(n))[0]
+                    landmark = cls._mas_lejano(distancias)
+                else:
+                    landmark = cls._mas_lejano(cercania, excluidos=landmarks)
+            else:
+                landmark = cls._evitar(adelante, atras, desde[:, :j], hacia[:, :j], rng, landmarks)
+            landmarks.append(landmark)
+            distancias = _dijkstra(adelante, landmark)[0]
+            desde[:, j] = distancias
+            inverso = _dijkstra(atras, landmark)[0]
+            hacia[:, j] = inverso
+            cercania = np.minimum(cercania, np.minimum(distancias, inverso))
+        return cls(nodos, landmarks, desde, hacia)
+
+    # Id del nodo con la mayor distancia finita (los inalcanzables, con inf, no sirven de landmark).
+    @staticmethod
+    def _mas_lejano(distancias, excluidos=()):
+        candidatas = np.where(np.isfinite(distancias), distancias, -1.0)
+        for landmark in excluidos:
+            candidatas[landmark] = -1.0
+        return int(np.argmax(candidatas))
+
+    # Estrategia 'avoid' (Goldberg y Harrelson): se elige un nodo r al azar y su árbol de caminos mínimos.
+    # Cada nodo v pesa d(r, v) - cota(r, v): cuánto subestima la cota actual. El tamaño de un nodo es la suma de
+    # los pesos de su subárbol, o 0 si el subárbol ya contiene un landmark. Se baja desde r siempre por el hijo de
+    # mayor tamaño hasta llegar a una hoja, que es el nuevo landmark: queda en la zona peor cubierta.
+    @classmethod
+    def _evitar(cls, adelante, atras, desde, hacia, rng, landmarks):
+        n = len(adelante)
+        raiz = rng.randrange(n)
+        distancias, padres, orden = _dijkstra(adelante, raiz)
+        if desde.shape[1]:
+            with np.errstate(invalid='ignore'):
+                cotas = np.fmax(hacia[raiz] - hacia, desde - desde[raiz]).astype(np.float64)
+                cota = np.fmax.reduce(cotas, axis=1)
+            cota = np.where(cota > 0, cota, 0.0)
+        else:
+            cota = np.zeros(n)
+        with np.errstate(invalid='ignore'):  # inf - inf en los nodos que la raíz no alcanza (peso 0)
+            peso = np.where(np.isfinite(distancias), distancias - cota, 0.0)
+        # Tamaños de abajo hacia arriba: se recorre el orden de asentamiento al revés (hijos antes que padres).
+        tamano = peso.tolist()
+        con_landmark = [False] * n
+        for landmark in landmarks:
+            con_landmark[landmark] = True
+        hijos = [[] for _ in range(n)]
+        for v in reversed(orden):
+            p = padres[v]
+            if p >= 0:
+                hijos[p].append(v)
+                con_landmark[p] |= con_landmark[v]
+                tamano[p] += tamano[v]
+        for v in orden:
+            if con_landmark[v]:
+                tamano[v] = 0.0
+        actual = raiz
+        while hijos[actual]:
+            mejor = max(hijos[actual], key=lambda h: tamano[h])
+            if tamano[mejor] <= 0:
+                break
+            actual = mejor
+        if actual in landmarks:  # Todo el árbol ya está cubierto: se toma el más lejano aún libre
+            actual = cls._mas_lejano(distancias, excluidos=landmarks)
+        return int(actual)
+
+    # Cota inferior de d(nodo, objetivo): máximo de las cotas triangulares de todos los landmarks.
+    # Si la cota es infinita, el objetivo no es alcanzable desde el nodo (A* lo deja al final de la frontera).
+    def __call__(self, nodo, objetivo):
+        v, t = self.indice[nodo], self.indice[objetivo]
+        with np.errstate(invalid='ignore'):
+            cota = float(np.fmax.reduce(np.fmax(self.hacia[v] - self.hacia[t], self.desde[t] - self.desde[v])))
+        # nan (inf - inf en todos los landmarks) o cotas negativas: la única cota segura es 0.
+        return cota - self.holgura if cota > self.holgura else 0.0
+
+    # Cotas de una lista de nodos hacia el mismo objetivo, con una sola operación sobre las filas de la tabla.
+    def lote(self, nodos, objetivo):
+        indice = self.indice
+        filas = np.fromiter((indice[nodo] for nodo in nodos), dtype=np.intp, count=len(nodos))
+        t = indice[objetivo]
+        with np.errstate(invalid='ignore'):
+            cotas = np.fmax.reduce(np.fmax(self.hacia[filas] - self.hacia[t], self.desde[t] - self.desde[filas]),
+                                   axis=1).astype(np.float64)
+        return np.where(cotas > self.holgura, cotas - self.holgura, 0.0).tolist()
+
+    # Guarda las tablas en un directorio: desde.npy y hacia.npy (float32) y nodos.pkl (etiquetas y landmarks).
+    def guardar(self, directorio):
+        os.makedirs(directorio, exist_ok=True)
+        np.save(os.path.join(directorio, 'desde.npy'), np.ascontiguousarray(self.desde))
+        np.save(os.path.join(directorio, 'hacia.npy'), np.ascontiguousarray(self.hacia))
+        with open(os.path.join(directorio, 'nodos.pkl'), 'wb') as f:
+            pickle.dump((self.nodos, self.landmarks), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # Carga unas tablas guardadas. Con mmap=True (por defecto) las tablas no se leen: se mapean en memoria de solo
+    # lectura y el sistema operativo trae cada página cuando se usa (y la comparte entre procesos).
+    @classmethod
+    def cargar(cls, directorio, mmap=True):
+        modo = 'r' if mmap else None
+        desde = np.load(os.path.join(directorio, 'desde.npy'), mmap_mode=modo)
+        hacia = np.load(os.path.join(directorio, 'hacia.npy'), mmap_mode=modo)
+        with open(os.path.join(directorio, 'nodos.pkl'), 'rb') as f:
+            nodos, landmarks = pickle.load(f)
+        return cls(nodos, landmarks, desde, hacia)
+
+    # Memoria de las dos tablas, en bytes.
+    def bytes_tablas(self):
+        return self.desde.nbytes + self.hacia.nbytes
+
+# Trabajador del ejemplo con procesos: cada proceso abre las tablas desde disco (sin recalcularlas) al iniciarse.
+# busqueda_a_estrella está en 00001_Heuristicas.py, que se carga por ruta (ver cargar_modulo).
+_ALT = None
+_GRAFO = None
+_A_ESTRELLA = None
+
+def _iniciar_trabajador(directorio, grafo):
+    global _ALT, _GRAFO, _A_ESTRELLA
+    _ALT = HeuristicaALT.cargar(directorio)
+    _GRAFO = grafo
+    _A_ESTRELLA = cargar_modulo('00002_Busqueda_Informada/00001_Heuristicas.py').busqueda_a_estrella
+
+def _consultar(consulta):
+    inicio, objetivo = consulta
+    return _A_ESTRELLA(_GRAFO, inicio, objetivo, _ALT)[1]
+
+# Este bloque de código se ejecuta solo cuando el script se corre directamente.
+if __name__ == "__main__":
+    import tempfile
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    heuristicas = cargar_modulo('00002_Busqueda_Informada/00001_Heuristicas.py')
+    _a_estrella = heuristicas.busqueda_a_estrella
+
+    # Mapa de 120x120 casillas con costos aleatorios de 1 a 10 por arista (como un mapa de carreteras con tráfico).
+    rng = random.Random(7)
+    lado = 120
+    grafo = {(f, c): {} for f in range(lado) for c in range(lado)}
+    for f in range(lado):
+        for c in range(lado):
+            for f2, c2 in ((f + 1, c), (f, c + 1)):
+                if f2 < lado and c2 < lado:
+                    grafo[(f, c)][(f2, c2)] = grafo[(f2, c2)][(f, c)] = rng.randint(1, 10)
+    consultas = [(rng.choice(list(grafo)), rng.choice(list(grafo))) for _ in range(40)]
+
+    def h_nula(nodo, objetivo):
+        return 0
+
+    for estrategia in ('lejano', 'evitar'):
+        t0 = time.perf_counter()
+        alt = HeuristicaALT.preprocesar(grafo, k=8, estrategia=estrategia)
+        print(f"Preprocesamiento '{estrategia}': {time.perf_counter() - t0:.2f} s, "
+              f"{alt.bytes_tablas() / 1024:.0f} KB de tablas, landmarks {[alt.nodos[l] for l in alt.landmarks]}")
+
+    # Tablas en disco: otro proceso (o esta misma sesión) las abre con memmap sin recalcularlas.
+    # El directorio temporal se borra al salir del bloque, después de usar las tablas en el pool.
+    with tempfile.TemporaryDirectory() as directorio:
+        alt.guardar(directorio)
+        alt = HeuristicaALT.cargar(directorio)
+
+        # La distancia Manhattan (por el costo mínimo de una arista, 1) es admisible pero débil con costos de
+        # hasta 10.
+        costos_referencia = None
+        for nombre, h in (("nula", h_nula), ("Manhattan", heuristicas.heuristica_manhattan), ("ALT", alt)):
+            estadisticas = {}
+            expandidos = 0
+            t0 = time.perf_counter()
+            costos = []
+            for inicio, objetivo in consultas:
+                _, costo = _a_estrella(grafo, inicio, objetivo, h, estadisticas=estadisticas)
+                costos.append(costo)
+                expandidos += estadisticas['expandidos']
+            costos_referencia = costos_referencia or costos
+            print(f"A* con h {nombre}: {expandidos} nodos expandidos, {time.perf_counter() - t0:.2f} s, "
+                  f"mismos costos que con h nula: {costos == costos_referencia}")
+
+        # Consultas en un pool de procesos: cada trabajador mapea las tablas del disco al iniciarse.
+        with ProcessPoolExecutor(max_workers=2, initializer=_iniciar_trabajador, initargs=(directorio, grafo)) as pool:
+            costos_pool = list(pool.map(_consultar, consultas))
+        print("Consultas en 2 procesos con las tablas mapeadas:", costos_pool == costos_referencia)
@@ -0,0 +1,309 @@
+# Importa heapq para las colas de prioridad (orden de contracción, búsquedas de testigos y consultas).
+import heapq  # Cola de prioridad (min-heap)
+# Importa pickle para guardar y cargar la jerarquía ya preprocesada.
+import pickle  # Serialización de la jerarquía
+# Importa time para las estadísticas de preprocesamiento y de consulta.
+import time  # Reloj monotónico (perf_counter)
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import aristas  # Pares (vecino, costo) de una lista de adyacencia ponderada
+
+# --- Jerarquías de contracción (Contraction Hierarchies, CH) ---
+# Incluso un buen A* asienta decenas de miles de nodos por consulta en un mapa grande. Las jerarquías de
+# contracción preprocesan el grafo una vez para que cada consulta asiente solo unos cientos:
+# 1. Se ordenan los nodos por "importancia" y se contraen de menos a más importante. Contraer un nodo v es
+#    quitarlo del grafo añadiendo un atajo u -> w (con costo c(u, v) + c(v, w)) por cada par de vecinos cuyo
+#    único camino mínimo pasaba por v. Para saberlo se hace una búsqueda local de "testigos": si hay otro
+#    camino de u a w igual de corto que no pasa por v, el atajo sobra.
+# 2. El rango de un nodo es su posición en ese orden. El grafo final (aristas originales + atajos) se parte en
+#    dos: las aristas que suben de rango (para la búsqueda desde el inicio) y las que bajan (que se recorren al
+#    revés desde el objetivo).
+# 3. Una consulta es un Dijkstra bidireccional en el que ambos lados solo suben de rango. Los dos lados se
+#    encuentran en el nodo más importante del camino mínimo, y los atajos del camino se "desempaquetan"
+#    recursivamente (cada atajo recuerda el nodo contraído que reemplaza) hasta obtener aristas originales.
+# Importancia de un nodo (menor = se contrae antes), recalculada de forma perezosa al sacarlo de la cola:
+#   atajos que añadiría - aristas que elimina + vecinos ya contraídos
+# El primer término mantiene el grafo disperso; el último reparte las contracciones por todo el grafo.
+
+# Búsqueda de testigos: Dijkstra local desde 'origen' en el grafo que queda (sin el nodo 'excluido'), que se corta
+# al superar 'limite_costo' o al asentar 'max_asentados' nodos.
+# Retorna {nodo: distancia} con las distancias alcanzadas; cada una es el costo de un camino real que no pasa por
+# 'excluido', así que sirve de testigo aunque no sea la mínima. Cortar la búsqueda solo puede añadir atajos de más,
+# nunca romper la corrección.
+def _testigos(salientes, origen, excluido, limite_costo, max_asentados):
+    distancias = {origen: 0}
+    cola = [(0, origen)]
+    asentados = 0
+    while cola:
+        d, actual = heapq.heappop(cola)
+        if d > distancias[actual]:
+            continue  # Entrada obsoleta
+        if d > limite_costo or asentados >= max_asentados:
+            break
+        asentados += 1
+        for vecino, (costo, _) in salientes[actual].items():
+            if vecino == excluido:
+                continue
+            nueva = d + costo
+            if nueva < distancias.get(vecino, float('inf')):
+                distancias[vecino] = nueva
+                heapq.heappush(cola, (nueva, vecino))
+    return distancias
+
+# Jerarquía de contracción de un grafo ponderado (costos no negativos). Se construye con
+# JerarquiaContraccion.preprocesar(grafo) o JerarquiaContraccion.cargar(ruta) y se consulta con
+# consulta(inicio, objetivo), que retorna (camino, costo) como a_star.
+# Atributos:
+# - nodos: Lista de etiquetas; nodos[i] es el nodo con id i.
+# - indice: Diccionario etiqueta -> id.
+# - rango: rango[i] es la posición del nodo i en el orden de contracción.
+# - arriba: arriba[i] es la lista de (j, costo, medio) de las aristas i -> j que suben de rango.
+# - abajo: abajo[i] es la lista de (j, costo, medio) de las aristas j -> i con j de mayor rango (se recorren al
+#          revés desde el objetivo).
+# - medios: {(i, j): medio} con el nodo contraído que reemplaza cada atajo i -> j (las aristas originales no están).
+class JerarquiaContraccion:
+    def __init__(self, nodos, rango, arriba, abajo, medios):
+        self.nodos = nodos
+        self.indice = {nodo: i for i, nodo in enumerate(nodos)}
+        self.rango = rango
+        self.arriba = arriba
+        self.abajo = abajo
+        self.medios = medios
+
+    # Preprocesa un grafo {nodo: {vecino: costo}} o {nodo: [(vecino, costo)]}.
+    # - max_asentados: Límite de cada búsqueda de testigos (más alto = menos atajos, pero preprocesado más lento).
+    # - estadisticas: Diccionario opcional donde se guardan los atajos añadidos, las búsquedas de testigos y el
+    #                 tiempo del preprocesamiento.
+    @classmethod
+    def preprocesar(cls, grafo, max_asentados=500, estadisticas=None):
+        t0 = time.perf_counter()
+        # Ids 0..n-1: primero las claves del grafo y luego los nodos que solo aparecen como destino.
+        indice = {nodo: i for i, nodo in enumerate(grafo)}
+        for vecinos in grafo.values():
+            for vecino, _ in aristas(vecinos):
+                if vecino not in indice:
+                    indice[vecino] = len(indice)
+        nodos = list(indice)
+        n = len(nodos)
+        # Grafo que queda por contraer: salientes[u][w] = entrantes[w][u] = (costo, medio), medio = None si la
+        # arista es original. Con aristas paralelas se queda la más barata; los bucles no sirven para caminos mínimos.
+        salientes = [{} for _ in range(n)]
+        entrantes = [{} for _ in range(n)]
+        for nodo, vecinos in grafo.items():
+            u = indice[nodo]
+            for vecino, costo in aristas(vecinos):
+                w = indice[vecino]
+                if w != u and (w not in salientes[u] or costo < salientes[u][w][0]):
+                    salientes[u][w] = entrantes[w][u] = (costo, None)
+
+        busquedas = 0
+
+        # Atajos que haría falta añadir al contraer v: lista de (u, w, costo).
+        def atajos_de(v):
+            nonlocal busquedas
+            resultado = []
+            if not salientes[v]:
+                return resultado
+            max_salida = max(costo for costo, _ in salientes[v].values())
+            for u, (costo_uv, _) in entrantes[v].items():
+                distancias = _testigos(salientes, u, v, costo_uv + max_salida, max_asentados)
+                busquedas += 1
+                for w, (costo_vw, _) in salientes[v].items():
+                    if w != u and distancias.get(w, float('inf')) > costo_uv + costo_vw:
+                        resultado.append((u, w, costo_uv + costo_vw))
+            return resultado
+
+        contraidos = [0] * n  # Vecinos ya contraídos de cada nodo
+
+        def importancia(v):
+            atajos = atajos_de(v)
+            return len(atajos) - len(salientes[v]) - len(entrantes[v]) + contraidos[v], atajos
+
+        cola = [(importancia(v)[0], v) for v in range(n)]
+        heapq.heapify(cola)
+        rango = [0] * n
+        arriba = [None] * n
+        abajo = [None] * n
+        medios = {}
+        total_atajos = 0
+        siguiente = 0
+        while cola:
+            _, v = heapq.heappop(cola)
+            # Actualización perezosa: la importancia pudo cambiar desde que se calculó. Si ya no es la menor,
+            # el nodo vuelve a la cola con su valor nuevo.
+            prioridad, atajos = importancia(v)
+            if cola and prioridad > cola[0][0]:
+                heapq.heappush(cola, (prioridad, v))
+                continue
+            rango[v] = siguiente
+            siguiente += 1
+            # Las aristas que le quedan a v van a nodos aún no contraídos, es decir, de mayor rango: son justamente
+            # sus aristas "hacia arriba" (salientes) y las que la búsqueda desde el objetivo recorre al revés
+            # (entrantes). Ya no cambiarán, así que se guardan tal cual.
+            arriba[v] = [(w, costo, medio) for w, (costo, medio) in salientes[v].items()]
+            abajo[v] = [(u, costo, medio) for u, (costo, medio) in entrantes[v].items()]
+            for w, (_, medio) in salientes[v].items():
+                if medio is not None:
+                    medios[(v, w)] = medio
+            for u, (_, medio) in entrantes[v].items():
+                if medio is not None:
+                    medios[(u, v)] = medio
+            # Se quita v del grafo restante y se añaden sus atajos.
+            for w in salientes[v]:
+                del entrantes[w][v]
+                contraidos[w] += 1
+            for u in entrantes[v]:
+                del salientes[u][v]
+                contraidos[u] += 1
+            salientes[v] = {}
+            entrantes[v] = {}
+            for u, w, costo in atajos:
+                if w not in salientes[u] or costo < salientes[u][w][0]:
+                    salientes[u][w] = entrantes[w][u] = (costo, v)
+                    total_atajos += 1
+        if estadisticas is not None:
+            estadisticas['atajos'] = total_atajos
+            estadisticas['busquedas_testigos'] = busquedas
+            estadisticas['aristas_arriba'] = sum(len(lista) for lista in arriba)
+            estadisticas['tiempo_preprocesamiento'] = time.perf_counter() - t0
+        return cls(nodos, rango, arriba, abajo, medios)
+
+    # Consulta el camino mínimo de 'inicio' a 'objetivo'. Retorna (camino, costo), o (None, None) si no hay camino.
+    # Dijkstra bidireccional: el lado 0 (desde el inicio) usa 'arriba' y el lado 1 (desde el objetivo) usa 'abajo';
+    # en cada paso avanza el lado con la menor distancia en su cola. Cada nodo asentado en un lado que ya tiene
+    # distancia en el otro es un posible punto de encuentro. Un lado se detiene cuando su mínimo alcanza el mejor
+    # costo encontrado: subir más solo puede dar caminos más caros.
+    # - estadisticas: Diccionario opcional donde se guardan los nodos asentados, las aristas relajadas y el tiempo
+    #                 de la búsqueda y del desempaquetado.
+    def consulta(self, inicio, objetivo, estadisticas=None):
+        t0 = time.perf_counter()
+        s, t = self.indice[inicio], self.indice[objetivo]
+        distancias = ({s: 0}, {t: 0})
+        padres = ({s: None}, {t: None})  # nodo -> (nodo anterior en su lado, medio de la arista)
+        colas = ([(0, s)], [(0, t)])
+        grafos = (self.arriba, self.abajo)
+        mejor, encuentro = float('inf'), None
+        asentados = relajadas = 0
+        while colas[0] or colas[1]:
+            lado = 0 if colas[0] and (not colas[1] or colas[0][0][0] <= colas[1][0][0]) else 1
+            d, actual = heapq.heappop(colas[lado])
+            if d > distancias[lado][actual]:
+                continue  # Entrada obsoleta
+            if d >= mejor:
+                colas[lado].clear()  # Este lado ya no puede mejorar el camino
+                continue
+            asentados += 1
+            otra = distancias[1 - lado].get(actual)
+            if otra is not None and d + otra < mejor:
+                mejor, encuentro = d + otra, actual
+            propias, padres_lado, cola = distancias[lado], padres[lado], colas[lado]
+            for vecino, costo, medio in grafos[lado][actual]:
+                relajadas += 1
+                nueva = d + costo
+                if nueva < propias.get(vecino, float('inf')):
+                    propias[vecino] = nueva
+                    padres_lado[vecino] = (actual, medio)
+                    heapq.heappush(cola, (nueva, vecino))
+        t_encuentro = time.perf_counter()
+        resultado = (None, None)
+        if encuentro is not None:
+            resultado = ([self.nodos[i] for i in self._desempaquetar(padres, s, encuentro)], mejor)
+        if estadisticas is not None:
+            estadisticas['asentados'] = asentados
+            estadisticas['relajadas'] = relajadas
+            estadisticas['tiempo_busqueda'] = t_encuentro - t0
+            estadisticas['tiempo_reconstruccion'] = time.perf_counter() - t_encuentro
+        return resultado
+
+    # Reconstruye el camino de ids de la consulta: las aristas del lado del inicio (de s al encuentro) y las del
+    # lado del objetivo (del encuentro a t), desempaquetando cada atajo en sus dos mitades hasta llegar a aristas
+    # originales. Se usa una pila en lugar de recursión: un atajo puede anidar cientos de niveles.
+    def _desempaquetar(self, padres, s, encuentro):
+        tramos = []  # Aristas (a, b, medio) en orden de s a t
+        nodo = encuentro
+        while padres[0][nodo] is not None:
+            anterior, medio = padres[0][nodo]
+            tramos.append((anterior, nodo, medio))
+            nodo = anterior
+        tramos.reverse()
+        nodo = encuentro
+        while padres[1][nodo] is not None:
+            siguiente, medio = padres[1][nodo]
+            tramos.append((nodo, siguiente, medio))
+            nodo = siguiente
+        camino = [s]
+        pila = tramos[::-1]
+        while pila:
+            a, b, medio = pila.pop()
+            if medio is None:
+                camino.append(b)
+            else:
+                # Primero (a, medio) y luego (medio, b): se apilan en orden inverso.
+                pila.append((medio, b, self.medios.get((medio, b))))
+                pila.append((a, medio, self.medios.get((a, medio))))
+        return camino
+
+    # Guarda la jerarquía en un archivo (pickle).
+    def guardar(self, ruta):
+        with open(ruta, 'wb') as f:
+            pickle.dump((self.nodos, self.rango, self.arriba, self.abajo, self.medios), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+    # Carga una jerarquía guardada con guardar().
+    @classmethod
+    def cargar(cls, ruta):
+        with open(ruta, 'rb') as f:
+            return cls(*pickle.load(f))
+
+# Este bloque de código se ejecuta solo cuando el script se corre directamente.
+if __name__ == "__main__":
+    import random
+    import tempfile
+    from busqueda_comun import cargar_modulo
+
+    # a_star está en 00003_Busq_A*_AO*.py, que ejecuta sus ejemplos al cargarse: cargar_modulo lo carga en silencio.
+    a_ao = cargar_modulo('00002_Busqueda_Informada/00003_Busq_A*_AO*.py')
+
+    # Mapa de 100x100 casillas con costos enteros aleatorios de 1 a 10 por arista.
+    rng = random.Random(3)
+    lado = 100
+    grafo = {(f, c): {} for f in range(lado) for c in range(lado)}
+    for f in range(lado):
+        for c in range(lado):
+            for f2, c2 in ((f + 1, c), (f, c + 1)):
+                if f2 < lado and c2 < lado:
+                    grafo[(f, c)][(f2, c2)] = grafo[(f2, c2)][(f, c)] = rng.randint(1, 10)
+
+    estadisticas = {}
+    jerarquia = JerarquiaContraccion.preprocesar(grafo, estadisticas=estadisticas)
+    print(f"Preprocesamiento: {estadisticas['tiempo_preprocesamiento']:.1f} s, {estadisticas['atajos']} atajos")
+
+    # La jerarquía se guarda y se vuelve a cargar (sin repetir el preprocesamiento); el directorio temporal se borra
+    # al salir del bloque.
+    with tempfile.TemporaryDirectory() as directorio:
+        archivo = os.path.join(directorio, 'jerarquia.pkl')
+        jerarquia.guardar(archivo)
+        jerarquia = JerarquiaContraccion.cargar(archivo)
+
+    consultas = [(rng.choice(list(grafo)), rng.choice(list(grafo))) for _ in range(50)]
+    nodos_a = nodos_ch = 0
+    tiempo_a = tiempo_ch = 0.0
+    iguales = True
+    for inicio, objetivo in consultas:
+        est_a, est_ch = {}, {}
+        camino_a, costo_a = a_ao.a_star(grafo, inicio, objetivo, a_ao.h_simple, estadisticas=est_a)
+        camino_ch, costo_ch = jerarquia.consulta(inicio, objetivo, estadisticas=est_ch)
+        iguales &= costo_a == costo_ch and sum(grafo[a][b] for a, b in zip(camino_ch, camino_ch[1:])) == costo_a
+        nodos_a += est_a['expandidos']
+        nodos_ch += est_ch['asentados']
+        tiempo_a += est_a['tiempo_busqueda'] + est_a['tiempo_reconstruccion']
+        tiempo_ch += est_ch['tiempo_busqueda'] + est_ch['tiempo_reconstruccion']
+    print(f"a_star: {nodos_a / len(consultas):.0f} nodos por consulta, {tiempo_a / len(consultas) * 1000:.2f} ms")
+    print(f"CH:     {nodos_ch / len(consultas):.0f} nodos por consulta, {tiempo_ch / len(consultas) * 1000:.2f} ms")
+    print("Mismos costos y caminos válidos:", iguales)
+    inicio, objetivo = consultas[0]
+    print(f"Ejemplo {inicio} -> {objetivo}:", jerarquia.consulta(inicio, objetivo))
@@ -0,0 +1,317 @@
+# Importa heapq para las colas de prioridad de SMA* (mejor nodo a expandir y peor hoja a olvidar).
+import heapq  # Cola de prioridad (min-heap)
+# Importa math para math.inf (límite f inicial y valor de los nodos sin salida).
+import math  # math.inf
+# Importa time para las estadísticas.
+import time  # Reloj monotónico (perf_counter)
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import cargar_modulo, registrar  # Carga de archivos por ruta, volcado de estadísticas
+
+# --- Variantes de A* con memoria acotada ---
+# a_star guarda g_score, padres y una frontera con entradas duplicadas para cada nodo generado: en problemas como
+# el 15-puzzle se queda sin memoria mucho antes de terminar. Estas dos variantes encuentran el mismo costo óptimo
+# (con una heurística admisible) usando una memoria fija:
+# - IDA* (A* con profundización iterativa): búsquedas en profundidad sucesivas que podan los nodos con
+#   f = g + h mayor que un límite. Cada iteración sube el límite al menor f podado en la anterior. Solo guarda el
+#   camino actual (y el iterador de sucesores de cada nodo del camino), así que la memoria es proporcional a la
+#   profundidad de la solución, a cambio de repetir trabajo entre iteraciones.
+# - SMA* (A* simplificado con memoria acotada): es A* mientras caben los nodos. Cuando se alcanza 'max_nodos',
+#   olvida la hoja menos prometedora (mayor f y, a igualdad, la menos profunda) y su padre recuerda el f del hijo
+#   olvidado para regenerarlo solo si vuelve a ser el mejor. Cuando un nodo ya generó todos sus sucesores, su f pasa
+#   a ser el mínimo de los f de sus hijos (en memoria u olvidados), y ese valor se propaga hacia arriba.
+# Ambas usan la misma interfaz de heurística que a_star, heuristica(nodo, objetivo), y tienen una variante
+# '*_problema' para el protocolo de 00009_Problema_Implicito.py (en 00001_Busqueda_No_Info), que usa
+# problema.heuristica(estado).
+# Como las dos son búsquedas en árbol, solo evitan los ciclos del camino actual: un estado al que se llega por
+# caminos distintos se explora una vez por camino.
+
+# IDA* sobre unas funciones de sucesores, meta, heurística y clave (lo comparten ida_star e ida_star_problema).
+# Retorna (camino, costo) o (None, None) si no hay solución.
+# - crecimiento: None para el calendario clásico (el límite siguiente es el menor f podado). Con costos reales
+#                casi todos distintos eso da una iteración por cada valor de f; con crecimiento = 1.5, por ejemplo,
+#                el límite se multiplica al menos por 1.5 en cada iteración, y al encontrar una solución la búsqueda
+#                sigue con el límite igual a su costo hasta agotar la iteración, así que el costo sigue siendo óptimo.
+def _ida(inicial, sucesores, es_objetivo, heuristica, clave, crecimiento, estadisticas):
+    contar = estadisticas is not None  # Sin 'estadisticas' no se toman tiempos
+    t0 = time.perf_counter() if contar else None
+    iteraciones = expandidos = generados = profundidad_maxima = 0
+    limite = heuristica(inicial)
+    mejor = (None, None)
+
+    if es_objetivo(inicial):
+        registrar(estadisticas, t0, None, iteraciones=0, expandidos=0, generados=0, profundidad_maxima=0,
+                  limite_final=limite)
+        return [inicial], 0
+    while True:
+        iteraciones += 1
+        siguiente = math.inf  # Menor f podado en esta iteración
+        # El camino actual: estados, costos acumulados, claves (para evitar ciclos) y el iterador de sucesores
+        # pendientes de cada estado. Es toda la memoria de la búsqueda.
+        camino = [inicial]
+        costos = [0]
+        en_camino = {clave(inicial)}
+        pila = [iter(sucesores(inicial))]
+        expandidos += 1
+        while pila:
+            try:
+                vecino, costo = next(pila[-1])
+            except StopIteration:
+                pila.pop()
+                costos.pop()
+                en_camino.discard(clave(camino.pop()))
+                continue
+            generados += 1
+            clave_vecino = clave(vecino)
+            if clave_vecino in en_camino:
+                continue  # Ciclo en el camino actual
+            g = costos[-1] + costo
+            if mejor[1] is not None and g >= mejor[1]:
+                continue  # No mejora la solución ya encontrada en esta iteración
+            f = g + heuristica(vecino)
+            if f > limite:
+                siguiente = min(siguiente, f)
+                continue
+            if es_objetivo(vecino):
+                mejor = (camino + [vecino], g)
+                if crecimiento is None:
+                    # Con el calendario clásico el límite es una cota inferior del costo óptimo: g <= límite ya es óptimo.
+                    registrar(estadisticas, t0, None, iteraciones=iteraciones, expandidos=expandidos,
+                              generados=generados, profundidad_maxima=profundidad_maxima, limite_final=limite)
+                    return mejor
+                limite = g
+                continue
+            camino.append(vecino)
+            costos.append(g)
+            en_camino.add(clave_vecino)
+            pila.append(iter(sucesores(vecino)))
+            expandidos += 1
+            if contar and len(camino) - 1 > profundidad_maxima:
+                profundidad_maxima = len(camino) - 1
+        if mejor[0] is not None or siguiente == math.inf:
+            registrar(estadisticas, t0, None, iteraciones=iteraciones, expandidos=expandidos, generados=generados,
+                      profundidad_maxima=profundidad_maxima, limite_final=limite)
+            return mejor
+        limite = siguiente if crecimiento is None else max(siguiente, limite * crecimiento)
+
+# IDA* sobre un grafo {nodo: {vecino: costo}} (el formato de a_star), con heuristica(nodo, objetivo).
+# Retorna (camino, costo) o (None, None).
+# Opcionalmente 'estadisticas', un diccionario donde se guardan al terminar las iteraciones, los nodos expandidos y
+# generados (contando las repeticiones entre iteraciones), la profundidad máxima del camino, el último límite y el
+# tiempo de la búsqueda.
+def ida_star(grafo, inicio, objetivo, heuristica, crecimiento=None, estadisticas=None):
+    return _ida(inicio, lambda nodo: grafo[nodo].items(), lambda nodo: nodo == objetivo,
+                lambda nodo: heuristica(nodo, objetivo), lambda nodo: nodo, crecimiento, estadisticas)
+
+# IDA* sobre un problema implícito (ver 00009_Problema_Implicito.py). Retorna (camino de estados, costo) o (None, None).
+def ida_star_problema(problema, crecimiento=None, estadisticas=None):
+    return _ida(problema.estado_inicial, problema.sucesores, problema.es_objetivo, problema.heuristica,
+                problema.clave, crecimiento, estadisticas)
+
+# Nodo del árbol de SMA*.
+# - hijos: {clave: nodo} con los hijos que están en memoria.
+# - olvidados: {clave: (f, estado, g)} con los hijos borrados para liberar memoria y el f que tenían.
+# - pendientes: Iterador de los sucesores aún no generados (None cuando se agotó).
+# - version: Cambia cada vez que cambia f; las entradas de las colas con otra versión están obsoletas.
+class _NodoSMA:
+    __slots__ = ('estado', 'clave', 'padre', 'g', 'f', 'profundidad', 'hijos', 'olvidados', 'pendientes',
+                 'version', 'en_memoria')
+
+    def __init__(self, estado, clave, padre, g, f, profundidad, sucesores):
+        self.estado = estado
+        self.clave = clave
+        self.padre = padre
+        self.g = g
+        self.f = f
+        self.profundidad = profundidad
+        self.hijos = {}
+        self.olvidados = {}
+        self.pendientes = iter(sucesores)
+        self.version = 0
+        self.en_memoria = True
+
+# SMA* sobre unas funciones de sucesores, meta, heurística y clave (lo comparten sma_star y sma_star_problema).
+# Retorna (camino, costo) o (None, None) si no hay solución que quepa en 'max_nodos' nodos (un camino de n pasos
+# necesita n + 1 nodos en memoria).
+def _sma(inicial, sucesores, es_objetivo, heuristica, clave, max_nodos, estadisticas):
+    contar = estadisticas is not None  # Sin 'estadisticas' no se toman tiempos
+    t0 = time.perf_counter() if contar else None
+    expandidos = generados = regenerados = borrados = 0
+    contador = 0  # Desempate de las colas (los nodos no se comparan)
+    raiz = _NodoSMA(inicial, clave(inicial), None, 0, heuristica(inicial), 0, sucesores(inicial))
+    en_memoria = pico = 1
+    # 'abiertos': nodos con sucesores por generar o regenerar, por (f, -profundidad): el mejor y más profundo primero.
+    # 'hojas': nodos sin hijos en memoria, por (-f, profundidad): el peor y menos profundo primero.
+    abiertos = [(raiz.f, 0, 0, 0, raiz)]
+    hojas = []
+
+    def encolar(nodo):
+        nonlocal contador
+        contador += 1
+        if nodo.pendientes is not None or nodo.olvidados:
+            heapq.heappush(abiertos, (nodo.f, -nodo.profundidad, contador, nodo.version, nodo))
+        if not nodo.hijos and nodo is not raiz:
+            heapq.heappush(hojas, (-nodo.f, nodo.profundidad, contador, nodo.version, nodo))
+
+    def actualizar(nodo):
+        # Si el nodo ya generó todos sus sucesores, su f es el menor de los de sus hijos; si cambia, se propaga.
+        while nodo is not None and nodo.pendientes is None:
+            f = min([hijo.f for hijo in nodo.hijos.values()] + [valor[0] for valor in nodo.olvidados.values()],
+                    default=math.inf)
+            if f == nodo.f:
+                return
+            nodo.f = f
+            nodo.version += 1
+            encolar(nodo)
+            nodo = nodo.padre
+
+    def en_camino(nodo, clave_estado):
+        while nodo is not None:
+            if nodo.clave == clave_estado:
+                return True
+            nodo = nodo.padre
+        return False
+
+    while True:
+        # Mejor nodo abierto (sin sacarlo: sigue abierto mientras le queden sucesores).
+        while abiertos:
+            f, _, _, version, nodo = abiertos[0]
+            if nodo.en_memoria and version == nodo.version and (nodo.pendientes is not None or nodo.olvidados):
+                break
+            heapq.heappop(abiertos)
+        else:
+            nodo = None
+        if nodo is None or nodo.f == math.inf:
+            # Lo que queda no cabe en memoria o no tiene salida.
+            registrar(estadisticas, t0, None, expandidos=expandidos, generados=generados, regenerados=regenerados,
+                      olvidados=borrados, pico_memoria=pico)
+            return None, None
+        if es_objetivo(nodo.estado):
+            t_objetivo = time.perf_counter() if contar else None
+            camino, costo = [], nodo.g
+            while nodo is not None:
+                camino.append(nodo.estado)
+                nodo = nodo.padre
+            registrar(estadisticas, t0, t_objetivo, expandidos=expandidos, generados=generados,
+                      regenerados=regenerados, olvidados=borrados, pico_memoria=pico)
+            return camino[::-1], costo
+        expandidos += 1
+
+        # Siguiente sucesor: primero los nunca generados; después, el olvidado con menor f.
+        hijo = None
+        while nodo.pendientes is not None:
+            try:
+                estado, costo = next(nodo.pendientes)
+            except StopIteration:
+                nodo.pendientes = None
+                break
+            clave_estado = clave(estado)
+            if not en_camino(nodo, clave_estado) and clave_estado not in nodo.hijos:
+                generados += 1
+                g = nodo.g + costo
+                hijo = _NodoSMA(estado, clave_estado, nodo, g, max(nodo.f, g + heuristica(estado)),
+                                nodo.profundidad + 1, sucesores(estado))
+                break
+        if hijo is None and nodo.olvidados:
+            clave_estado = min(nodo.olvidados, key=lambda k: nodo.olvidados[k][0])
+            f, estado, g = nodo.olvidados.pop(clave_estado)
+            regenerados += 1
+            hijo = _NodoSMA(estado, clave_estado, nodo, g, max(f, g + heuristica(estado)), nodo.profundidad + 1,
+                            sucesores(estado))
+        if hijo is None:
+            actualizar(nodo)  # Solo quedaban ciclos: el nodo ya no tiene nada que generar
+            continue
+        # Un nodo que no es meta y llena la memoria con su camino no puede llevar a una solución.
+        if hijo.profundidad >= max_nodos - 1 and not es_objetivo(hijo.estado):
+            hijo.f = math.inf
+
+        if en_memoria >= max_nodos:
+            # Memoria llena: se olvida la peor hoja (sin contar el nodo que se expande ni la raíz).
+            apartado = None
+            while hojas:
+                _, _, _, version, hoja = heapq.heappop(hojas)
+                if hoja.en_memoria and version == hoja.version and not hoja.hijos:
+                    if hoja is nodo:
+                        apartado = hoja
+                        continue
+                    break
+            else:
+                hoja = None
+            if apartado is not None:
+                encolar(apartado)
+            if hoja is None:
+                # Solo cabe el camino hasta 'nodo': el hijo tiene f infinito y no hace falta recordarlo.
+                actualizar(nodo)
+                encolar(nodo)
+                continue
+            padre = hoja.padre
+            del padre.hijos[hoja.clave]
+            if hoja.f < math.inf:
+                padre.olvidados[hoja.clave] = (hoja.f, hoja.estado, hoja.g)
+            hoja.en_memoria = False
+            en_memoria -= 1
+            borrados += 1
+            encolar(padre)
+
+        nodo.hijos[hijo.clave] = hijo
+        en_memoria += 1
+        pico = max(pico, en_memoria)
+        encolar(hijo)
+        actualizar(nodo)
+        nodo.version += 1
+        encolar(nodo)
+
+# SMA* sobre un grafo {nodo: {vecino: costo}} (el formato de a_star), con heuristica(nodo, objetivo).
+# Retorna (camino, costo) o (None, None).
+# - max_nodos: Número máximo de nodos en memoria a la vez.
+# Opcionalmente 'estadisticas', un diccionario donde se guardan al terminar los nodos expandidos, generados y
+# regenerados, los nodos olvidados, el pico de nodos en memoria y el tiempo de la búsqueda.
+def sma_star(grafo, inicio, objetivo, heuristica, max_nodos=1000, estadisticas=None):
+    return _sma(inicio, lambda nodo: grafo[nodo].items(), lambda nodo: nodo == objetivo,
+                lambda nodo: heuristica(nodo, objetivo), lambda nodo: nodo, max_nodos, estadisticas)
+
+# SMA* sobre un problema implícito (ver 00009_Problema_Implicito.py). Retorna (camino de estados, costo) o (None, None).
+def sma_star_problema(problema, max_nodos=1000, estadisticas=None):
+    return _sma(problema.estado_inicial, problema.sucesores, problema.es_objetivo, problema.heuristica,
+                problema.clave, max_nodos, estadisticas)
+
+# Este bloque de código se ejecuta solo cuando el script se corre directamente.
+if __name__ == "__main__":
+    import random
+
+    implicito = cargar_modulo('00001_Busqueda_No_Info/00009_Problema_Implicito.py')
+
+    # El grafo de ejemplo de a_star, con la heurística nula.
+    grafo = {
+        'A': {'B': 1, 'C': 3},
+        'B': {'D': 2, 'E': 4},
+        'C': {'F': 2},
+        'D': {},
+        'E': {'F': 1},
+        'F': {}
+    }
+    h_nula = lambda nodo, objetivo: 0
+    print("IDA*:", ida_star(grafo, 'A', 'F', h_nula))
+    print("SMA*:", sma_star(grafo, 'A', 'F', h_nula, max_nodos=4))
+
+    # 15-puzzle desordenado con 60 movimientos al azar desde la meta.
+    rng = random.Random(7)
+    puzzle = implicito.PuzzleDeslizante(list(range(1, 16)) + [0], n=4)
+    estado = puzzle.meta
+    for _ in range(60):
+        estado = rng.choice([vecino for vecino, _ in puzzle.sucesores(estado)])
+    puzzle.estado_inicial = estado
+
+    estadisticas = {}
+    camino, costo = ida_star_problema(puzzle, estadisticas=estadisticas)
+    print(f"IDA* (15-puzzle): {costo} movimientos, {estadisticas['iteraciones']} iteraciones,"
+          f" {estadisticas['expandidos']} expansiones, memoria: un camino de {estadisticas['profundidad_maxima']} estados")
+
+    estadisticas = {}
+    camino, costo = sma_star_problema(puzzle, max_nodos=5000, estadisticas=estadisticas)
+    print(f"SMA* (15-puzzle): {costo} movimientos, {estadisticas['expandidos']} expansiones,"
+          f" {estadisticas['olvidados']} nodos olvidados, pico de {estadisticas['pico_memoria']} nodos en memoria")
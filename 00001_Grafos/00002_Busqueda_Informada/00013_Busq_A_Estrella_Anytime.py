@@ -0,0 +1,204 @@
+# Importa heapq para la lista abierta (cola de prioridad por f = g + w * h).
+import heapq  # Cola de prioridad (min-heap)
+# Importa math para math.inf (costo de los nodos aún no alcanzados).
+import math  # math.inf
+# Importa time para los presupuestos de tiempo y las estadísticas.
+import time  # Reloj monotónico (perf_counter)
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import cargar_modulo  # Carga los archivos numerados por ruta
+
+# --- A* anytime con reparación (ARA*) ---
+# a_star solo tiene el modo óptimo: no entrega nada hasta terminar. ARA* entrega primero una solución rápida
+# y la va mejorando:
+# - Usa A* ponderado: la prioridad es f = g + w * h con w >= 1. Con una heurística admisible, el costo encontrado
+#   es como mucho w veces el óptimo (w-subóptimo), y con w grande se expanden muchos menos nodos.
+# - Después baja w paso a paso. En lugar de empezar de cero, cada nueva búsqueda reutiliza los valores g y los padres
+#   de la anterior. Solo reabre los nodos "inconsistentes": los que mejoraron su g después de expandirse (en la
+#   misma búsqueda no se expanden dos veces; se apartan en 'inconsistentes' para la siguiente).
+# - Tras cada búsqueda se publica el mejor camino y su cota de suboptimalidad:
+#       cota = min(w, costo / min{g(n) + h(n) : n abierto o inconsistente})
+#   El denominador es una cota inferior del costo óptimo, así que costo <= cota * óptimo. Con cota 1 el camino es
+#   óptimo y la búsqueda termina.
+# El trabajo se reparte en pasos con presupuesto de nodos y de tiempo (como MotorBusqueda en
+# 00001_Busqueda_No_Info/00012_Busqueda_Por_Pasos.py): entre dos pasos se pueden leer camino, costo y cota.
+
+# Búsqueda ARA* sobre un grafo {nodo: {vecino: costo}} (el formato de a_star), con heuristica(nodo, objetivo).
+# - w_inicial: Peso de la primera búsqueda.
+# - decremento: Cuánto baja w después de cada búsqueda (nunca por debajo de 1).
+# Atributos que se pueden leer en cualquier momento:
+# - camino, costo: El mejor camino publicado y su costo (None mientras no haya ninguno).
+# - cota: Cota de suboptimalidad del camino publicado (costo <= cota * óptimo); None sin camino.
+# - w: Peso de la búsqueda en curso.
+# - terminado: True cuando el camino es óptimo o no hay camino.
+# - soluciones: Historial de (w, costo, cota, segundos) de cada camino publicado.
+# - expandidos, segundos: Nodos expandidos y tiempo dedicado en total.
+class BusquedaARA:
+    def __init__(self, grafo, inicio, objetivo, heuristica, w_inicial=3.0, decremento=0.5):
+        self.grafo = grafo
+        self.inicio = inicio
+        self.objetivo = objetivo
+        self.heuristica = heuristica
+        self.decremento = decremento
+        self.w = max(1.0, w_inicial)
+        self.camino = self.costo = self.cota = None
+        self.terminado = False
+        self.soluciones = []
+        self.expandidos = 0
+        self.segundos = 0.0
+        self.h = {}  # Heurística ya calculada de cada nodo
+        self.g = {inicio: 0}
+        self.padres = {inicio: None}
+        self.abiertos = {inicio}
+        self.cerrados = set()
+        self.inconsistentes = set()
+        self.contador = 0  # Desempate de la cola
+        self._reconstruir_cola()
+
+    def _h(self, nodo):
+        valor = self.h.get(nodo)
+        if valor is None:
+            valor = self.h[nodo] = self.heuristica(nodo, self.objetivo)
+        return valor
+
+    # Rehace la cola con las prioridades del w actual. Las entradas guardan el g con el que se insertaron: si el g
+    # del nodo cambió o el nodo ya no está abierto, la entrada está obsoleta y se descarta al llegar a la cima.
+    def _reconstruir_cola(self):
+        self.cola = []
+        for nodo in self.abiertos:
+            self.contador += 1
+            self.cola.append((self.g[nodo] + self.w * self._h(nodo), self.contador, self.g[nodo], nodo))
+        heapq.heapify(self.cola)
+
+    # Menor prioridad válida de la cola (sin sacarla), o math.inf si no quedan abiertos.
+    def _minimo(self):
+        cola = self.cola
+        while cola:
+            prioridad, _, g, nodo = cola[0]
+            if nodo in self.abiertos and g == self.g[nodo]:
+                return prioridad
+            heapq.heappop(cola)
+        return math.inf
+
+    # Avanza la búsqueda en curso hasta 'max_nodos' expansiones o hasta agotar 'max_segundos' (None = sin límite).
+    # Cada vez que una búsqueda termina se publica su camino, se baja w y empieza la siguiente en el mismo paso,
+    # si queda presupuesto. Retorna True cuando todo terminó (camino óptimo o sin camino).
+    def paso(self, max_nodos=None, max_segundos=None):
+        if self.terminado:
+            return True
+        inicio = time.perf_counter()
+        limite = None if max_segundos is None else inicio + max_segundos
+        nodos = 0
+        grafo, g, padres, objetivo, w = self.grafo, self.g, self.padres, self.objetivo, self.w
+        while not self.terminado:
+            if (max_nodos is not None and nodos >= max_nodos) or (limite is not None and time.perf_counter() >= limite):
+                break
+            # La búsqueda en curso termina cuando ningún abierto puede mejorar el camino al objetivo.
+            if self._minimo() >= g.get(objetivo, math.inf):
+                self._publicar(time.perf_counter() - inicio)
+                w = self.w
+                continue
+            _, _, g_actual, actual = heapq.heappop(self.cola)
+            self.abiertos.discard(actual)
+            self.cerrados.add(actual)
+            nodos += 1
+            for vecino, costo in grafo[actual].items():
+                g_tentativo = g_actual + costo
+                if g_tentativo < g.get(vecino, math.inf):
+                    g[vecino] = g_tentativo
+                    padres[vecino] = actual
+                    if vecino in self.cerrados:
+                        self.inconsistentes.add(vecino)  # Se reabre en la siguiente búsqueda
+                    else:
+                        self.abiertos.add(vecino)
+                        self.contador += 1
+                        heapq.heappush(self.cola, (g_tentativo + w * self._h(vecino), self.contador, g_tentativo, vecino))
+        self.expandidos += nodos
+        self.segundos += time.perf_counter() - inicio
+        return self.terminado
+
+    # Publica el resultado de la búsqueda que acaba de terminar y prepara la siguiente con un w menor.
+    def _publicar(self, segundos_paso):
+        costo = self.g.get(self.objetivo, math.inf)
+        if costo == math.inf:
+            self.terminado = True  # Se agotaron los abiertos sin llegar al objetivo
+            return
+        camino = []
+        nodo = self.objetivo
+        while nodo is not None:
+            camino.append(nodo)
+            nodo = self.padres[nodo]
+        inferior = min((self.g[n] + self._h(n) for n in self.abiertos | self.inconsistentes), default=math.inf)
+        cota = 1.0 if inferior == math.inf else min(self.w, costo / inferior) if inferior > 0 else self.w
+        self.camino, self.costo, self.cota = camino[::-1], costo, max(1.0, cota)
+        self.soluciones.append((self.w, costo, self.cota, self.segundos + segundos_paso))
+        if self.cota <= 1.0 or self.w <= 1.0:
+            self.terminado = True
+            self.cota = 1.0 if self.w <= 1.0 else self.cota
+            return
+        # Siguiente búsqueda: w menor, abiertos = abiertos + inconsistentes, cerrados vacío. Los g y los padres se
+        # conservan, así que solo se reexpande lo que la nueva prioridad reordena.
+        self.w = max(1.0, self.w - self.decremento)
+        self.abiertos |= self.inconsistentes
+        self.inconsistentes = set()
+        self.cerrados = set()
+        self._reconstruir_cola()
+
+    # Ejecuta hasta terminar o hasta agotar 'max_segundos' y retorna (camino, costo) del mejor camino publicado.
+    def ejecutar(self, max_segundos=None):
+        self.paso(max_segundos=max_segundos)
+        return self.camino, self.costo
+
+# Atajo funcional: ARA* con un presupuesto de tiempo total. Retorna (camino, costo) como a_star (None, None si no
+# encontró camino a tiempo).
+# Opcionalmente 'estadisticas', un diccionario donde se guardan al terminar los nodos expandidos, el número de
+# caminos publicados, el último w, la cota de suboptimalidad y el tiempo de la búsqueda.
+def ara_star(grafo, inicio, objetivo, heuristica, w_inicial=3.0, decremento=0.5, max_segundos=None,
+             estadisticas=None):
+    busqueda = BusquedaARA(grafo, inicio, objetivo, heuristica, w_inicial, decremento)
+    camino, costo = busqueda.ejecutar(max_segundos)
+    if estadisticas is not None:
+        estadisticas['expandidos'] = busqueda.expandidos
+        estadisticas['soluciones'] = len(busqueda.soluciones)
+        estadisticas['w'] = busqueda.w
+        estadisticas['cota'] = busqueda.cota
+        estadisticas['tiempo_busqueda'] = busqueda.segundos
+    return camino, costo
+
+# Este bloque de código se ejecuta solo cuando el script se corre directamente.
+if __name__ == "__main__":
+    import random
+
+    # a_star está en 00003_Busq_A*_AO*.py; el nombre empieza con números, así que se carga por ruta.
+    a_ao = cargar_modulo('00002_Busqueda_Informada/00003_Busq_A*_AO*.py')
+
+    # Mapa de 300x300 casillas con un 20% de obstáculos y costos de 1 a 3 por casilla.
+    rng = random.Random(5)
+    lado = 300
+    libre = {(f, c) for f in range(lado) for c in range(lado) if rng.random() > 0.2} | {(0, 0), (lado - 1, lado - 1)}
+    grafo = {(f, c): {(f + df, c + dc): rng.randint(1, 3) for df, dc in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                      if (f + df, c + dc) in libre}
+             for f, c in libre}
+    manhattan = lambda nodo, objetivo: abs(nodo[0] - objetivo[0]) + abs(nodo[1] - objetivo[1])
+    inicio, objetivo = (0, 0), (lado - 1, lado - 1)
+
+    # Pasos de 5 ms: tras cada uno se lee el mejor camino disponible y su cota.
+    busqueda = BusquedaARA(grafo, inicio, objetivo, manhattan, w_inicial=3.0, decremento=0.5)
+    publicados = 0
+    while not busqueda.paso(max_segundos=0.005):
+        if len(busqueda.soluciones) > publicados:
+            publicados = len(busqueda.soluciones)
+            print(f"{busqueda.segundos * 1000:6.1f} ms: costo {busqueda.costo}, cota {busqueda.cota:.2f}, w = {busqueda.w}")
+    if busqueda.camino is None:
+        print("No hay camino")
+    else:
+        print(f"{busqueda.segundos * 1000:6.1f} ms: costo {busqueda.costo}, cota {busqueda.cota:.2f} (terminado)")
+    print("Historial (w, costo, cota, segundos):", [(w, c, round(e, 3), round(s, 3)) for w, c, e, s in busqueda.soluciones])
+
+    estadisticas = {}
+    camino, costo = a_ao.a_star(grafo, inicio, objetivo, manhattan, estadisticas=estadisticas)
+    print(f"a_star: costo {costo} en {estadisticas['tiempo_busqueda'] * 1000:.1f} ms")
@@ -0,0 +1,246 @@
+# Importa heapq para la cola de prioridad de los nodos inconsistentes.
+import heapq  # Cola de prioridad (min-heap)
+# Importa math para math.inf (costo de los nodos sin camino y de las aristas cortadas).
+import math  # math.inf
+# Importa time para las estadísticas.
+import time  # Reloj monotónico (perf_counter)
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import cargar_modulo  # Carga los archivos numerados por ruta
+
+# --- D* Lite: replanificación incremental ---
+# Cuando el grafo cambia (un corte, un atasco), volver a llamar a a_star desde cero repite casi todo el trabajo.
+# D* Lite (Koenig y Likhachev, basado en LPA*) conserva el árbol de búsqueda entre planificaciones y solo repara
+# la parte afectada por los cambios.
+# - Busca hacia atrás, del objetivo al inicio. Cada nodo tiene g (distancia al objetivo ya calculada) y
+#   rhs = min(c(n, s) + g(s)) sobre sus sucesores s (una mirada de un paso; rhs(objetivo) = 0).
+# - Un nodo es consistente si g == rhs. Solo los inconsistentes están en la cola. La prioridad es
+#   [min(g, rhs) + h(inicio, n) + km, min(g, rhs)].
+# - Cuando cambia el costo de una arista u -> v, solo cambia rhs(u). Si u queda inconsistente vuelve a la cola,
+#   y la búsqueda propaga el cambio hasta que el inicio es consistente y nada en la cola puede mejorarlo.
+# - Como la búsqueda va hacia atrás, el inicio se puede mover (un agente que avanza por el camino) sin invalidar
+#   nada: km acumula cuánto bajaron las heurísticas para que las prioridades antiguas sigan siendo válidas.
+# La heurística tiene la firma de siempre, heuristica(nodo, otro), y aquí estima el costo entre el inicio y 'nodo'
+# (se llama heuristica(nodo, inicio)). Debe ser consistente y simétrica, como Manhattan o la euclidiana.
+
+# Planificador D* Lite sobre un grafo {nodo: {vecino: costo}} (el formato de a_star).
+# Trabaja sobre una copia de las aristas: los cambios se comunican con actualizar(), no modificando el grafo original.
+# Atributos:
+# - inicio, objetivo: Extremos actuales.
+# - expandidos: Nodos expandidos en total (en todas las planificaciones).
+class DStarLite:
+    def __init__(self, grafo, inicio, objetivo, heuristica):
+        self.inicio = inicio
+        self.objetivo = objetivo
+        self.heuristica = heuristica
+        # Copia de las aristas en los dos sentidos: D* Lite recorre los predecesores al propagar los cambios.
+        self.sucesores = {}
+        self.predecesores = {}
+        for nodo, vecinos in grafo.items():
+            self.sucesores.setdefault(nodo, {})
+            for vecino, costo in vecinos.items():
+                self.sucesores[nodo][vecino] = costo
+                self.predecesores.setdefault(vecino, {})[nodo] = costo
+        self.g = {}
+        self.rhs = {objetivo: 0}
+        self.km = 0
+        self.cola = []
+        self.en_cola = {}  # nodo -> prioridad vigente (las entradas de la cola con otra prioridad están obsoletas)
+        self.contador = 0  # Desempate de la cola
+        self.expandidos = 0
+        self._encolar(objetivo, self._prioridad(objetivo))
+
+    def _prioridad(self, nodo):
+        minimo = min(self.g.get(nodo, math.inf), self.rhs.get(nodo, math.inf))
+        return (minimo + self.heuristica(nodo, self.inicio) + self.km, minimo)
+
+    def _encolar(self, nodo, prioridad):
+        self.en_cola[nodo] = prioridad
+        self.contador += 1
+        heapq.heappush(self.cola, (prioridad, self.contador, nodo))
+
+    # Menor entrada vigente de la cola (sin sacarla): (prioridad, nodo), o ((inf, inf), None) si está vacía.
+    def _cima(self):
+        cola = self.cola
+        while cola:
+            prioridad, _, nodo = cola[0]
+            if self.en_cola.get(nodo) == prioridad:
+                return prioridad, nodo
+            heapq.heappop(cola)
+        return (math.inf, math.inf), None
+
+    # Mínimo de c(nodo, s) + g(s) sobre los sucesores s.
+    def _mejor_sucesor(self, nodo):
+        g = self.g
+        return min((costo + g.get(s, math.inf) for s, costo in self.sucesores.get(nodo, {}).items()), default=math.inf)
+
+    # Vuelve a encolar, actualizar o quitar un nodo según sea consistente o no.
+    def _actualizar_nodo(self, nodo):
+        if self.g.get(nodo, math.inf) != self.rhs.get(nodo, math.inf):
+            prioridad = self._prioridad(nodo)
+            if self.en_cola.get(nodo) != prioridad:
+                self._encolar(nodo, prioridad)
+        elif nodo in self.en_cola:
+            del self.en_cola[nodo]
+
+    # Repara el árbol hasta que el inicio es consistente y ningún nodo de la cola puede cambiar su distancia.
+    def _calcular(self):
+        g, rhs, inicio, objetivo = self.g, self.rhs, self.inicio, self.objetivo
+        expandidos = 0
+        h_inicio = self.heuristica(inicio, inicio) + self.km  # El inicio no cambia durante la reparación
+        while True:
+            prioridad_vieja, u = self._cima()
+            g_inicio, rhs_inicio = g.get(inicio, math.inf), rhs.get(inicio, math.inf)
+            minimo = min(g_inicio, rhs_inicio)
+            if u is None or (prioridad_vieja >= (minimo + h_inicio, minimo) and rhs_inicio == g_inicio):
+                break
+            expandidos += 1
+            prioridad_nueva = self._prioridad(u)
+            g_u, rhs_u = g.get(u, math.inf), rhs.get(u, math.inf)
+            if prioridad_vieja < prioridad_nueva:
+                self._encolar(u, prioridad_nueva)  # La prioridad quedó vieja tras mover el inicio
+            elif g_u > rhs_u:
+                # Sobreconsistente: la distancia bajó; se fija y se propaga a los predecesores.
+                g[u] = rhs_u
+                del self.en_cola[u]
+                for s, costo in self.predecesores.get(u, {}).items():
+                    if s != objetivo and costo + rhs_u < rhs.get(s, math.inf):
+                        rhs[s] = costo + rhs_u
+                        self._actualizar_nodo(s)
+            else:
+                # Subconsistente: la distancia subió; se invalida y se recalculan u y los predecesores que dependían de u.
+                g[u] = math.inf
+                for s, costo in list(self.predecesores.get(u, {}).items()) + [(u, None)]:
+                    if s != objetivo and (s == u or rhs.get(s, math.inf) == costo + g_u):
+                        rhs[s] = self._mejor_sucesor(s)
+                    self._actualizar_nodo(s)
+        self.expandidos += expandidos
+        return expandidos
+
+    # Planifica (o replanifica tras actualizar() o mover()) y retorna (camino, costo) del inicio al objetivo, o
+    # (None, None) si no hay camino. La primera llamada es una búsqueda completa; las siguientes solo reparan.
+    # Opcionalmente 'estadisticas', un diccionario donde se guardan al terminar los nodos expandidos en esta
+    # planificación y el tiempo de la búsqueda y de la reconstrucción del camino.
+    def planificar(self, estadisticas=None):
+        t0 = time.perf_counter()
+        expandidos = self._calcular()
+        t_objetivo = time.perf_counter()
+        resultado = self.camino()
+        if estadisticas is not None:
+            estadisticas['expandidos'] = expandidos
+            estadisticas['tiempo_busqueda'] = t_objetivo - t0
+            estadisticas['tiempo_reconstruccion'] = time.perf_counter() - t_objetivo
+        return resultado
+
+    # Camino actual siguiendo en cada nodo el sucesor que minimiza c + g (válido tras planificar()).
+    def camino(self):
+        costo = self.g.get(self.inicio, math.inf)
+        if self.inicio == self.objetivo:
+            return [self.inicio], 0
+        if costo == math.inf:
+            return None, None
+        camino = [self.inicio]
+        actual = self.inicio
+        visitados = {actual}
+        while actual != self.objetivo:
+            actual = min(self.sucesores[actual].items(), key=lambda par: par[1] + self.g.get(par[0], math.inf))[0]
+            if actual in visitados:
+                return None, None  # No debería pasar con un árbol consistente
+            visitados.add(actual)
+            camino.append(actual)
+        return camino, costo
+
+    # Aplica un lote de cambios de costo [(u, v, costo_nuevo), ...]. Un costo None o math.inf corta la arista; una
+    # arista que no existía se crea. Solo marca los nodos afectados: la reparación ocurre en planificar().
+    def actualizar(self, cambios):
+        g, rhs = self.g, self.rhs
+        for u, v, costo in cambios:
+            costo = math.inf if costo is None else costo
+            anterior = self.sucesores.get(u, {}).get(v, math.inf)
+            if costo == anterior:
+                continue
+            if costo == math.inf:
+                self.sucesores[u].pop(v, None)
+                self.predecesores[v].pop(u, None)
+            else:
+                self.sucesores.setdefault(u, {})[v] = costo
+                self.predecesores.setdefault(v, {})[u] = costo
+            if u == self.objetivo:
+                continue
+            g_v = g.get(v, math.inf)
+            if costo < anterior:
+                if costo + g_v < rhs.get(u, math.inf):
+                    rhs[u] = costo + g_v
+            elif rhs.get(u, math.inf) == anterior + g_v:
+                rhs[u] = self._mejor_sucesor(u)
+            self._actualizar_nodo(u)
+
+    # Mueve el inicio (por ejemplo, el agente avanzó por el camino). Las prioridades encoladas siguen siendo válidas
+    # gracias a km.
+    def mover(self, nuevo_inicio):
+        self.km += self.heuristica(self.inicio, nuevo_inicio)
+        self.inicio = nuevo_inicio
+
+# Este bloque de código se ejecuta solo cuando el script se corre directamente.
+if __name__ == "__main__":
+    import random
+
+    # a_star está en 00003_Busq_A*_AO*.py; el nombre empieza con números, así que se carga por ruta.
+    a_ao = cargar_modulo('00002_Busqueda_Informada/00003_Busq_A*_AO*.py')
+
+    # Mapa de 150x150 casillas con costos de 1 a 5 por arista (en los dos sentidos).
+    rng = random.Random(11)
+    lado = 150
+    grafo = {(f, c): {} for f in range(lado) for c in range(lado)}
+    for f in range(lado):
+        for c in range(lado):
+            for f2, c2 in ((f + 1, c), (f, c + 1)):
+                if f2 < lado and c2 < lado:
+                    grafo[(f, c)][(f2, c2)] = grafo[(f2, c2)][(f, c)] = rng.randint(1, 5)
+    manhattan = lambda nodo, otro: abs(nodo[0] - otro[0]) + abs(nodo[1] - otro[1])
+    inicio, objetivo = (0, 0), (lado - 1, lado - 1)
+
+    planificador = DStarLite(grafo, inicio, objetivo, manhattan)
+    estadisticas = {}
+    camino, costo = planificador.planificar(estadisticas)
+    print(f"Primera planificación: costo {costo}, {estadisticas['expandidos']} expansiones,"
+          f" {estadisticas['tiempo_busqueda'] * 1000:.1f} ms")
+
+    # Cada ronda: el agente avanza 3 pasos por el camino y "ve" cambios en las próximas 20 aristas: se cortan o se
+    # encarecen dos de ellas (en los dos sentidos). Se replanifica y se compara con a_star desde cero sobre el grafo
+    # modificado. D* Lite busca hacia atrás desde el objetivo, así que los cambios cerca del agente solo afectan a
+    # una rama pequeña del árbol; los cambios cerca del objetivo obligan a reparar mucho más.
+    tiempo_d = tiempo_a = 0.0
+    expansiones_d = expansiones_a = 0
+    iguales = True
+    for ronda in range(20):
+        if len(camino) > 4:
+            planificador.mover(camino[3])
+            camino = camino[3:]
+        cambios = []
+        for i in rng.sample(range(min(20, len(camino) - 1)), 2):
+            u, v = camino[i], camino[i + 1]
+            costo_nuevo = None if rng.random() < 0.5 else grafo[u][v] + rng.randint(5, 20)  # Corte o atasco
+            for a, b in ((u, v), (v, u)):
+                if costo_nuevo is None:
+                    grafo[a].pop(b, None)
+                else:
+                    grafo[a][b] = costo_nuevo
+                cambios.append((a, b, costo_nuevo))
+        planificador.actualizar(cambios)
+        estadisticas = {}
+        camino, costo = planificador.planificar(estadisticas)
+        tiempo_d += estadisticas['tiempo_busqueda']
+        expansiones_d += estadisticas['expandidos']
+        estadisticas = {}
+        _, costo_a = a_ao.a_star(grafo, planificador.inicio, objetivo, manhattan, estadisticas=estadisticas)
+        tiempo_a += estadisticas['tiempo_busqueda']
+        expansiones_a += estadisticas['expandidos']
+        iguales &= costo == costo_a
+    print(f"D* Lite: {expansiones_d / 20:.0f} expansiones por replanificación, {tiempo_d / 20 * 1000:.2f} ms")
+    print(f"a_star:  {expansiones_a / 20:.0f} expansiones por búsqueda nueva, {tiempo_a / 20 * 1000:.2f} ms")
+    print("Mismos costos:", iguales)
@@ -0,0 +1,321 @@
+# Importa heapq para la frontera de A* y de JPS.
+import heapq  # Cola de prioridad (min-heap)
+# Importa math para la raíz de 2 (costo de un paso en diagonal).
+import math  # math.sqrt
+# Importa time para las estadísticas.
+import time  # Reloj monotónico (perf_counter)
+# Importa numpy para guardar el mapa como un arreglo plano de celdas uint8.
+import numpy as np  # Mapa de ocupación
+# Importa os y sys para encontrar busqueda_comun.py (utilidades compartidas) en la carpeta 00001_Grafos.
+import os  # Rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import cargar_modulo, registrar  # Carga de archivos numerados, volcado de estadísticas
+
+# --- Mapas de cuadrícula y Jump Point Search (JPS) ---
+# Expandir un mapa de ocupación a {nodo: {vecino: costo}} para busqueda_a_estrella crea un diccionario por celda y
+# una tupla por coordenada. MapaCuadricula guarda el mapa tal cual, como un arreglo uint8, y numera las celdas con
+# un índice plano: los 8 vecinos de una celda están a desplazamientos fijos (±1, ±ancho, ±ancho±1). El mapa se
+# rodea de un borde de celdas bloqueadas para que esos desplazamientos nunca se salgan del arreglo.
+# Movimientos: 8 direcciones, costo 1 en recto y raíz de 2 en diagonal. Una diagonal solo se permite si las dos
+# celdas rectas que rodea están libres (no se cortan esquinas). La heurística es la distancia octil, el costo exacto
+# sin obstáculos. Manhattan sobreestima con diagonales y dejaría de ser admisible.
+# En una cuadrícula abierta hay muchísimos caminos mínimos simétricos (el mismo número de pasos rectos y diagonales
+# en distinto orden), y A* los prueba casi todos. JPS (Harabor y Grastien) poda esa simetría:
+# - Desde cada nodo solo sigue las direcciones "naturales" (las que continúan el movimiento desde su padre) y las
+#   "forzadas" por un obstáculo adyacente.
+# - En lugar de insertar cada vecino en la cola, salta en línea recta (o en diagonal, probando en cada paso los dos
+#   saltos rectos que abre) hasta encontrar el objetivo, un obstáculo o un punto de salto: una celda con un vecino
+#   forzado, donde el camino mínimo puede necesitar girar.
+# Solo los puntos de salto entran en la cola, y el camino entre dos de ellos es un segmento recto o diagonal.
+# Con costos 1 y raíz de 2, dos caminos de igual costo tienen el mismo número de pasos rectos y diagonales (raíz de
+# 2 es irracional), así que el costo se calcula a partir de esos dos números y JPS y A* lo dan idéntico.
+
+RAIZ2 = math.sqrt(2)
+
+# Distancia octil entre dos celdas (fila, columna): el costo del camino más corto sin obstáculos.
+def heuristica_octil(nodo, objetivo):
+    df, dc = abs(nodo[0] - objetivo[0]), abs(nodo[1] - objetivo[1])
+    return max(df, dc) + (RAIZ2 - 1) * min(df, dc)
+
+# Mapa de ocupación de 'filas' x 'columnas' celdas.
+# - celdas: Arreglo 2D (o lista de listas) con 0 en las celdas libres y cualquier otro valor en las bloqueadas.
+# Atributos:
+# - ancho: Columnas del arreglo con borde (columnas + 2). La celda (f, c) tiene índice (f + 1) * ancho + c + 1.
+# - libre: bytes con 1 en las celdas libres, por índice plano (acceder a bytes es mucho más rápido que a numpy
+#          celda a celda).
+# - desplazamientos: Lista de (desplazamiento, costo, recto1, recto2) de los 8 movimientos; en las diagonales,
+#                    recto1 y recto2 son los desplazamientos de las dos celdas rectas que deben estar libres.
+class MapaCuadricula:
+    def __init__(self, celdas):
+        celdas = np.asarray(celdas, dtype=np.uint8)
+        self.filas, self.columnas = celdas.shape
+        self.ancho = self.columnas + 2
+        self.celdas = np.ones((self.filas + 2, self.ancho), dtype=np.uint8)
+        self.celdas[1:-1, 1:-1] = celdas != 0
+        self.libre = (self.celdas.ravel() == 0).astype(np.uint8).tobytes()
+        ancho = self.ancho
+        self.desplazamientos = [(d, 1.0, 0, 0) for d in (-ancho, ancho, -1, 1)]
+        self.desplazamientos += [(df * ancho + dc, RAIZ2, df * ancho, dc) for df in (-1, 1) for dc in (-1, 1)]
+
+    # Crea un mapa a partir de líneas de texto: '#' es un obstáculo y cualquier otro carácter es libre.
+    @classmethod
+    def desde_texto(cls, lineas):
+        return cls([[1 if caracter == '#' else 0 for caracter in linea] for linea in lineas])
+
+    def indice(self, celda):
+        return (int(celda[0]) + 1) * self.ancho + int(celda[1]) + 1
+
+    def celda(self, indice):
+        fila, columna = divmod(indice, self.ancho)
+        return fila - 1, columna - 1
+
+    def es_libre(self, celda):
+        return 0 <= celda[0] < self.filas and 0 <= celda[1] < self.columnas and self.libre[self.indice(celda)] == 1
+
+    # Vecinos libres de una celda por índice: pares (índice_vecino, costo).
+    def vecinos(self, indice):
+        libre = self.libre
+        for desplazamiento, costo, recto1, recto2 in self.desplazamientos:
+            if libre[indice + desplazamiento] and (not recto1 or (libre[indice + recto1] and libre[indice + recto2])):
+                yield indice + desplazamiento, costo
+
+    # El mapa como grafo {(f, c): {(f2, c2): costo}}, para usarlo con a_star o busqueda_a_estrella.
+    def como_grafo(self):
+        grafo = {}
+        for f in range(self.filas):
+            for c in range(self.columnas):
+                i = self.indice((f, c))
+                if self.libre[i]:
+                    grafo[(f, c)] = {self.celda(j): costo for j, costo in self.vecinos(i)}
+        return grafo
+
+    # Costo exacto de un camino de celdas contiguas: rectos + raíz de 2 * diagonales.
+    @staticmethod
+    def costo_camino(camino):
+        diagonales = sum(1 for a, b in zip(camino, camino[1:]) if a[0] != b[0] and a[1] != b[1])
+        return len(camino) - 1 - diagonales + RAIZ2 * diagonales
+
+# A* sobre un MapaCuadricula con la heurística octil, usando índices planos en lugar de tuplas.
+# Retorna (camino de celdas (fila, columna), costo) o (None, None).
+# Opcionalmente 'estadisticas', un diccionario donde se guardan al terminar los nodos expandidos, las inserciones
+# en la frontera, el pico de la frontera y el tiempo de la búsqueda y de la reconstrucción (ver registrar en
+# busqueda_comun.py). Solo se cuentan y se toman tiempos si se pide: las inserciones salen al final de las
+# extracciones (expansiones, entradas obsoletas y el objetivo) más lo que quede en la frontera.
+def a_star_cuadricula(mapa, inicio, objetivo, estadisticas=None):
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    expandidos = obsoletas = insertados = pico = 0
+    resultado = (None, None)
+    t_objetivo = None
+    if mapa.es_libre(inicio) and mapa.es_libre(objetivo):
+        ancho = mapa.ancho
+        s, t = mapa.indice(inicio), mapa.indice(objetivo)
+        tf, tc = divmod(t, ancho)
+
+        def h(i):
+            f, c = divmod(i, ancho)
+            df, dc = abs(f - tf), abs(c - tc)
+            return max(df, dc) + (RAIZ2 - 1) * min(df, dc)
+
+        g = {s: 0.0}
+        padres = {s: None}
+        frontera = [(h(s), 0.0, s)]
+        while frontera:
+            if contar and len(frontera) > pico:
+                pico = len(frontera)
+            _, g_actual, actual = heapq.heappop(frontera)
+            if g_actual > g[actual]:
+                obsoletas += 1
+                continue  # Entrada obsoleta
+            if actual == t:
+                t_objetivo = time.perf_counter() if contar else None
+                camino = []
+                while actual is not None:
+                    camino.append(mapa.celda(actual))
+                    actual = padres[actual]
+                camino.reverse()
+                resultado = (camino, MapaCuadricula.costo_camino(camino))
+                break
+            expandidos += 1
+            for vecino, costo in mapa.vecinos(actual):
+                g_tentativo = g_actual + costo
+                if g_tentativo < g.get(vecino, math.inf):
+                    g[vecino] = g_tentativo
+                    padres[vecino] = actual
+                    heapq.heappush(frontera, (g_tentativo + h(vecino), g_tentativo, vecino))
+        insertados = expandidos + obsoletas + (resultado[0] is not None) + len(frontera)
+    registrar(estadisticas, t0, t_objetivo, expandidos=expandidos, insertados=insertados, pico_frontera=pico)
+    return resultado
+
+# Salto recto desde el índice 'i' (incluido) con paso 'paso'; 'lateral' es el paso perpendicular.
+# Retorna el primer punto de salto (el objetivo o una celda con un vecino forzado) o -1 si choca con un obstáculo.
+# Sin cortar esquinas, un vecino es forzado cuando la celda de al lado está libre pero la de al lado de la celda
+# anterior estaba bloqueada: justo al pasar un obstáculo se abre un giro que no se podía hacer antes.
+def _saltar_recto(libre, i, paso, lateral, objetivo):
+    while libre[i]:
+        if i == objetivo:
+            return i
+        if (libre[i - lateral] and not libre[i - paso - lateral]) or (libre[i + lateral] and not libre[i - paso + lateral]):
+            return i
+        i += paso
+    return -1
+
+# Salto en diagonal desde 'i' (incluido) con pasos vertical 'paso_f' (±ancho) y horizontal 'paso_c' (±1).
+# En cada celda prueba los dos saltos rectos que parten de ella; si alguno encuentra un punto de salto, la celda
+# también lo es. La diagonal sigue solo mientras las dos celdas rectas que rodea estén libres.
+def _saltar_diagonal(libre, i, paso_f, paso_c, objetivo):
+    while libre[i]:
+        if i == objetivo:
+            return i
+        if (_saltar_recto(libre, i + paso_c, paso_c, paso_f, objetivo) >= 0 or
+                _saltar_recto(libre, i + paso_f, paso_f, paso_c, objetivo) >= 0):
+            return i
+        if not (libre[i + paso_c] and libre[i + paso_f]):
+            return -1
+        i += paso_f + paso_c
+    return -1
+
+# Jump Point Search sobre un MapaCuadricula. Retorna (camino de celdas (fila, columna), costo) o (None, None), con el
+# mismo costo que a_star_cuadricula (el camino puede ser otro de los caminos mínimos simétricos).
+# Opcionalmente 'estadisticas', un diccionario donde se guardan al terminar los puntos de salto expandidos, las
+# inserciones en la frontera, el pico de la frontera y el tiempo de la búsqueda y de la reconstrucción, contados
+# como en a_star_cuadricula.
+def jps(mapa, inicio, objetivo, estadisticas=None):
+    contar = estadisticas is not None
+    t0 = time.perf_counter() if contar else None
+    expandidos = obsoletas = insertados = pico = 0
+    resultado = (None, None)
+    t_objetivo = None
+    if mapa.es_libre(inicio) and mapa.es_libre(objetivo):
+        libre, ancho = mapa.libre, mapa.ancho
+        s, t = mapa.indice(inicio), mapa.indice(objetivo)
+        tf, tc = divmod(t, ancho)
+
+        def h(i):
+            f, c = divmod(i, ancho)
+            df, dc = abs(f - tf), abs(c - tc)
+            return max(df, dc) + (RAIZ2 - 1) * min(df, dc)
+
+        g = {s: 0.0}
+        padres = {s: None}
+        frontera = [(h(s), 0.0, s)]
+        while frontera:
+            if contar and len(frontera) > pico:
+                pico = len(frontera)
+            _, g_actual, actual = heapq.heappop(frontera)
+            if g_actual > g[actual]:
+                obsoletas += 1
+                continue  # Entrada obsoleta
+            if actual == t:
+                t_objetivo = time.perf_counter() if contar else None
+                resultado = _desplegar(mapa, padres, t)
+                break
+            expandidos += 1
+            padre = padres[actual]
+            af, ac = divmod(actual, ancho)
+            if padre is None:
+                direcciones = [(df, dc) for df in (-1, 0, 1) for dc in (-1, 0, 1) if df or dc]
+            else:
+                pf, pc = divmod(padre, ancho)
+                df, dc = (af > pf) - (af < pf), (ac > pc) - (ac < pc)
+                # Direcciones naturales y forzadas (la comprobación de celda libre se hace al saltar).
+                if df and dc:
+                    direcciones = [(df, 0), (0, dc), (df, dc)]
+                elif dc:
+                    direcciones = [(0, dc), (1, dc), (-1, dc), (1, 0), (-1, 0)]
+                else:
+                    direcciones = [(df, 0), (df, 1), (df, -1), (0, 1), (0, -1)]
+            for df, dc in direcciones:
+                paso_f = df * ancho
+                if df and dc:
+                    if not (libre[actual + paso_f] and libre[actual + dc]):
+                        continue  # No se cortan esquinas
+                    salto = _saltar_diagonal(libre, actual + paso_f + dc, paso_f, dc, t)
+                elif dc:
+                    salto = _saltar_recto(libre, actual + dc, dc, ancho, t)
+                else:
+                    salto = _saltar_recto(libre, actual + paso_f, paso_f, 1, t)
+                if salto < 0:
+                    continue
+                sf, sc = divmod(salto, ancho)
+                pasos = max(abs(sf - af), abs(sc - ac))
+                g_tentativo = g_actual + (pasos * RAIZ2 if df and dc else pasos)
+                if g_tentativo < g.get(salto, math.inf):
+                    g[salto] = g_tentativo
+                    padres[salto] = actual
+                    heapq.heappush(frontera, (g_tentativo + h(salto), g_tentativo, salto))
+        insertados = expandidos + obsoletas + (resultado[0] is not None) + len(frontera)
+    registrar(estadisticas, t0, t_objetivo, expandidos=expandidos, insertados=insertados, pico_frontera=pico)
+    return resultado
+
+# Reconstruye el camino completo de JPS: sigue los padres entre puntos de salto y rellena cada segmento (recto o
+# diagonal) celda a celda.
+def _desplegar(mapa, padres, objetivo):
+    ancho = mapa.ancho
+    puntos = []
+    actual = objetivo
+    while actual is not None:
+        puntos.append(actual)
+        actual = padres[actual]
+    puntos.reverse()
+    camino = [mapa.celda(puntos[0])]
+    for a, b in zip(puntos, puntos[1:]):
+        af, ac = divmod(a, ancho)
+        bf, bc = divmod(b, ancho)
+        df, dc = (bf > af) - (bf < af), (bc > ac) - (bc < ac)
+        for _ in range(max(abs(bf - af), abs(bc - ac))):
+            af, ac = af + df, ac + dc
+            camino.append((af - 1, ac - 1))
+    return camino, MapaCuadricula.costo_camino(camino)
+
+# Este bloque de código se ejecuta solo cuando el script se corre directamente.
+if __name__ == "__main__":
+    import random
+
+    # Los archivos de búsqueda empiezan con números y no se pueden importar con 'import'; se cargan por ruta.
+    heuristicas = cargar_modulo('00002_Busqueda_Informada/00001_Heuristicas.py')
+
+    mapa = MapaCuadricula.desde_texto([
+        '..........',
+        '....#.....',
+        '....#.....',
+        '....####..',
+        '..........',
+    ])
+    print("JPS:", jps(mapa, (2, 0), (2, 9)))
+
+    # Mapa de 400x400 con 300 rectángulos bloqueados al azar (edificios).
+    rng = random.Random(2)
+    lado = 400
+    celdas = np.zeros((lado, lado), dtype=np.uint8)
+    for _ in range(300):
+        f, c = rng.randrange(lado), rng.randrange(lado)
+        celdas[f:f + rng.randint(2, 25), c:c + rng.randint(2, 25)] = 1
+    mapa = MapaCuadricula(celdas)
+    libres = [(int(f), int(c)) for f, c in np.argwhere(celdas == 0)]
+    consultas = [(rng.choice(libres), rng.choice(libres)) for _ in range(10)]
+
+    totales = {'a_star_cuadricula': [0, 0, 0.0], 'jps': [0, 0, 0.0]}
+    iguales = True
+    for inicio, objetivo in consultas:
+        est_a, est_j = {}, {}
+        _, costo_a = a_star_cuadricula(mapa, inicio, objetivo, estadisticas=est_a)
+        _, costo_j = jps(mapa, inicio, objetivo, estadisticas=est_j)
+        iguales &= costo_a == costo_j
+        for nombre, est in (('a_star_cuadricula', est_a), ('jps', est_j)):
+            totales[nombre][0] += est['expandidos']
+            totales[nombre][1] += est['insertados']
+            totales[nombre][2] += est['tiempo_busqueda'] + est['tiempo_reconstruccion']
+    for nombre, (expandidos, insertados, segundos) in totales.items():
+        print(f"{nombre}: {expandidos // len(consultas)} expansiones, {insertados // len(consultas)} inserciones en la"
+              f" cola, {segundos / len(consultas) * 1000:.1f} ms por consulta")
+    print("Mismos costos:", iguales)
+
+    # El mismo mapa como grafo de diccionarios, con busqueda_a_estrella y la heurística octil.
+    grafo = mapa.como_grafo()
+    inicio, objetivo = consultas[0]
+    camino, costo = heuristicas.busqueda_a_estrella(grafo, inicio, objetivo, heuristica_octil)
+    print(f"busqueda_a_estrella sobre el grafo: costo {costo:.4f}, JPS: {jps(mapa, inicio, objetivo)[1]:.4f}")
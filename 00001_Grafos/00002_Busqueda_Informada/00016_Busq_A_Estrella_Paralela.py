@@ -0,0 +1,325 @@
+# Importa heapq para la frontera local de cada proceso.
+import heapq  # Cola de prioridad (min-heap)
+# Importa math para math.inf (costo de la mejor solución mientras no haya ninguna).
+import math  # math.inf
+# Importa multiprocessing para los procesos trabajadores, sus colas y la memoria compartida.
+import multiprocessing  # Procesos, colas y valores compartidos
+# Importa os para el número de núcleos disponibles y sys para encontrar busqueda_comun.py (utilidades
+# compartidas) en la carpeta 00001_Grafos.
+import os  # os.cpu_count, rutas de archivos
+import sys  # Ruta de búsqueda de módulos
+# Importa queue para la excepción Empty de las colas.
+import queue  # queue.Empty
+# Importa time para las estadísticas y las esperas del detector de terminación.
+import time  # Reloj monotónico (perf_counter)
+# Importa zlib para un hash estable entre procesos (el hash() de las cadenas cambia de un proceso a otro).
+import zlib  # crc32
+_GRAFOS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _GRAFOS not in sys.path:
+    sys.path.append(_GRAFOS)
+from busqueda_comun import cargar_modulo  # Carga archivos numerados
+
+# --- A* paralelo distribuido por hash (HDA*) ---
+# a_star usa un solo núcleo. HDA* (Kishimoto, Fukunaga y Botea) reparte el espacio de estados entre P procesos:
+# - Cada estado tiene un dueño, hash(clave) % P. Solo el dueño guarda su g, su padre y su entrada en la frontera,
+#   así que la detección de duplicados sigue siendo local y no hace falta una tabla compartida.
+# - Cada proceso expande nodos de su frontera local. Los sucesores propios se insertan directamente; los ajenos se
+#   acumulan en un lote por destino y se envían a la cola del dueño cuando el lote se llena o el dueño está ocioso.
+# - Cuando un proceso saca una meta de su frontera, actualiza la mejor solución (el "incumbente"), un valor
+#   compartido que todos leen para podar los nodos con f >= incumbente.
+# - Optimalidad y terminación: con una heurística admisible, el incumbente es óptimo cuando ningún proceso tiene
+#   nodos con f < incumbente y no hay nodos en tránsito. Para saber que no hay nada en tránsito, cada proceso cuenta
+#   los nodos que envía y recibe. El proceso principal mira dos veces seguidas todos los estados y contadores
+#   (método de los cuatro contadores de Mattern). La búsqueda terminó si en las dos miradas todos estaban ociosos y
+#   los enviados y recibidos coinciden y no cambiaron.
+# - El camino se reconstruye al final preguntando a cada dueño por el padre de cada estado, desde la meta.
+# Funciona sobre el protocolo de 00009_Problema_Implicito.py (en 00001_Busqueda_No_Info), como a_star_problema, y
+# sobre el formato de a_star con hda_star. Los procesos se crean con 'fork' cuando el sistema lo permite. Con
+# 'spawn' el problema y la heurística se envían con pickle y deben ser importables.
+# El beneficio depende de que expandir un nodo cueste bastante más que enviarlo: los lotes grandes amortizan el
+# envío, pero retrasan el reparto de trabajo al principio de la búsqueda.
+
+# Dueño de una clave. Las claves enteras (como las del 15-puzzle) se mezclan con un hash multiplicativo; el resto se
+# resume con crc32 de su repr, que es igual en todos los procesos.
+def _dueno(clave, procesos):
+    if isinstance(clave, int):
+        return (((clave * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 32) % procesos
+    return zlib.crc32(repr(clave).encode()) % procesos
+
+# Bucle de un proceso trabajador.
+# - yo: Número del proceso; entradas[yo] es su cola.
+# - mejor, bloqueo: Costo del incumbente (compartido) y el candado para actualizarlo.
+# - ocioso, enviados, recibidos: Arreglos compartidos para la detección de terminación (enviados tiene una posición
+#   más, la del proceso principal, que envía el nodo inicial).
+# Mensajes que recibe: ('nodos', lote), ('resultado',), ('padre', clave), ('salir',).
+# Mensajes que envía a 'salida': ('resultado', yo, costo, clave_meta, estadisticas), ('padre', estado, clave_padre).
+def _trabajador(yo, problema, procesos, entradas, salida, mejor, bloqueo, ocioso, enviados, recibidos, lote,
+                expansiones_por_ronda):
+    tabla = {}  # clave -> [g, clave_padre, estado]
+    frontera = []  # (f, contador, g, clave)
+    contador = 0
+    buzones = [[] for _ in range(procesos)]
+    entrada = entradas[yo]
+    meta = (math.inf, None)
+    expandidos = generados = podados = nodos_enviados = nodos_recibidos = 0
+    sucesores, es_objetivo, heuristica, clave_de = problema.sucesores, problema.es_objetivo, problema.heuristica, problema.clave
+
+    def insertar(f, g, clave, estado, clave_padre):
+        nonlocal contador
+        registro = tabla.get(clave)
+        if registro is None or g < registro[0]:
+            tabla[clave] = [g, clave_padre, estado]
+            contador += 1
+            heapq.heappush(frontera, (f, contador, g, clave))
+
+    def enviar(destino):
+        nonlocal nodos_enviados
+        nodos = buzones[destino]
+        buzones[destino] = []
+        enviados[yo] += len(nodos)  # Antes de encolarlos: nunca hay más recibidos que enviados
+        nodos_enviados += len(nodos)
+        entradas[destino].put(('nodos', nodos))
+
+    def atender(mensaje):
+        nonlocal nodos_recibidos
+        tipo = mensaje[0]
+        if tipo == 'nodos':
+            ocioso[yo] = 0  # Antes de contarlos como recibidos
+            recibidos[yo] += len(mensaje[1])
+            nodos_recibidos += len(mensaje[1])
+            for nodo in mensaje[1]:
+                insertar(*nodo)
+        elif tipo == 'resultado':
+            salida.put(('resultado', yo, meta[0], meta[1], {
+                'expandidos': expandidos, 'generados': generados, 'podados': podados,
+                'enviados': nodos_enviados, 'recibidos': nodos_recibidos, 'estados': len(tabla)}))
+        elif tipo == 'padre':
+            _, clave_padre, estado = tabla[mensaje[1]]
+            salida.put(('padre', estado, clave_padre))
+        return tipo != 'salir'
+
+    while True:
+        # Mensajes pendientes (sin esperar).
+        try:
+            while True:
+                if not atender(entrada.get_nowait()):
+                    return
+        except queue.Empty:
+            pass
+        # Una ronda de expansiones locales. El incumbente se lee una vez por ronda: si otro proceso lo baja mientras
+        # tanto, solo se poda un poco menos.
+        incumbente = mejor.value
+        for _ in range(expansiones_por_ronda):
+            if not frontera:
+                break
+            f, _, g, clave = frontera[0]
+            if f >= incumbente:
+                break  # Nada de esta frontera puede mejorar el incumbente
+            heapq.heappop(frontera)
+            registro = tabla[clave]
+            if g > registro[0]:
+                continue  # Entrada obsoleta
+            estado = registro[2]
+            if es_objetivo(estado):
+                if g < meta[0]:
+                    meta = (g, clave)
+                with bloqueo:
+                    if g < mejor.value:
+                        mejor.value = g
+                    incumbente = mejor.value
+                continue
+            expandidos += 1
+            for vecino, costo in sucesores(estado):
+                generados += 1
+                g_vecino = g + costo
+                f_vecino = g_vecino + heuristica(vecino)
+                if f_vecino >= incumbente:
+                    podados += 1
+                    continue
+                clave_vecino = clave_de(vecino)
+                destino = _dueno(clave_vecino, procesos) if procesos > 1 else yo
+                if destino == yo:
+                    insertar(f_vecino, g_vecino, clave_vecino, vecino, clave)
+                else:
+                    buzones[destino].append((f_vecino, g_vecino, clave_vecino, vecino, clave))
+                    if len(buzones[destino]) >= lote:
+                        enviar(destino)
+        # Queda trabajo si la frontera aún tiene nodos que pueden mejorar el incumbente.
+        trabajo = bool(frontera) and frontera[0][0] < mejor.value
+        # Los lotes de los procesos ociosos se envían ya, aunque no estén llenos.
+        for destino in range(procesos):
+            if buzones[destino] and (ocioso[destino] or not trabajo):
+                enviar(destino)
+        if trabajo:
+            continue
+        # Sin trabajo local: se declara ocioso y espera mensajes.
+        ocioso[yo] = 1
+        try:
+            if not atender(entrada.get(timeout=0.05)):
+                return
+        except queue.Empty:
+            pass
+
+# Lanza RuntimeError si algún trabajador terminó antes de recibir ('salir',), por ejemplo por una excepción en
+# sucesores o en la heurística (su traza ya se mostró en la salida de error del proceso hijo). Sin esta comprobación
+# su indicador de ocioso queda en 0 y el proceso principal esperaría para siempre.
+def _comprobar_trabajadores(trabajadores):
+    for yo, trabajador in enumerate(trabajadores):
+        if not trabajador.is_alive():
+            raise RuntimeError(f"El proceso trabajador {yo} terminó inesperadamente (código {trabajador.exitcode})")
+
+# Siguiente mensaje de 'salida', comprobando cada poco que los trabajadores siguen vivos.
+def _recibir(salida, trabajadores):
+    while True:
+        try:
+            return salida.get(timeout=0.1)
+        except queue.Empty:
+            _comprobar_trabajadores(trabajadores)
+
+# HDA* sobre un problema implícito. Retorna (camino de estados, costo) o (None, None).
+# - procesos: Número de procesos trabajadores (por defecto, los núcleos disponibles).
+# - lote: Nodos por mensaje entre procesos.
+# - expansiones_por_ronda: Expansiones entre dos revisiones de la cola de entrada.
+# Opcionalmente 'estadisticas', un diccionario donde se guardan al terminar los nodos expandidos, generados y
+# podados (en total y por proceso), los nodos enviados entre procesos y el tiempo de la búsqueda y de la
+# reconstrucción del camino.
+def hda_star_problema(problema, procesos=None, lote=256, expansiones_por_ronda=200, estadisticas=None):
+    t0 = time.perf_counter()
+    procesos = procesos or os.cpu_count() or 1
+    contexto = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else None)
+    entradas = [contexto.Queue() for _ in range(procesos)]
+    salida = contexto.Queue()
+    mejor = contexto.RawValue('d', math.inf)
+    bloqueo = contexto.Lock()
+    ocioso = contexto.RawArray('b', procesos)
+    enviados = contexto.RawArray('q', procesos + 1)
+    recibidos = contexto.RawArray('q', procesos)
+    trabajadores = [contexto.Process(target=_trabajador, daemon=True,
+                                     args=(yo, problema, procesos, entradas, salida, mejor, bloqueo, ocioso, enviados,
+                                           recibidos, lote, expansiones_por_ronda))
+                    for yo in range(procesos)]
+    for trabajador in trabajadores:
+        trabajador.start()
+    try:
+        inicial = problema.estado_inicial
+        clave_inicial = problema.clave(inicial)
+        enviados[procesos] = 1
+        entradas[_dueno(clave_inicial, procesos)].put(
+            ('nodos', [(problema.heuristica(inicial), 0, clave_inicial, inicial, None)]))
+
+        # Detección de terminación: dos miradas seguidas con todos ociosos y los mismos contadores.
+        def mirar():
+            todos_ociosos = all(ocioso[i] for i in range(procesos))
+            return todos_ociosos, sum(recibidos[i] for i in range(procesos)), sum(enviados[i] for i in range(procesos + 1))
+
+        anterior = None
+        while True:
+            time.sleep(0.001)
+            _comprobar_trabajadores(trabajadores)
+            actual = mirar()
+            if actual[0] and actual[1] == actual[2] and actual == anterior:
+                break
+            anterior = actual
+        t_objetivo = time.perf_counter()
+
+        # Mejor meta de cada proceso y sus estadísticas.
+        for entrada in entradas:
+            entrada.put(('resultado',))
+        costo, clave_meta, por_proceso = math.inf, None, [None] * procesos
+        for _ in range(procesos):
+            _, yo, costo_local, clave_local, est = _recibir(salida, trabajadores)
+            por_proceso[yo] = est
+            if costo_local < costo:
+                costo, clave_meta = costo_local, clave_local
+
+        # Reconstrucción del camino preguntando a cada dueño por el padre de cada estado.
+        resultado = (None, None)
+        if clave_meta is not None:
+            camino = []
+            clave = clave_meta
+            while clave is not None:
+                entradas[_dueno(clave, procesos)].put(('padre', clave))
+                _, estado, clave = _recibir(salida, trabajadores)
+                camino.append(estado)
+            resultado = (camino[::-1], costo)
+    finally:
+        for entrada in entradas:
+            entrada.put(('salir',))
+        for trabajador in trabajadores:
+            trabajador.join(timeout=5)
+            if trabajador.is_alive():
+                trabajador.terminate()
+    if estadisticas is not None:
+        for contador in ('expandidos', 'generados', 'podados', 'enviados'):
+            estadisticas[contador] = sum(est[contador] for est in por_proceso)
+        estadisticas['expandidos_por_proceso'] = [est['expandidos'] for est in por_proceso]
+        estadisticas['procesos'] = procesos
+        estadisticas['tiempo_busqueda'] = t_objetivo - t0
+        estadisticas['tiempo_reconstruccion'] = time.perf_counter() - t_objetivo
+    return resultado
+
+# HDA* sobre un grafo {nodo: {vecino: costo}} (el formato de a_star), con heuristica(nodo, objetivo).
+# Retorna (camino, costo) o (None, None). Los demás parámetros son los de hda_star_problema.
+# El grafo se presenta como problema con ProblemaGrafo de 00009_Problema_Implicito.py, que no usa funciones anónimas
+# y puede enviarse a otros procesos.
+def hda_star(grafo, inicio, objetivo, heuristica, procesos=None, lote=256, expansiones_por_ronda=200,
+             estadisticas=None):
+    implicito = cargar_modulo('00001_Busqueda_No_Info/00009_Problema_Implicito.py')
+    return hda_star_problema(implicito.ProblemaGrafo(grafo, inicio, objetivo, heuristica), procesos, lote,
+                             expansiones_por_ronda, estadisticas)
+
+# Benchmark de aceleración: resuelve cada instancia con a_star_problema y con HDA* para cada número de procesos.
+# - instancias: Lista de pares (nombre, problema).
+# Retorna una lista de diccionarios (uno por instancia) con el costo, el tiempo de a_star, y por cada número de
+# procesos p: 'hda_p' (segundos), 'aceleracion_p' (tiempo de a_star / tiempo de HDA*) y 'expandidos_p'.
+# Lanza AssertionError si algún costo difiere del de a_star.
+def benchmark(instancias, lista_procesos=(1, 2, 4), lote=256):
+    a_ao = cargar_modulo('00002_Busqueda_Informada/00003_Busq_A*_AO*.py')
+    filas = []
+    for nombre, problema in instancias:
+        t0 = time.perf_counter()
+        _, costo = a_ao.a_star_problema(problema)
+        fila = {'instancia': nombre, 'costo': costo, 'a_star': time.perf_counter() - t0}
+        for procesos in lista_procesos:
+            estadisticas = {}
+            t0 = time.perf_counter()
+            _, costo_hda = hda_star_problema(problema, procesos, lote, estadisticas=estadisticas)
+            segundos = time.perf_counter() - t0
+            assert costo_hda == costo, (nombre, procesos, costo_hda, costo)
+            fila[f'hda_{procesos}'] = segundos
+            fila[f'aceleracion_{procesos}'] = fila['a_star'] / segundos
+            fila[f'expandidos_{procesos}'] = estadisticas['expandidos']
+        filas.append(fila)
+    return filas
+
+# Este bloque de código se ejecuta solo cuando el script se corre directamente.
+if __name__ == "__main__":
+    import random
+
+    implicito = cargar_modulo('00001_Busqueda_No_Info/00009_Problema_Implicito.py')
+
+    # El grafo de ejemplo de a_star, con la heurística nula.
+    def h_nula(nodo, objetivo):
+        return 0
+
+    grafo = {'A': {'B': 1, 'C': 3}, 'B': {'D': 2, 'E': 4}, 'C': {'F': 2}, 'D': {}, 'E': {'F': 1}, 'F': {}}
+    print("HDA*:", hda_star(grafo, 'A', 'F', h_nula, procesos=2))
+
+    # Instancias del 15-puzzle desordenadas con paseos al azar desde la meta.
+    # (Con las semillas 0 y 3, a_star tarda del orden de 0.1 s y 2 s.)
+    instancias = []
+    for semilla in (0, 3):
+        rng = random.Random(semilla)
+        puzzle = implicito.PuzzleDeslizante(list(range(1, 16)) + [0], n=4)
+        estado = puzzle.meta
+        for _ in range(100):
+            estado = rng.choice([vecino for vecino, _ in puzzle.sucesores(estado)])
+        puzzle.estado_inicial = estado
+        instancias.append((f"15-puzzle #{semilla}", puzzle))
+
+    print(f"Núcleos disponibles: {os.cpu_count()}")
+    lista_procesos = (1, 2, 4)
+    for fila in benchmark(instancias, lista_procesos):
+        detalles = ", ".join(f"{p} proc. {fila[f'hda_{p}']:.2f} s (x{fila[f'aceleracion_{p}']:.2f})"
+                             for p in lista_procesos)
+        print(f"{fila['instancia']}: costo {fila['costo']}, a_star {fila['a_star']:.2f} s; HDA*: {detalles}")
@@ -0,0 +1,83 @@
+# Importa contextlib e io para silenciar la salida de los archivos que ejecutan ejemplos al cargarse.
+import contextlib  # redirect_stdout
+import io  # StringIO
+# Importa importlib.util para cargar archivos por su ruta.
+import importlib.util  # spec_from_file_location
+# Importa os para construir las rutas relativas a esta carpeta.
+import os  # Rutas de archivos
+# Importa time para el tiempo de cada fase en las estadísticas.
+import time  # Reloj monotónico (perf_counter)
+
+# --- Utilidades compartidas por los archivos de 00001_Grafos ---
+# Los archivos de las lecciones empiezan con números y no se pueden importar con 'import'; este sí. Para usarlo,
+# un archivo añade la carpeta 00001_Grafos a sys.path (si no está ya) y hace 'from busqueda_comun import ...'.
+
+# Carpeta 00001_Grafos (la de este archivo).
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+# Módulos ya cargados por cargar_modulo, por ruta absoluta.
+_modulos = {}
+
+# Carga un archivo numerado por su ruta relativa a la carpeta 00001_Grafos (por ejemplo
+# '00001_Busqueda_No_Info/00009_Problema_Implicito.py') y retorna el módulo. La salida estándar se silencia durante
+# la carga, porque algunos archivos (como 00003_Busq_A*_AO*.py) ejecutan sus ejemplos al cargarse. Cada archivo se
+# carga una sola vez: las llamadas siguientes retornan el mismo módulo.
+def cargar_modulo(ruta):
+    ruta = os.path.normpath(os.path.join(RAIZ, ruta))
+    if ruta not in _modulos:
+        especificacion = importlib.util.spec_from_file_location(os.path.basename(ruta)[:-3].replace('*', '_'), ruta)
+        modulo = importlib.util.module_from_spec(especificacion)
+        with contextlib.redirect_stdout(io.StringIO()):
+            especificacion.loader.exec_module(modulo)
+        _modulos[ruta] = modulo
+    return _modulos[ruta]
+
+# Pares (vecino, costo) de una lista de adyacencia ponderada, en cualquiera de los dos formatos del repositorio:
+# diccionario {vecino: costo} (a_star) o lista de tuplas [(vecino, costo)] (busqueda_costo_uniforme).
+def aristas(vecinos):
+    return vecinos.items() if isinstance(vecinos, dict) else vecinos
+
+# Corre hasta el final el generador de una búsqueda por pasos ('*_pasos') y retorna su resultado (el valor de
+# StopIteration). Las funciones normales (busqueda_anchura, a_star, ...) son agotar(<búsqueda>_pasos(...,
+# informar=False)): así cada búsqueda tiene una sola implementación (ver 00012_Busqueda_Por_Pasos.py).
+def agotar(generador):
+    try:
+        while True:
+            next(generador)
+    except StopIteration as fin:
+        return fin.value
+
+# Vecinos que quedaron sin probar en la rama de una búsqueda en profundidad perezosa (un iterador por nodo, como
+# busqueda_profundidad_pila) cuando encuentra el objetivo: de cada nodo de 'rama' menos el último, los que van
+# detrás del hijo por el que se bajó. Esas búsquedas suman todos los vecinos de un nodo al crear su iterador y
+# restan estos al final, así que sus 'generados' son los vecinos probados sin contar uno por uno.
+def sin_probar(grafo, rama):
+    return sum(len(grafo[nodo]) - 1 - grafo[nodo].index(hijo) for nodo, hijo in zip(rama, rama[1:]))
+
+# Vuelca los contadores de una búsqueda en 'estadisticas' (si se pidió) junto con el tiempo de cada fase:
+# 'tiempo_busqueda' hasta encontrar el objetivo (o agotar la frontera) y 'tiempo_reconstruccion' del camino.
+# Las búsquedas solo cuentan y toman tiempos cuando reciben 'estadisticas' (sin él, 't0' es None y no se llama al
+# reloj) y lo llaman una vez, al terminar. El diccionario contiene solo números: se exporta con json.dumps.
+# Reciben 'estadisticas' las búsquedas sobre diccionarios y sus variantes '*_pila', '*_pasos' y '*_problema' con
+# cola o montículo. Quedan fuera a propósito:
+# - Las versiones CSR (00008_Grafo_CSR.py) y las de estados compactos (00010_Estados_Compactos.py): existen para
+#   medir el costo de la representación; los contadores de la búsqueda los da su versión con diccionarios o
+#   '*_problema'.
+# - Las que avanzan por niveles o lotes enteros (bfs_por_niveles y busqueda_anchura_por_niveles,
+#   busqueda_anchura_lotes, distancias_lotes_bits): no expanden nodo a nodo. La búsqueda externa (00011) lleva
+#   sus propias estadísticas por nivel.
+# - Las versiones en profundidad sobre problemas (busqueda_profundidad_problema, dls_problema,
+#   busqueda_profundidad_iterativa_problema): consumen los sucesores de forma perezosa y contarlos costaría una
+#   operación por sucesor.
+# - Las recursivas de ejemplo (busqueda_profundidad_recursiva, dls_recursiva, iddfs_completo), la caché de árboles
+#   (busqueda_costo_uniforme_cache), iddfs_con_tabla (tiene su 'registro' por iteración) y la IDDFS paralela (los
+#   contadores quedarían en los procesos trabajadores).
+def registrar(estadisticas, t0, t_objetivo, **contadores):
+    if estadisticas is None:
+        return
+    fin = time.perf_counter()
+    if t_objetivo is None:
+        t_objetivo = fin
+    estadisticas.update(contadores)
+    estadisticas['tiempo_busqueda'] = t_objetivo - t0
+    estadisticas['tiempo_reconstruccion'] = fin - t_objetivo